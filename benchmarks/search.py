@@ -0,0 +1,225 @@
+"""Search benchmarks over a synthetic tree.
+
+Builds a synthetic tree (see tree.py) and times, in this process, the phases of a search:
+    walk: listing the tree (findhelp.walker.walk_tree, skipping the ignored folders), no matching
+    match: walking and matching every name ('iter_search', results consumed but not exported), for several
+        search options (ignorecase, ignoreaccents, regexp, glob...)
+    output: a whole 'go_search' for each output (console to /dev/null, files to a temporary folder). Its
+        'export' time is the part over 'match'
+Results (milliseconds) go to a JSON file, along with the tree, findhelp and Python versions. Comparing with the
+JSON of another version ('--compare') prints the ratio of every case (fastest runs) and exits with status 1 if
+any case is slower than the tolerance.
+
+Usage:
+    python benchmarks/search.py [--depth 3] [--fanout 6] [--files 20] [--runs 5] [--json search.json]
+                                [--compare baseline.json] [--tolerance 1.25]
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import datetime
+import platform
+import tempfile
+import statistics
+import subprocess
+import contextlib
+
+from tree import make_tree
+from tree import IGNORED_FOLDERS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# benchmarks the findhelp of this checkout
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import findhelp.walker as walker  # noqa: E402
+from findhelp.finder import OUTPUTS  # noqa: E402
+from findhelp.finder import go_search  # noqa: E402
+from findhelp.finder import iter_search  # noqa: E402
+
+OPTIONS = {
+    "plain": {"stringsearch": "one"},
+    "ignorecase": {"stringsearch": "one", "ignorecase": True},
+    "ignoreaccents": {"stringsearch": "one", "ignoreaccents": True},
+    "ignorecase_ignoreaccents": {"stringsearch": "one", "ignorecase": True, "ignoreaccents": True},
+    "regexp": {"stringsearch": r"^(report|data)_.*\.(csv|json)$", "regexp": True},
+    "several": {"stringsearch": ["one", "report", "résumé", "日本語"]},
+    "ext": {"stringsearch": "", "ext": [".md", ".pdf"], "onlyfiles": True},
+    "glob": {"stringsearch": "**/report_*.pdf", "glob": True},
+    "all": {"stringsearch": "one", "all": True},
+}
+# every output searches this
+OUTPUT_SEARCH = "plain"
+OUTPUT_REQUIRES = {"df": "pandas", "parquet": "pyarrow", "arrow": "pyarrow"}
+
+
+def time_call(function, runs: int) -> dict:
+    """Runs a function several times
+
+    Args:
+        function (Callable[[], int]): Function to time, returning the number of results
+        runs (int): Number of timed runs (after a warm-up one)
+
+    Returns:
+        dict: {"min", "median"} wall times, in milliseconds, and "results"
+    """
+    results = function()
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+
+    return {"min": round(min(times), 2), "median": round(statistics.median(times), 2), "results": results}
+
+
+def run_cases(tree: str, runs: int, output_path: str) -> dict:
+    """Times every case over a tree
+
+    Args:
+        tree (str): Root folder of the tree
+        runs (int): Number of timed runs of each case
+        output_path (str): Folder for the output files
+
+    Returns:
+        dict: Timings of each case, see 'time_call'
+    """
+    cases = {}
+
+    def walk():
+        return sum(len(dir_names) + len(file_names)
+                   for _, dir_names, file_names, _ in walker.walk_tree(tree, set(IGNORED_FOLDERS)))
+
+    cases["walk"] = time_call(walk, runs)
+
+    for name, options in OPTIONS.items():
+        search = dict(options, path=tree, output="list")
+        cases[f"match:{name}"] = time_call(lambda: sum(1 for _ in iter_search(dict(search))), runs)
+
+    match = cases[f"match:{OUTPUT_SEARCH}"]["median"]
+    for output in OUTPUTS:
+        requires = OUTPUT_REQUIRES.get(output)
+        if requires is not None:
+            try:
+                __import__(requires)
+            except ImportError:
+                cases[f"output:{output}"] = {"skipped": f"{requires} not installed"}
+                continue
+
+        search = dict(OPTIONS[OUTPUT_SEARCH], path=tree, output=output,
+                      outputpath=output_path, outputfilename="benchmark")
+
+        def search_output():
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                found = go_search(dict(search))
+            return len(found) if output in ("df", "obj_list", "list") else None
+
+        cases[f"output:{output}"] = time_call(search_output, runs)
+        # slightly negative for 'list' / 'obj_list', converted in bulk instead of one by one
+        cases[f"output:{output}"]["export"] = round(cases[f"output:{output}"]["median"] - match, 2)
+
+    return cases
+
+
+def version() -> dict:
+    """Version being benchmarked
+
+    Returns:
+        dict: {"commit", "python", "platform"}, commit is None out of a git checkout
+    """
+    try:
+        commit = subprocess.run(["git", "describe", "--always", "--dirty"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {"commit": commit, "python": platform.python_version(), "platform": platform.platform()}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> int:
+    """Prints the ratio of every case to the same case of a baseline
+
+    Args:
+        results (dict): Current results
+        baseline (dict): Results of another version
+        tolerance (float): Maximum ratio (of the fastest run, the steadiest) before a case is reported as slower
+
+    Returns:
+        int: Number of cases slower than the tolerance
+    """
+    if results["tree"] != baseline.get("tree"):
+        print("Warning: the baseline was run over a different tree")
+
+    slower = 0
+    print(f"{'case':<34} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, case in results["cases"].items():
+        base_case = baseline.get("cases", {}).get(name, {})
+        if "min" not in case or "min" not in base_case:
+            continue
+        ratio = case["min"] / base_case["min"] if base_case["min"] else float("inf")
+        slower += ratio > tolerance
+        print(f"{name:<34} {base_case['min']:>10.2f} {case['min']:>10.2f} {ratio:>7.2f}"
+              + ("   slower" if ratio > tolerance else ""))
+
+    return slower
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Search benchmarks over a synthetic tree")
+    parser.add_argument("--depth", type=int, default=3, help="Levels of folders of the tree, default = 3")
+    parser.add_argument("--fanout", type=int, default=6, help="Folders on each folder, default = 6")
+    parser.add_argument("--files", type=int, default=20, help="Files on each folder, default = 20")
+    parser.add_argument("--no-unicode", dest="unicode", action="store_false", help="Only plain ASCII names")
+    parser.add_argument("--no-ignored", dest="ignored", action="store_false",
+                        help="No ignored folders (node_modules, .git...)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the names, default = 0")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs of each case, default = 5")
+    parser.add_argument("--json", type=str, help="Writes the results to this JSON file")
+    parser.add_argument("--compare", type=str, help="JSON results of another version to compare with")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="With --compare, maximum ratio to the baseline (fastest run), default = 1.25")
+    args = parser.parse_args(argv)
+
+    # no "Searching for..." lines
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tree, tempfile.TemporaryDirectory() as output_path:
+        parameters = {"depth": args.depth, "fanout": args.fanout, "files": args.files, "unicode": args.unicode,
+                      "ignored": args.ignored, "seed": args.seed}
+        stats = make_tree(tree, **parameters)
+
+        results = {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "version": version(),
+            "tree": dict(parameters, created=stats),
+            "runs": args.runs,
+            "cases": run_cases(tree, args.runs, output_path)
+        }
+
+    for name, case in results["cases"].items():
+        if "skipped" in case:
+            print(f"{name:<34} skipped ({case['skipped']})")
+            continue
+        export = case.get("export")
+        print(f"{name:<34} min {case['min']:>9.2f} ms   median {case['median']:>9.2f} ms"
+              + (f"   export {export:>9.2f} ms" if export is not None else ""))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        slower = compare(results, baseline, args.tolerance)
+        if slower:
+            print(f"{slower} case(s) slower than the baseline (tolerance {args.tolerance})")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
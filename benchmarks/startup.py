@@ -0,0 +1,88 @@
+"""Startup time of the command line interface.
+
+Times 'python -c pass' (interpreter alone), 'import findhelp.finder' and a whole console search on a tiny tree
+('python -m findhelp -s one'), each in a new process, and reports the overhead of findhelp over the bare
+interpreter. Exits with status 1 if the CLI overhead exceeds the budget, so shell scripts calling findhelp
+can check it.
+
+Usage:
+    python benchmarks/startup.py [--runs 20] [--budget 50] [--json startup.json]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+
+def time_command(command: list, runs: int, env: dict) -> dict:
+    """Runs a command several times, in a new process each time
+
+    Args:
+        command (list[str]): Command to run
+        runs (int): Number of timed runs (after a warm-up one, which writes the bytecode caches)
+        env (dict): Environment of the processes
+
+    Returns:
+        dict: {"min", "median"} wall times, in milliseconds
+    """
+    subprocess.run(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+
+    return {"min": round(min(times), 2), "median": round(statistics.median(times), 2)}
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Startup time of the findhelp command line interface")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs of each command, default = 20")
+    parser.add_argument("--budget", type=float, default=50,
+                        help="Maximum CLI overhead over the bare interpreter (median, ms), default = 50")
+    parser.add_argument("--json", type=str, help="Also writes the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    # startup is measured as installed: bytecode cached
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+
+    with tempfile.TemporaryDirectory() as tree:
+        os.makedirs(os.path.join(tree, "dir"))
+        for name in ("one.txt", os.path.join("dir", "one.md"), os.path.join("dir", "two.md")):
+            open(os.path.join(tree, name), "w").close()
+
+        results = {
+            "python": time_command([sys.executable, "-c", "pass"], args.runs, env),
+            "import": time_command([sys.executable, "-c", "import findhelp.finder"], args.runs, env),
+            "cli": time_command([sys.executable, "-m", "findhelp", "-s", "one", "-p", tree], args.runs, env),
+        }
+
+    for name in ("import", "cli"):
+        results[name]["overhead"] = round(results[name]["median"] - results["python"]["median"], 2)
+    results["budget"] = args.budget
+
+    for name in ("python", "import", "cli"):
+        overhead = results[name].get("overhead")
+        print(f"{name:<8} min {results[name]['min']:>8.2f} ms   median {results[name]['median']:>8.2f} ms"
+              + (f"   overhead {overhead:>8.2f} ms" if overhead is not None else ""))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if results["cli"]["overhead"] > args.budget:
+        print(f"CLI overhead over budget ({args.budget} ms)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Synthetic directory trees for the benchmarks.
+
+Builds a tree of 'fanout' folders per level, 'depth' levels deep, with 'files' files in every folder. Names
+mix plain, accented and non latin words and several extensions, so every search option has coincidences. Every
+folder with subfolders also holds the folders ignored by default (node_modules, .git...), each with a few
+levels of its own, so ignoring them actually saves walking. The same arguments (and seed) always build the same
+tree.
+
+Usage:
+    python benchmarks/tree.py DEST [--depth 4] [--fanout 5] [--files 20] [--no-unicode] [--no-ignored]
+"""
+import os
+import sys
+import random
+import argparse
+
+WORDS = ("one", "two", "report", "data", "notes", "backup", "final", "draft", "README", "Index")
+UNICODE_WORDS = ("oné", "óne", "résumé", "canción", "Ñandú", "données", "Über", "naïve", "日本語", "Привет")
+EXTENSIONS = (".txt", ".md", ".py", ".csv", ".json", ".pdf", ".mp3", "")
+# same folders than 'ignore_folders' on findhelp's default config.yaml
+IGNORED_FOLDERS = ("node_modules", ".git", "__pycache__", "site-packages")
+IGNORED_DEPTH = 1
+
+
+def make_tree(dest: str, depth: int = 4, fanout: int = 5, files: int = 20, unicode: bool = True,
+              ignored: bool = True, seed: int = 0) -> dict:
+    """Builds a synthetic directory tree
+
+    Args:
+        dest (str): Root folder of the tree, created if it doesn't exist
+        depth (int, optional): Levels of folders below the root. Defaults to 4.
+        fanout (int, optional): Folders on each folder (but the deepest ones). Defaults to 5.
+        files (int, optional): Files on each folder. Defaults to 20.
+        unicode (bool, optional): Also uses accented / non latin names. Defaults to True.
+        ignored (bool, optional): Adds ignored folders (node_modules, .git...) to every folder with subfolders.
+            Defaults to True.
+        seed (int, optional): Seed of the names. Defaults to 0.
+
+    Returns:
+        dict: {"folders", "files", "ignored_folders", "ignored_files"} created
+    """
+    rng = random.Random(seed)
+    words = WORDS + UNICODE_WORDS if unicode else WORDS
+    stats = {"folders": 0, "files": 0, "ignored_folders": 0, "ignored_files": 0}
+
+    def name(index, suffix=""):
+        # suffix: folders and files can't take the same name
+        return f"{rng.choice(words)}_{rng.choice(words).lower()}_{index}{suffix}"
+
+    def fill(path, levels, kind):
+        os.makedirs(path, exist_ok=True)
+        for index in range(files):
+            open(os.path.join(path, name(index) + rng.choice(EXTENSIONS)), "w").close()
+        stats[kind + "files"] += files
+
+        if levels == 0:
+            return
+        for index in range(fanout):
+            fill(os.path.join(path, name(index, "d")), levels - 1, kind)
+        stats[kind + "folders"] += fanout
+
+        if ignored and kind == "":
+            for folder in IGNORED_FOLDERS:
+                fill(os.path.join(path, folder), min(levels - 1, IGNORED_DEPTH), "ignored_")
+            stats["ignored_folders"] += len(IGNORED_FOLDERS)
+
+    fill(dest, depth, "")
+    return stats
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Builds a synthetic directory tree for the benchmarks")
+    parser.add_argument("dest", type=str, help="Root folder of the tree")
+    parser.add_argument("--depth", type=int, default=4, help="Levels of folders, default = 4")
+    parser.add_argument("--fanout", type=int, default=5, help="Folders on each folder, default = 5")
+    parser.add_argument("--files", type=int, default=20, help="Files on each folder, default = 20")
+    parser.add_argument("--no-unicode", dest="unicode", action="store_false",
+                        help="Only plain ASCII names")
+    parser.add_argument("--no-ignored", dest="ignored", action="store_false",
+                        help="No ignored folders (node_modules, .git...)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the names, default = 0")
+    args = parser.parse_args(argv)
+
+    stats = make_tree(args.dest, args.depth, args.fanout, args.files, args.unicode, args.ignored, args.seed)
+    print(", ".join(f"{value} {key.replace('_', ' ')}" for key, value in stats.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
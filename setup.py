@@ -32,6 +32,11 @@ setup(
         'Unidecode>=1.0.22',
     ],
 
+    # Optional dependencies: parquet / arrow outputs
+    extras_require={
+        'arrow': ['pyarrow>=4.0.0'],
+    },
+
     # Here are the keywords of my library.
     keywords='find, search, file, folder',
 
@@ -1,19 +1,103 @@
+import sys
 import argparse
 from findhelp.finder import go_search
+from findhelp.finder import build_index
+from findhelp.finder import refresh_index
+from findhelp.finder import watch
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
-    # Arguments for searching
+
+def index_command(argv):
+    """Runs 'index' command: python -m findhelp index {build,refresh} -p PATH
+
+    Args:
+        argv (list[str]): Command line arguments, after 'index'
+    """
+    parser = argparse.ArgumentParser(prog="findhelp index")
+    parser.add_argument("action", choices=("build", "refresh"),
+                        help="build: walks the path and stores every file / folder in the index. "
+                        "refresh: updates the index, rescanning only the directories that changed")
     parser.add_argument("-p", "--path", type=str,
-                        help="Root path to look for, default = current directory", default=".")
-    parser.add_argument("-s", "--stringsearch", type=str,
-                        help="The string to look for", default="")
+                        help="Root path to index, default = current directory", default=".")
+    parser.add_argument("-ix", "--index", type=str,
+                        help="Index file (SQLite), default = ~/.findhelp_index.sqlite3")
+    parser.add_argument("-a", "--all", action="store_true",
+                        help="build: indexes all folders, ignores 'ignore_folders' switch on config.yaml")
+
+    index_args = vars(parser.parse_args(argv))
+    if index_args["action"] == "build":
+        build_index(index_args["path"], index_args["index"], index_args["all"])
+    else:
+        refresh_index(index_args["path"], index_args["index"])
+
+
+def watch_command(argv):
+    """Runs 'watch' command: python -m findhelp watch -p PATH
+    Watches PATH, then answers every search read from standard input (one per line, same arguments
+    as a regular search, e.g. '-s dummy -i') from the watched table, until end of input
+
+    Args:
+        argv (list[str]): Command line arguments, after 'watch'
+    """
+    parser = argparse.ArgumentParser(prog="findhelp watch")
+    parser.add_argument("-p", "--path", type=str,
+                        help="Root path to watch, default = current directory", default=".")
+    parser.add_argument("-a", "--all", action="store_true",
+                        help="Watches all folders, ignores 'ignore_folders' switch on config.yaml")
+
+    import shlex
+
+    watch_args = vars(parser.parse_args(argv))
+    search = search_parser(prog="")
+    search.set_defaults(path=[watch_args["path"]])
+
+    watched = watch(watch_args["path"], watch_args["all"])
+    try:
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            try:
+                full_args = search_args(search, shlex.split(line))
+            except SystemExit:
+                # argparse already printed the error
+                continue
+            full_args["watcher"] = watched
+
+            try:
+                go_search(full_args)
+            except Exception as error:
+                print(error)
+    finally:
+        watched.close()
+
+
+def search_parser(prog: str = None) -> argparse.ArgumentParser:
+    """Arguments of a search
+
+    Args:
+        prog (str, optional): Program name, for help messages. Defaults to None.
+
+    Returns:
+        argparse.ArgumentParser: Parser of the search arguments
+    """
+    parser = argparse.ArgumentParser(prog=prog)
+    # Arguments for searching
+    parser.add_argument("-p", "--path", type=str, nargs="+",
+                        help="Root path(s) to look for, or a file containing one root path per line. "
+                        "Default = current directory", default=["."])
+    parser.add_argument("-s", "--stringsearch", type=str, nargs="+",
+                        help="The string to look for. Several strings are searched at once, "
+                        "each result shows the ones it matched", default=[""])
+    parser.add_argument("-sf", "--stringsearchfile", type=str,
+                        help="File containing the strings to look for, one per line (instead of --stringsearch)")
     parser.add_argument("-i", "--ignorecase", action="store_true",
                         help="Indicates whether or not searching is case-sensitive")
     parser.add_argument("-c", "--ignoreaccents",
                         action="store_true", help="Ignore accents")
     parser.add_argument("-r", "--regexp", action="store_true",
                         help="Searches by regular expresion")
+    parser.add_argument("-g", "--glob", action="store_true",
+                        help="Searches by glob pattern, matched against paths relative to the root path "
+                        "(e.g. 'src/**/tests/*.py'). Folders that can't lead to a match are not walked")
     parser.add_argument("-e", "--ext", nargs="+",
                         help="List of extensions to limit the search")
     parser.add_argument("-a", "--all", action="store_true",
@@ -24,10 +108,37 @@ if __name__ == "__main__":
                         help="Searches only for directories (not files)")
     parser.add_argument("-ds", "--directoryseparator", help="Just for results purposes: which separator use for paths",
                         type=str, choices=("/", "\\\\", "\\"), default="/")
+    parser.add_argument("--maxdepth", type=int,
+                        help="Deepest level of results (1 = within the root path). Deeper folders are not walked")
+    parser.add_argument("--mindepth", type=int,
+                        help="Results at upper levels are skipped (1 = within the root path)")
+    parser.add_argument("--minsize", type=str,
+                        help="Minimum size of files, in bytes or with a unit (e.g. 10K, 1.5M, 2G). Skips folders")
+    parser.add_argument("--maxsize", type=str,
+                        help="Maximum size of files, same units than --minsize. Skips folders")
+    parser.add_argument("--newer", type=str,
+                        help="Modified at / after this moment: a time ago (e.g. 30m, 12h, 7d, 2w) or an ISO date")
+    parser.add_argument("--older", type=str,
+                        help="Modified before this moment, same format than --newer")
+    parser.add_argument("--metadata", action="store_true",
+                        help="Adds size (bytes) and modification time to each result")
+    parser.add_argument("--limit", type=int,
+                        help="Stops searching as soon as LIMIT results are found")
+    parser.add_argument("--first", action="store_const", dest="limit", const=1,
+                        help="Stops searching at the first result (same as --limit 1)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="Number of threads listing directories in parallel (useful on network shares)")
+    parser.add_argument("--ordered", action="store_true",
+                        help="With --workers > 1, keeps the same results order than a single threaded search")
+    parser.add_argument("-pp", "--processes", type=int, default=1,
+                        help="Number of processes sharing the root paths, when searching several")
+    parser.add_argument("-ix", "--index", type=str, nargs="?", const=True,
+                        help="Answers from the index (see 'index build') instead of walking the directory tree. "
+                        "Optionally, the index file")
 
     # Arguments for outuput results
     parser.add_argument("-o", "--output", choices=("console",
-                        "txt", "csv", "json", "df", "obj_list", "list"), default="console", help="Indicates if results appears on console or are written to a file")
+                        "txt", "csv", "json", "ndjson", "parquet", "arrow", "df", "obj_list", "list"), default="console", help="Indicates if results appears on console or are written to a file")
     parser.add_argument("-dl", "--delimiter", type=str, default="\t",
                         help="Delimiter used for exporting, when output is different than 'console'")
     parser.add_argument("-m", "--outputpath", type=str,
@@ -35,8 +146,43 @@ if __name__ == "__main__":
     parser.add_argument("-n", "--outputfilename", type=str,
                         help="Output (results) filename (with no extension)")
 
+    return parser
+
+
+def search_args(parser: argparse.ArgumentParser, argv: list = None) -> dict:
+    """Parses the arguments of a search into a 'go_search' dictionary
+
+    Args:
+        parser (argparse.ArgumentParser): Parser of the search arguments, see 'search_parser'
+        argv (list[str], optional): Command line arguments. Defaults to None (sys.argv).
+
+    Returns:
+        dict: Search arguments
+    """
+    full_args = vars(parser.parse_args(argv))
+    if len(full_args["path"]) == 1:
+        full_args["path"] = full_args["path"][0]
+
+    stringsearch_file = full_args.pop("stringsearchfile")
+    if stringsearch_file:
+        import pathlib
+        full_args["stringsearch"] = pathlib.Path(stringsearch_file)
+    elif len(full_args["stringsearch"]) == 1:
+        full_args["stringsearch"] = full_args["stringsearch"][0]
+
+    return full_args
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["index"]:
+        index_command(sys.argv[2:])
+        sys.exit(0)
+    if sys.argv[1:2] == ["watch"]:
+        watch_command(sys.argv[2:])
+        sys.exit(0)
+
     # Parse args
-    full_args = vars(parser.parse_args())
+    full_args = search_args(search_parser())
     print(full_args)
 
     go_search(full_args)
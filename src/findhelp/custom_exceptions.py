@@ -72,3 +72,60 @@ class MissingFilename(Exception):
         """
         self.message = message
         super().__init__(self.message)
+
+
+class NotIndexedPathError(Exception):
+    """Raise exception when searching the index for a path that was not indexed
+
+    Arguments:
+    ----
+    Exception (Exception): The base python exception class
+    """
+
+    def __init__(self, message):
+        """Print out message for this exception.
+
+        Arguments:
+        ----
+        message (str): Pass in the message returned by the server.
+        """
+        self.message = message
+        super().__init__(self.message)
+
+
+class NotWatchedPathError(Exception):
+    """Raise exception when searching a watcher for a path that is not watched
+
+    Arguments:
+    ----
+    Exception (Exception): The base python exception class
+    """
+
+    def __init__(self, message):
+        """Print out message for this exception.
+
+        Arguments:
+        ----
+        message (str): Pass in the message returned by the server.
+        """
+        self.message = message
+        super().__init__(self.message)
+
+
+class MissingDependencyError(Exception):
+    """Raise exception when an optional dependency required by the selected options is not installed
+
+    Arguments:
+    ----
+    Exception (Exception): The base python exception class
+    """
+
+    def __init__(self, message):
+        """Print out message for this exception.
+
+        Arguments:
+        ----
+        message (str): Pass in the message returned by the server.
+        """
+        self.message = message
+        super().__init__(self.message)
@@ -1,8 +1,36 @@
+import os
 import re
+import sys
+import time
+import array
+import fnmatch
+import datetime
+import collections
 from typing import Union
-from unidecode import unidecode
 
 from findhelp.custom_exceptions import NotEqualLengthError
+from findhelp.custom_exceptions import NotValidArgumentError
+
+
+def unidecode(string: str) -> str:
+    """Transliterates a string into ASCII (removes accents) with 'unidecode'.
+    The package is imported on the first call, which replaces this function by 'unidecode.unidecode'
+    (searches not ignoring accents never load it)
+
+    Args:
+        string (str): String to transliterate
+
+    Returns:
+        str: ASCII string
+    """
+    global unidecode
+    from unidecode import unidecode
+    return unidecode(string)
+
+
+# Suffixes for sizes (powers of 1024) and relative times
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+TIME_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
 
 
 def sel_arg(arg_dict: dict, arg_search: str):
@@ -20,6 +48,502 @@ def sel_arg(arg_dict: dict, arg_search: str):
     return None
 
 
+class Matcher:
+    """Checks names against a string / regular expression pattern
+
+    Built once per search: the searched value is folded (case / accents) or compiled only once,
+    so checking each name costs a single operation (plus 'unidecode' on the name, if accents are ignored).
+    """
+
+    def __init__(self, value: Union[str, re.Pattern] = "", ignore_case: bool = False, ignore_accents: bool = True,
+                 reg_exp: bool = False):
+        """
+        Args:
+            value (Union[str, re.Pattern], optional): String / re.Pattern to search for. Defaults to "".
+            ignore_case (bool, optional): Indicates if upper / lower case is ignored. Defaults to False.
+            ignore_accents (bool, optional): Indicates if accent characters must be turned into non-accented ones.
+                Defaults to True.
+            reg_exp (bool, optional): Indicates if 'value' (str) is a regular expression. Defaults to False.
+        """
+        self.value = value
+        self.ignore_case = ignore_case
+        self.ignore_accents = ignore_accents
+        self.reg_exp = reg_exp
+        self.match = self.__build()
+
+    def __build(self):
+        """Builds the function used to check a single name
+
+        Returns:
+            Callable[[str], bool]: Function returning a truthy value if the name matches
+        """
+        value = self.value
+        flags = re.IGNORECASE if self.ignore_case else 0
+
+        if isinstance(value, re.Pattern):
+            pattern = re.compile(value.pattern, value.flags | flags)
+        elif self.reg_exp:
+            value = unidecode(value) if self.ignore_accents else value
+            pattern = re.compile(value, flags)
+        else:
+            pattern = None
+
+        if pattern is not None:
+            search = pattern.search
+            if self.ignore_accents:
+                return lambda name: search(unidecode(name))
+            return search
+
+        needle = unidecode(value) if self.ignore_accents else value
+        if needle == "":
+            return lambda name: True
+
+        if self.ignore_case:
+            needle = needle.lower()
+            if self.ignore_accents:
+                return lambda name: needle in unidecode(name).lower()
+            return lambda name: needle in name.lower()
+
+        if self.ignore_accents:
+            return lambda name: needle in unidecode(name)
+        return lambda name: needle in name
+
+    def __call__(self, name: str) -> bool:
+        """Checks if 'name' matches
+
+        Args:
+            name (str): Name to check
+
+        Returns:
+            bool: True if 'name' matches
+        """
+        return bool(self.match(str(name)))
+
+    def __reduce__(self):
+        # compiled functions can't be pickled: the matcher is rebuilt (compiled again) when unpickled
+        return (Matcher, (self.value, self.ignore_case, self.ignore_accents, self.reg_exp))
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton: finds every word of a list contained in a text, in a single pass over the text"""
+
+    def __init__(self, words: list):
+        """
+        Args:
+            words (list[str]): Words to look for
+        """
+        self.words = list(words)
+
+        # goto: transitions of each state, fail: longest proper suffix state, out: words ending on each state
+        goto = [{}]
+        fail = [0]
+        out = [()]
+        for index, word in enumerate(self.words):
+            state = 0
+            for char in word:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    fail.append(0)
+                    out.append(())
+                state = next_state
+            out[state] += (index,)
+
+        # breadth first, so failure states are always built before
+        queue = collections.deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                out[next_state] += out[fail[next_state]]
+
+        self.goto = goto
+        self.fail = fail
+        self.out = out
+
+    def find_all(self, text: str) -> list:
+        """Finds the words contained in 'text'
+
+        Args:
+            text (str): Text to look into
+
+        Returns:
+            list[int]: Indexes (in 'words') of the words found, sorted
+        """
+        goto = self.goto
+        fail = self.fail
+        out = self.out
+
+        found = set(out[0])
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+
+        return sorted(found)
+
+
+def trie_pattern(words: list) -> str:
+    """Builds a regular expression searching for any of 'words', shaped as their trie:
+    shared prefixes are checked once, so the regular expression engine never tries the words one by one.
+
+    Args:
+        words (list[str]): Words to look for
+
+    Returns:
+        str: Regular expression pattern
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = None
+
+    def build(node):
+        # a word ends here: whatever follows, the text already contains it
+        if "" in node:
+            return ""
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items())]
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie) if words else "(?!)"
+
+
+class MultiMatcher(Matcher):
+    """Checks names against several string / regular expression patterns at once
+
+    Literals are searched with a single trie shaped regular expression, regular expressions are joined
+    into a single alternation, so checking each name costs a single operation no matter how many patterns.
+    'tags' tells which patterns a name matched.
+    """
+
+    def __init__(self, values: list, ignore_case: bool = False, ignore_accents: bool = True,
+                 reg_exp: bool = False):
+        """
+        Args:
+            values (list[Union[str, re.Pattern]]): Strings / re.Pattern to search for
+            ignore_case (bool, optional): Indicates if upper / lower case is ignored. Defaults to False.
+            ignore_accents (bool, optional): Indicates if accent characters must be turned into non-accented ones.
+                Defaults to True.
+            reg_exp (bool, optional): Indicates if 'values' (str) are regular expressions. Defaults to False.
+        """
+        self.values = list(values)
+        self.value = self.values
+        self.ignore_case = ignore_case
+        self.ignore_accents = ignore_accents
+        self.reg_exp = reg_exp or any(isinstance(value, re.Pattern) for value in self.values)
+        self.match = self.__build()
+
+    def __build(self):
+        """Builds the function used to check a single name, and the ones used by 'tags'
+
+        Returns:
+            Callable[[str], bool]: Function returning a truthy value if the name matches any pattern
+        """
+        # names are folded once, then checked against all the (folded) patterns
+        fold_case = self.ignore_case and not self.reg_exp
+        if self.ignore_accents:
+            self.fold = (lambda name: unidecode(name).lower()) if fold_case else unidecode
+        else:
+            self.fold = str.lower if fold_case else None
+
+        if self.reg_exp:
+            flags = re.IGNORECASE if self.ignore_case else 0
+            self.patterns = [
+                re.compile(value.pattern, value.flags | flags) if isinstance(value, re.Pattern)
+                else re.compile(unidecode(value) if self.ignore_accents else value, flags)
+                for value in self.values]
+
+            # group references would point to other patterns' groups once joined
+            references = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+            search = None
+            if (len({pattern.flags for pattern in self.patterns}) == 1
+                    and not any(references.search(pattern.pattern) for pattern in self.patterns)):
+                try:
+                    search = re.compile("|".join(f"(?:{pattern.pattern})" for pattern in self.patterns),
+                                        self.patterns[0].flags if self.patterns else 0).search
+                except re.error:
+                    search = None
+            if search is None:
+                patterns = self.patterns
+                search = lambda name: any(pattern.search(name) for pattern in patterns)
+        else:
+            words = [self.fold(value) if self.fold else value for value in self.values]
+            self.automaton = AhoCorasick(words)
+            try:
+                search = re.compile(trie_pattern(words)).search
+            except (re.error, RecursionError):
+                search = re.compile("|".join(re.escape(word) for word in words) or "(?!)").search
+
+        fold = self.fold
+        if fold is None:
+            return search
+        return lambda name: search(fold(name))
+
+    def tags(self, name: str) -> list:
+        """Gets the patterns matched by 'name'
+
+        Args:
+            name (str): Name to check
+
+        Returns:
+            list[Union[str, re.Pattern]]: Matched patterns, in 'values' order
+        """
+        name = self.fold(name) if self.fold else name
+        if self.reg_exp:
+            return [value for value, pattern in zip(self.values, self.patterns) if pattern.search(name)]
+        return [self.values[index] for index in self.automaton.find_all(name)]
+
+    def __reduce__(self):
+        return (MultiMatcher, (self.values, self.ignore_case, self.ignore_accents, self.reg_exp))
+
+
+class GlobMatcher(Matcher):
+    """Checks paths, relative to the searched root, against a glob pattern (e.g. 'src/**/tests/*.py')
+
+    '*', '?' and '[...]' match within a single file / folder name, a '**' segment matches any number of folders.
+    Paths can be checked one folder at a time ('start' / 'step' / 'accepts'), so walking stops at the folders
+    that can't lead to any match.
+    """
+
+    def __init__(self, value: str = "", ignore_case: bool = False, ignore_accents: bool = True):
+        """
+        Args:
+            value (str, optional): Glob pattern, '/' separated. Defaults to "".
+            ignore_case (bool, optional): Indicates if upper / lower case is ignored. Defaults to False.
+            ignore_accents (bool, optional): Indicates if accent characters must be turned into non-accented ones.
+                Defaults to True.
+        """
+        self.value = value
+        self.ignore_case = ignore_case
+        self.ignore_accents = ignore_accents
+        self.reg_exp = False
+
+        flags = re.IGNORECASE if ignore_case else 0
+        segments = []
+        for segment in re.split(r"[\\/]+", unidecode(value) if ignore_accents else value):
+            if segment in ("", ".") or (segment == "**" and segments[-1:] == ["**"]):
+                continue
+            segments.append(segment)
+
+        # None stands for '**'. Segments with no wildcards are compared as they are
+        self.segments = [
+            None if segment == "**"
+            else re.compile(fnmatch.translate(segment), flags).match if ignore_case or re.search(r"[*?[]", segment)
+            else segment.__eq__
+            for segment in segments]
+        self.match = self.match_path
+
+    def __closure(self, states: set) -> frozenset:
+        # '**' may match no folder at all: the next segment is reachable too
+        for state in sorted(states):
+            if state < len(self.segments) and self.segments[state] is None:
+                states.add(state + 1)
+        return frozenset(states)
+
+    def start(self) -> frozenset:
+        """States before any folder is checked (at the searched root)
+
+        Returns:
+            frozenset: Positions within the pattern segments
+        """
+        return self.__closure({0})
+
+    def step(self, states: frozenset, name: str) -> frozenset:
+        """Moves on to a file / folder within the current folder
+
+        Args:
+            states (frozenset): States of the current folder
+            name (str): Name of the file / folder
+
+        Returns:
+            frozenset: States of the file / folder. Empty if neither it nor anything within it can match
+        """
+        if self.ignore_accents:
+            name = unidecode(name)
+
+        next_states = set()
+        for state in states:
+            if state == len(self.segments):
+                continue
+            segment = self.segments[state]
+            if segment is None:
+                next_states.add(state)
+            elif segment(name):
+                next_states.add(state + 1)
+
+        return self.__closure(next_states)
+
+    def accepts(self, states: frozenset) -> bool:
+        """Checks if a file / folder matches the whole pattern
+
+        Args:
+            states (frozenset): States of the file / folder
+
+        Returns:
+            bool: True if it matches
+        """
+        return len(self.segments) in states
+
+    def match_path(self, rel_path: str) -> bool:
+        """Checks a whole path
+
+        Args:
+            rel_path (str): Path relative to the searched root
+
+        Returns:
+            bool: True if it matches
+        """
+        states = self.start()
+        for name in re.split(r"[\\/]+", rel_path):
+            if name in ("", "."):
+                continue
+            states = self.step(states, name)
+            if not states:
+                return False
+        return self.accepts(states)
+
+    def __reduce__(self):
+        return (GlobMatcher, (self.value, self.ignore_case, self.ignore_accents))
+
+
+def parse_size(size: Union[int, str]) -> int:
+    """Turns a size into a number of bytes
+
+    Args:
+        size (Union[int, str]): Number of bytes, or a string like '500', '10K', '1.5G', '2GB' (powers of 1024)
+
+    Raises:
+        NotValidArgumentError: Raised if 'size' is not a valid size
+
+    Returns:
+        int: Number of bytes
+    """
+    if isinstance(size, int) and not isinstance(size, bool) and size >= 0:
+        return size
+
+    found = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)B?\s*", str(size), re.IGNORECASE)
+    if found is None:
+        raise NotValidArgumentError(message=f"Not valid size: {size}, expected bytes or a string like '1.5G'")
+
+    return int(float(found.group(1)) * SIZE_UNITS[found.group(2).upper()])
+
+
+def parse_time(moment: Union[datetime.datetime, datetime.date, datetime.timedelta, str], now: float = None) -> float:
+    """Turns a moment into a timestamp
+
+    Args:
+        moment (Union[datetime.datetime, datetime.date, datetime.timedelta, str]): A date / datetime,
+            a time ago (timedelta, or a string like '30m', '12h', '7d', '2w') or an ISO date string ('2024-01-31')
+        now (float, optional): Timestamp the times ago are relative to. Defaults to None (current time).
+
+    Raises:
+        NotValidArgumentError: Raised if 'moment' is not a valid moment
+
+    Returns:
+        float: Timestamp
+    """
+    if now is None:
+        now = time.time()
+
+    if isinstance(moment, datetime.datetime):
+        return moment.timestamp()
+    if isinstance(moment, datetime.date):
+        return datetime.datetime.combine(moment, datetime.time()).timestamp()
+    if isinstance(moment, datetime.timedelta):
+        return now - moment.total_seconds()
+
+    ago = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*", str(moment))
+    if ago is not None:
+        return now - float(ago.group(1)) * TIME_UNITS[ago.group(2)]
+
+    try:
+        return datetime.datetime.fromisoformat(str(moment).strip()).timestamp()
+    except ValueError:
+        raise NotValidArgumentError(
+            message=f"Not valid moment: {moment}, expected a date, a timedelta or a string like '7d' / '2024-01-31'")
+
+
+class MetadataFilter:
+    """Checks files / folders metadata (size, modification time) and gets it for results
+
+    Only the coincidences that passed every other check are checked, so a single stat is made per coincidence.
+    """
+
+    def __init__(self, minsize: Union[int, str] = None, maxsize: Union[int, str] = None,
+                 newer: Union[datetime.datetime, datetime.timedelta, str] = None,
+                 older: Union[datetime.datetime, datetime.timedelta, str] = None, columns: bool = False):
+        """
+        Args:
+            minsize (Union[int, str], optional): Minimum size of files, see 'parse_size'. Defaults to None.
+            maxsize (Union[int, str], optional): Maximum size of files, see 'parse_size'. Defaults to None.
+            newer (Union[datetime.datetime, datetime.timedelta, str], optional): Modified at / after this moment,
+                see 'parse_time'. Defaults to None.
+            older (Union[datetime.datetime, datetime.timedelta, str], optional): Modified before this moment,
+                see 'parse_time'. Defaults to None.
+            columns (bool, optional): Indicates if size and modification time are added to results. Defaults to False.
+
+        Raises:
+            NotValidArgumentError: Raised if a size / moment is not valid
+        """
+        now = time.time()
+        self.minsize = parse_size(minsize) if minsize is not None else None
+        self.maxsize = parse_size(maxsize) if maxsize is not None else None
+        self.newer = parse_time(newer, now) if newer is not None else None
+        self.older = parse_time(older, now) if older is not None else None
+        self.columns = columns
+
+        # folders have no meaningful size: they are skipped when filtering by size
+        self.only_files = self.minsize is not None or self.maxsize is not None
+        self.filters = self.only_files or self.newer is not None or self.older is not None
+
+    def check(self, stat_result) -> bool:
+        """Checks a file / folder metadata
+
+        Args:
+            stat_result (os.stat_result): File / folder metadata. None if it couldn't be read
+
+        Returns:
+            bool: True if it passes every filter
+        """
+        if stat_result is None:
+            return not self.filters
+        if self.minsize is not None and stat_result.st_size < self.minsize:
+            return False
+        if self.maxsize is not None and stat_result.st_size > self.maxsize:
+            return False
+        if self.newer is not None and stat_result.st_mtime < self.newer:
+            return False
+        if self.older is not None and stat_result.st_mtime >= self.older:
+            return False
+        return True
+
+    def values(self, stat_result) -> tuple:
+        """Gets the result columns
+
+        Args:
+            stat_result (os.stat_result): File / folder metadata. None if it couldn't be read
+
+        Returns:
+            tuple: (size, mtime) = (int, datetime.datetime), (None, None) if metadata couldn't be read
+        """
+        if stat_result is None:
+            return None, None
+        return stat_result.st_size, datetime.datetime.fromtimestamp(stat_result.st_mtime)
+
+
 def search_in_list(
         base_list: list, value: Union[str, re.Pattern], ignore_case: bool = False, ignore_accents: bool = True):
     """Search for matches in a list
@@ -37,31 +561,9 @@ def search_in_list(
     Returns:
         list[str]: List with all coincidences found, respecting ortography (e.g. accents, upper/lowercase)
     """
+    match = Matcher(value, ignore_case, ignore_accents).match
 
-    if ignore_accents:
-        base_new = [unidecode(
-            str(element)) for element in base_list]
-    else:
-        base_new = base_list[:]
-
-    # indexes
-    if not ignore_case:
-        if isinstance(value, re.Pattern):
-            indexes = [index for index, item in enumerate(
-                base_new) if value.search(str(item))]
-        else:
-            indexes = [index for index, item in enumerate(
-                base_new) if value in str(item)]
-
-    else:
-        if isinstance(value, re.Pattern):
-            indexes = [index for index, item in enumerate(
-                base_new) if value.search(str(item).lower())]
-        else:
-            indexes = [index for index, item in enumerate(
-                base_new) if value.lower() in str(item).lower()]
-
-    return [element for index, element in enumerate(base_list) if index in indexes]
+    return [element for element in base_list if match(str(element))]
 
 
 def forcedir_sep(path: str, dir_sep: str) -> str:
@@ -79,7 +581,7 @@ def forcedir_sep(path: str, dir_sep: str) -> str:
 
 def join_result(output_type: str, defaultdir_sep: str, fullpath: str, type: str,
                 folder_parent: str, folder_name: str, file_name: str = None,
-                ext: str = None):
+                ext: str = None, patterns: list = None, metadata: tuple = None):
     """Joins a single found coincidence into a list / dict
 
     Args:
@@ -91,15 +593,42 @@ def join_result(output_type: str, defaultdir_sep: str, fullpath: str, type: str,
         folder_name (str): Name of the folder in which the coincidence was fount. For filtering purposes.
         file_name (str, optional): Filename of the coincidence, if applicable (if type != 'folder'). Defaults to None.
         ext (str, optional): Filename extension of the coincidence, if applicable (if type != 'folder'). Defaults to None.
+        patterns (list, optional): Patterns matched by the coincidence, when searching several of them.
+            If specified, it is added as a last element ('patterns'). Defaults to None.
+        metadata (tuple, optional): (size, mtime) of the coincidence, see 'MetadataFilter.values'.
+            If specified, they are added after 'ext' ('size', 'mtime'). Defaults to None.
 
     Returns:
         list | dict: An list / dictionary with each of the elements, ready to join with other found coincidences
     """
-    fullpath = forcedir_sep(fullpath, defaultdir_sep)
-    folder_parent = forcedir_sep(folder_parent, defaultdir_sep)
+    if output_type not in ("list", "dict"):
+        return None
+    return build_row(output_type, forcedir_sep(fullpath, defaultdir_sep), type,
+                     forcedir_sep(folder_parent, defaultdir_sep), folder_name, file_name, ext, patterns, metadata)
+
+
+def build_row(output_type: str, fullpath: str, type: str, folder_parent: str, folder_name: str,
+              file_name: str, ext: str, patterns: list, metadata: tuple):
+    """Builds the output shape of a found coincidence, its paths already separated.
+    Called from 'join_result' / 'convert_results', so every output has the same columns
+
+    Args:
+        output_type (str): 'list' or 'dict'
+        fullpath (str): Folder in which the coincidence was found
+        type (str): 'folder' or 'file'
+        folder_parent (str): Path to 'fullpath' parent
+        folder_name (str): Found folder, or the one containing the found file
+        file_name (str): Found file, None for folders
+        ext (str): Filename extension, None for folders
+        patterns (list): Patterns matched by the coincidence, added last ('patterns') if not None
+        metadata (tuple): (size, mtime) of the coincidence, added after 'ext' ('size', 'mtime') if not None
 
+    Returns:
+        list | dict: [fullpath, type, folder_parent, folder_name, file_name, ext(, size, mtime)(, patterns)],
+            or a dictionary with the same keys than the header of the results
+    """
     if output_type == "dict":
-        return {
+        row = {
             "fullpath": fullpath,
             "type": type,
             "folder_parent": folder_parent,
@@ -107,16 +636,230 @@ def join_result(output_type: str, defaultdir_sep: str, fullpath: str, type: str,
             "file_name": file_name,
             "ext": ext
         }
-    elif output_type == "list":
-        return [
-            fullpath,
-            type,
-            folder_parent,
-            folder_name,
-            file_name,
-            ext
-        ]
-    return None
+        if metadata is not None:
+            row["size"], row["mtime"] = metadata
+        if patterns is not None:
+            row["patterns"] = patterns
+        return row
+
+    row = [fullpath, type, folder_parent, folder_name, file_name, ext]
+    if metadata is not None:
+        row.extend(metadata)
+    if patterns is not None:
+        row.append(patterns)
+    return row
+
+
+class SearchResult:
+    """Single found coincidence, stored compactly until it is output
+
+    Coincidences within the same directory share a single 'dirpath' string (the one the directory was
+    walked with) and extensions are interned, so each one only holds its own name.
+    'folder_parent' / 'folder_name' / 'file_name' are derived when needed, and separators are forced
+    on output ('to_list' / 'to_dict').
+
+    Attributes:
+        dirpath (str): Folder in which the coincidence was found ('fullpath')
+        type (str): 'folder' or 'file'
+        name (str): Name of the found folder / file
+        ext (str): Filename extension, None for folders
+        patterns (list): Patterns matched by the coincidence, when searching several of them. None otherwise
+        metadata (tuple): (size, mtime), see 'MetadataFilter.values'. None if not requested
+    """
+    __slots__ = ("dirpath", "type", "name", "ext", "patterns", "metadata")
+
+    def __init__(self, dirpath: str, type: str, name: str, ext: str = None,
+                 patterns: list = None, metadata: tuple = None):
+        self.dirpath = dirpath
+        self.type = type
+        self.name = name
+        self.ext = sys.intern(ext) if ext else ext
+        self.patterns = patterns
+        self.metadata = metadata
+
+    def __repr__(self):
+        return f"SearchResult({self.dirpath!r}, {self.type!r}, {self.name!r})"
+
+    def __reduce__(self):
+        # pickled results (multiple processes) keep sharing their 'dirpath' within a root (pickle memo)
+        return (SearchResult, (self.dirpath, self.type, self.name, self.ext, self.patterns, self.metadata))
+
+    @property
+    def folder_parent(self) -> str:
+        return os.path.dirname(self.dirpath)
+
+    @property
+    def folder_name(self) -> str:
+        return self.name if self.type == "folder" else os.path.basename(self.dirpath)
+
+    @property
+    def file_name(self) -> str:
+        return None if self.type == "folder" else self.name
+
+    def to_list(self, dir_sep: str = "/") -> list:
+        """Output shape of 'console' / 'list', see 'join_result'
+
+        Args:
+            dir_sep (str, optional): Separator forced on paths. Defaults to "/".
+
+        Returns:
+            list: [fullpath, type, folder_parent, folder_name, file_name, ext(, size, mtime)(, patterns)]
+        """
+        return join_result("list", dir_sep, self.dirpath, self.type, self.folder_parent, self.folder_name,
+                           self.file_name, self.ext, self.patterns, self.metadata)
+
+    def to_dict(self, dir_sep: str = "/") -> dict:
+        """Output shape of every other output, see 'join_result'
+
+        Args:
+            dir_sep (str, optional): Separator forced on paths. Defaults to "/".
+
+        Returns:
+            dict: Same keys than 'to_list' elements
+        """
+        return join_result("dict", dir_sep, self.dirpath, self.type, self.folder_parent, self.folder_name,
+                           self.file_name, self.ext, self.patterns, self.metadata)
+
+
+def convert_results(results, output_type: str, dir_sep: str = "/"):
+    """Turns found coincidences into their output shape, same as 'SearchResult.to_list' / 'SearchResult.to_dict'
+
+    Paths of each directory are computed once for all its coincidences (they share 'dirpath').
+
+    Args:
+        results (Iterable[SearchResult]): Found coincidences
+        output_type (str): 'list' or 'dict'
+        dir_sep (str, optional): Separator forced on paths. Defaults to "/".
+
+    Yields:
+        list | dict: Each coincidence, see 'join_result'
+    """
+    last_dirpath = None
+    for result in results:
+        if result.dirpath is not last_dirpath:
+            last_dirpath = result.dirpath
+            fullpath = forcedir_sep(last_dirpath, dir_sep)
+            folder_parent = forcedir_sep(os.path.dirname(last_dirpath), dir_sep)
+            dir_name = os.path.basename(last_dirpath)
+
+        if result.type == "folder":
+            folder_name, file_name = result.name, None
+        else:
+            folder_name, file_name = dir_name, result.name
+        yield build_row(output_type, fullpath, result.type, folder_parent, folder_name, file_name, result.ext,
+                        result.patterns, result.metadata)
+
+
+class ResultColumns:
+    """Found coincidences stored by columns as they are found, to build a DataFrame ('df' output)
+    or arrow batches ('parquet' / 'arrow' outputs)
+
+    Repeated values ('type', 'folder_parent', 'folder_name', 'ext') are stored as integer codes of their
+    categories (-1 for None), so no per coincidence object is kept for them.
+
+    Attributes:
+        dir_sep (str): Separator forced on paths
+        fullpath (list): 'fullpath' column. Coincidences within a directory share its string
+        file_name (list): 'file_name' column
+        codes (dict): For every categorical column, an array with the code of each coincidence
+        categories (dict): For every categorical column, its categories {value: code}, in found order
+        size (list): 'size' column, None if coincidences have no metadata
+        mtime (list): 'mtime' column, None if coincidences have no metadata
+        patterns (list): 'patterns' column, None if a single pattern was searched
+    """
+    CATEGORICAL = ("type", "folder_parent", "folder_name", "ext")
+
+    def __init__(self, dir_sep: str = "/"):
+        self.dir_sep = dir_sep
+        self.clear()
+
+    def __len__(self):
+        return len(self.fullpath)
+
+    def clear(self, categories: bool = True):
+        """Drops the stored coincidences, once they were output (e.g. a batch written to file)
+
+        Args:
+            categories (bool, optional): Also drops the categories, otherwise new ones keep being numbered
+                after them. Defaults to True.
+        """
+        self.fullpath = []
+        self.file_name = []
+        self.codes = {column: array.array("q") for column in self.CATEGORICAL}
+        self.size = None
+        self.mtime = None
+        self.patterns = None
+        if categories:
+            self.categories = {column: {} for column in self.CATEGORICAL}
+            self._last_dirpath = None
+
+    def __code(self, column: str, value: str) -> int:
+        if value is None:
+            return -1
+        categories = self.categories[column]
+        code = categories.get(value)
+        if code is None:
+            code = categories[value] = len(categories)
+        return code
+
+    def append(self, result: SearchResult):
+        """Adds a found coincidence
+
+        Args:
+            result (SearchResult): Found coincidence
+        """
+        if result.dirpath is not self._last_dirpath:
+            self._last_dirpath = result.dirpath
+            # folder name code only once a file is found, so no category is left unused
+            self._dir = [forcedir_sep(result.dirpath, self.dir_sep),
+                         self.__code("folder_parent", forcedir_sep(os.path.dirname(result.dirpath), self.dir_sep)),
+                         None]
+        fullpath, parent_code, dir_name_code = self._dir
+
+        self.fullpath.append(fullpath)
+        self.codes["type"].append(self.__code("type", result.type))
+        self.codes["folder_parent"].append(parent_code)
+        if result.type == "folder":
+            self.codes["folder_name"].append(self.__code("folder_name", result.name))
+            self.file_name.append(None)
+        else:
+            if dir_name_code is None:
+                dir_name_code = self._dir[2] = self.__code("folder_name", os.path.basename(result.dirpath))
+            self.codes["folder_name"].append(dir_name_code)
+            self.file_name.append(result.name)
+        self.codes["ext"].append(self.__code("ext", result.ext))
+
+        if result.metadata is not None:
+            if self.size is None:
+                self.size, self.mtime = [], []
+            self.size.append(result.metadata[0])
+            self.mtime.append(result.metadata[1])
+        if result.patterns is not None:
+            if self.patterns is None:
+                self.patterns = []
+            self.patterns.append(result.patterns)
+
+    def extend(self, results):
+        """Adds found coincidences
+
+        Args:
+            results (Iterable[SearchResult]): Found coincidences
+        """
+        append = self.append
+        for result in results:
+            append(result)
+
+
+class ResultList(list):
+    """List of found coincidences, as returned for 'obj_list' / 'list' outputs
+
+    Attributes:
+        truncated (bool): Indicates the search stopped at its 'limit', so more coincidences may exist
+    """
+
+    def __init__(self, results=(), truncated: bool = False):
+        super().__init__(results)
+        self.truncated = truncated
 
 
 def parse_line(line: list, max_len: list) -> str:
@@ -4,24 +4,25 @@ import datetime
 import os
 import csv
 import json
+import sys
 import time
 import yaml
-from unidecode import unidecode
-import re
-import pandas as pd
+import itertools
+import threading
 import findhelp.custom_utils as custom_utils
+import findhelp.walker as walker
+from concurrent.futures import CancelledError
+from concurrent.futures import ThreadPoolExecutor
 
 from findhelp.custom_exceptions import NotValidDirectoryError
 from findhelp.custom_exceptions import NotValidArgumentError
 from findhelp.custom_exceptions import MissingFilename
+from findhelp.custom_exceptions import MissingDependencyError
 
 
 main_logger = logging.getLogger(__name__)
 main_logger.setLevel(logging.INFO)
 formatter = logging.Formatter("%(asctime)s:%(levelname)s:%(message)s")
-now = datetime.datetime.now()
-date_today = now.strftime("%Y%m%d")
-date_now = now.strftime("%Y%m%d_%H_%M_%S")
 
 stream_handler = logging.StreamHandler()
 stream_handler.setFormatter(formatter)
@@ -37,93 +38,269 @@ HEADER_RESULT = ["fullpath",
                  "file_name",
                  "ext"]
 
+OUTPUTS = ("console", "txt", "csv", "json", "ndjson", "parquet", "arrow", "df", "obj_list", "list")
+# Outputs written while searching (see '__stream_results'): coincidences written at once, buffer of their files
+STREAMED_OUTPUTS = ("txt", "csv", "json", "ndjson", "parquet", "arrow")
+EXPORT_CHUNK = 1000
+EXPORT_BUFFER = 1024 * 1024
+# Outputs requiring pyarrow (optional: pip install findhelp[arrow]), and rows per batch (parquet row group)
+ARROW_OUTPUTS = ("parquet", "arrow")
+ARROW_BATCH = 65536
+# Async searches (see 'aiter_search'): threads listing directories, shared by every async search,
+# and directories each search lists at once (unless 'workers' > 1)
+ASYNC_WORKERS = 16
+ASYNC_CONCURRENCY = 8
+# Async searches written on another thread (see 'async_search'): coincidences found ahead of the output
+ASYNC_BUFFER = 10000
+# Console output (see '__print_console'): rows sampled for columns widths, seconds rows may wait to be printed
+CONSOLE_SAMPLE = 1000
+CONSOLE_FLUSH = 0.1
+
+TIME_FORMAT = "%Y/%m/%d, %H:%M:%S.%f"
+
 CONFIG_PATH = os.path.join(os.path.dirname(
     os.path.realpath(__file__)), "config.yaml")
+# libyaml loader if available
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# 'config.yaml' as last read ((st_mtime_ns, st_size), config), see '__config'
+_config_cache = None
+
+# Compiled matchers kept by each 'Searcher'
+SEARCHER_CACHE = 128
 
+# Thread pool of the async searches, started by the first one (see '__async_executor')
+_async_executor = None
+_async_lock = threading.Lock()
 
-def __search_elements(
-        search_type: str, string_search: Union[str, re.Pattern] = "", path: str = ".", dir_sep: str = "/",
-        ignore_case: bool = False, ignore_accents: bool = False, ignore_folders: list = None, results: list = None,
-        ext_exclude: list = None, ext_include: list = None, output: str = "console"):
-    """Recursively searches for coincidences of files / folders in the specified 'path'. Called from '__search'
+
+def __iter_elements(
+        search_type: str, matcher: custom_utils.Matcher, path: str = ".", ignore_folders: list = None,
+        ext_exclude: list = None, ext_include: list = None, workers: int = 1,
+        ordered: bool = False, watched: "watcher.Watcher" = None, maxdepth: int = None, mindepth: int = None,
+        metadata: custom_utils.MetadataFilter = None):
+    """Recursively searches for coincidences of files / folders in the specified 'path', yielding them as found.
+    Called from '__iter_roots'
 
     Args:
         search_type (str): Indicates what to search for {files, folders, both}
-        string_search (Union[str, re.Pattern], optional): The string to look for
+        matcher (custom_utils.Matcher): Checks if a file / folder name matches the searched string(s)
         path (str, optional): Root path to look for. Defaults to ".".
-        dir_sep (str, optional): Just for results purposes: which separator use for paths. Defaults to "/".
-        ignore_case (bool, optional): Indicates whether or not searching is case-sensitive. Defaults to False.
-        ignore_accents (bool, optional): Ignore accents. Defaults to False.
         ignore_folders (list, optional): Folders to ignore while searching. Defaults to None.
-        results (list, optional): List to append the found results. Defaults to None.
         ext_exclude (list, optional): List of extensions to exclude. Defaults to None.
         ext_include (list, optional): List of extensions to search.
             If different than None, searching ignores 'ext_exclude' and considers only 'ext_include'. 
             Defaults to None.
-        output (str): {console,txt,csv,json,df,obj_list,list}
-                Indicates if results appears on console or are written to a file.
-                Defaults to "console".
-
-    Returns:
-        _type_: _description_
+        workers (int, optional): Number of threads listing directories. Defaults to 1 (no thread pool).
+        ordered (bool, optional): If workers > 1, keeps the same results order than a single threaded search.
+            Defaults to False.
+        watched (watcher.Watcher, optional): If specified, searches its in-memory table instead of walking
+            the directory tree. Defaults to None.
+        maxdepth (int, optional): Deepest level of coincidences (1 = within 'path'). Folders at this level
+            are not walked. Defaults to None (no limit).
+        mindepth (int, optional): Coincidences at upper levels are skipped (folders are still walked).
+            Defaults to None (no limit).
+        metadata (custom_utils.MetadataFilter, optional): Size / modification time filters and columns.
+            Only coincidences passing every other check are stat-ed. Defaults to None.
+
+    Yields:
+        custom_utils.SearchResult: Each found coincidence
     """
-    # it seems double, but otherway
-    if results == None:
-        results = []
+    ignore_folders = set(ignore_folders)
+    if os.path.split(path)[1] in ignore_folders:
+        return
 
-    if output in ["console", "list"]:
-        output_type = "list"
-    else:
-        output_type = "dict"
+    visit, descend = __visitor(search_type, matcher, path, ignore_folders, ext_exclude, ext_include,
+                               maxdepth, mindepth, metadata)
+    tree = __tree(path, ignore_folders, workers, ordered, watched, descend, metadata is not None)
+
+    for dirpath, dir_names, file_names, entries in tree:
+        yield from visit(dirpath, dir_names, file_names, entries)
 
-    if os.path.split(path)[1] not in ignore_folders:
-        for dirpath, dir_names, file_names in os.walk(path):
-            dir_names[:] = [d for d in dir_names if d not in ignore_folders]
 
-            if search_type in ("folders", "both") and not ext_include:
-                # folders
-                dir_founds = custom_utils.search_in_list(
-                    dir_names, string_search, ignore_case, ignore_accents)
+def __tree(path: str, ignore_folders: set, workers: int = 1, ordered: bool = False, watched: "watcher.Watcher" = None,
+           descend=None, keep_entries: bool = False):
+    """Walks the directory tree (or the table of a watcher). Called from '__iter_elements' / '__walk_many'
+
+    Args:
+        path (str): Root path to walk
+        ignore_folders (set): Folders to ignore
+        workers (int, optional): Number of threads listing directories. Defaults to 1 (no thread pool).
+        ordered (bool, optional): If workers > 1, keeps the same order than a single threaded walk. Defaults to False.
+        watched (watcher.Watcher, optional): If specified, walks its in-memory table. Defaults to None.
+        descend (Callable[[str, str], bool], optional): Prunes folders, see 'walker.walk_tree'. Defaults to None.
+        keep_entries (bool, optional): Keeps the directory entries (metadata), see 'walker.walk_tree'.
+            Defaults to False.
+
+    Returns:
+        Iterator[tuple]: (dirpath, dir_names, file_names, entries) of every walked directory
+    """
+    if watched is not None:
+        return watched.iter_tree(path, ignore_folders, descend)
+    if workers > 1:
+        return walker.walk_tree_parallel(path, ignore_folders, workers, ordered, descend, keep_entries)
+    return walker.walk_tree(path, ignore_folders, descend, keep_entries)
 
-                filtered_dir_founds = [
-                    found for found in dir_founds if found.lower() not in ignore_folders]
 
-                for found in filtered_dir_founds:
-                    results.append(custom_utils.join_result(output_type, dir_sep,
-                                                            dirpath, "folder", os.path.dirname(dirpath), found))
+def __visitor(search_type: str, matcher: custom_utils.Matcher, path: str, ignore_folders: set,
+              ext_exclude: list = None, ext_include: list = None, maxdepth: int = None, mindepth: int = None,
+              metadata: custom_utils.MetadataFilter = None) -> tuple:
+    """Prepares the search of a root path, one directory at a time. Called from '__iter_elements' / '__walk_many'
 
-            # files
-            if search_type in ("files", "both"):
-                founds = custom_utils.search_in_list(
-                    file_names, string_search, ignore_case, ignore_accents)
+    Args:
+        Same as '__iter_elements'. 'ignore_folders' is a set
 
+    Returns:
+        tuple: (visit, descend)
+            visit (Callable[[str, list, list, dict], Iterator[custom_utils.SearchResult]]): Yields the coincidences
+                of a walked directory (dirpath, dir_names, file_names, entries). Directories this search
+                wouldn't walk ('maxdepth', 'glob') yield nothing, so the walk can be shared with other searches
+            descend (Callable[[str, str], bool]): Prunes folders, see 'walker.walk_tree'. None if nothing is pruned
+    """
+    search_folders = search_type in ("folders", "both") and not ext_include
+    search_files = search_type in ("files", "both")
+    if metadata is not None and metadata.only_files:
+        search_folders = False
+    name_match = matcher.match
+    # several patterns: each coincidence is tagged with the ones it matched
+    tags = matcher.tags if isinstance(matcher, custom_utils.MultiMatcher) else None
+
+    # glob: names are matched by their path, folders that can't lead to a match are not walked
+    glob = matcher if isinstance(matcher, custom_utils.GlobMatcher) else None
+    if glob is not None:
+        glob_states = {path: glob.start()}
+
+    # level of the coincidences within 'dirpath' (1 for the ones within 'path')
+    base_length = len(path.rstrip(os.sep))
+
+    def depth(dirpath):
+        return 1 if dirpath == path else dirpath[base_length:].count(os.sep) + 1
+
+    def descend(dirpath, name):
+        if maxdepth is not None and depth(dirpath) >= maxdepth:
+            return False
+        if glob is not None:
+            dir_states = glob_states.get(dirpath)
+            if dir_states is None:
+                # pruned by this search, walked for another one ('go_search_many')
+                return False
+            states = glob.step(dir_states, name)
+            if not states:
+                return False
+            glob_states[os.path.join(dirpath, name)] = states
+        return True
+
+    if glob is None and maxdepth is None:
+        descend = None
+
+    def visit(dirpath, dir_names, file_names, entries):
+        match = name_match
+        if glob is not None:
+            dir_states = glob_states.pop(dirpath, None)
+            if dir_states is None:
+                # pruned
+                return
+
+            def match(name):
+                return glob.accepts(glob.step(dir_states, name))
+
+        if maxdepth is not None and depth(dirpath) > maxdepth:
+            return
+        if mindepth is not None and depth(dirpath) < mindepth:
+            return
+
+        columns = None
+        # folders
+        if search_folders:
+            for found in dir_names:
+                if found.lower() in ignore_folders:
+                    continue
+                if match(found):
+                    if metadata is not None:
+                        stat_result = __stat(dirpath, found, entries)
+                        if not metadata.check(stat_result):
+                            continue
+                        columns = metadata.values(stat_result) if metadata.columns else None
+                    yield custom_utils.SearchResult(dirpath, "folder", found, None,
+                                                    tags(found) if tags else None, columns)
+
+        # files
+        if search_files:
+            for found in file_names:
+                if not match(found):
+                    continue
+
+                tempext = os.path.splitext(found)[1]
                 if ext_include:
-                    filtered_founds = [found for found in founds if os.path.splitext(
-                        found)[1].lower() in ext_include]
+                    if tempext.lower() not in ext_include:
+                        continue
                 elif ext_exclude:
-                    filtered_founds = [found for found in founds if os.path.splitext(
-                        found)[1].lower() not in ext_exclude]
-                else:
-                    filtered_founds = founds
+                    if tempext.lower() in ext_exclude:
+                        continue
+
+                if metadata is not None:
+                    stat_result = __stat(dirpath, found, entries)
+                    if not metadata.check(stat_result):
+                        continue
+                    columns = metadata.values(stat_result) if metadata.columns else None
+
+                yield custom_utils.SearchResult(dirpath, "file", found, tempext,
+                                                tags(found) if tags else None, columns)
+
+    return visit, descend
+
+
+def __stat(dirpath: str, name: str, entries: dict = None):
+    """Gets a file / folder metadata (following symbolic links). Called from '__iter_elements'
+
+    Args:
+        dirpath (str): Folder containing the file / folder
+        name (str): Name of the file / folder
+        entries (dict, optional): {name: os.DirEntry} of 'dirpath', whose stat results are cached. Defaults to None.
+
+    Returns:
+        os.stat_result | None: Metadata, None if it can't be read (e.g. broken symbolic link)
+    """
+    try:
+        if entries is not None:
+            return entries[name].stat()
+        return os.stat(os.path.join(dirpath, name))
+    except OSError:
+        return None
+
 
-                for found in filtered_founds:
-                    tempext = os.path.splitext(found)[1]
-                    results.append(custom_utils.join_result(output_type, dir_sep,
-                                                            dirpath, "file", os.path.dirname(dirpath), os.path.basename(dirpath), found, tempext))
+def __search_elements(path: str = ".", results: list = None, **criteria) -> list:
+    """Recursively searches for coincidences of files / folders in the specified 'path'.
+    Called from '__search_worker'
 
+    Args:
+        path (str, optional): Root path to look for. Defaults to ".".
+        results (list, optional): List to append the found results. Defaults to None.
+        **criteria: Search criteria, see '__iter_elements'
+
+    Returns:
+        list: List of found coincidences
+    """
+    # it seems double, but otherway
+    if results == None:
+        results = []
+
+    results.extend(__iter_elements(path=path, **criteria))
     return results
 
 
 def __search(
         path: str, string_search: str, ignore_case: bool, ignore_accents: bool, reg_exp: bool,
-        ext: Union[str, list], all: bool, only_files: bool, only_dirs: bool, dir_sep: str,
-        output: str):
-    """Called from 'go_search'. Defines what extensions / folders ignore and / or consider.
-        and calls __search_elements to get a list of coincidences
+        ext: Union[str, list], all: bool, only_files: bool, only_dirs: bool, workers: int = 1, ordered: bool = False, processes: int = 1, index_path: Union[str, bool] = None,
+        watched: "watcher.Watcher" = None, glob: bool = False, maxdepth: int = None, mindepth: int = None,
+        min_size: Union[int, str] = None, max_size: Union[int, str] = None, newer=None, older=None,
+        metadata: bool = False, limit: int = None, searcher: "Searcher" = None):
+    """Called from 'iter_search'. Defines what extensions / folders ignore and / or consider.
+        and prepares the iterator of coincidences
 
     Args:
-        path (str): Root path to look for
-        string_search (str): The string to look for
+        path (Union[str, list]): Root path to look for. It can be a list of root paths or a file containing them
+        string_search (Union[str, list, os.PathLike]): The string to look for.
+            It can be a list of strings or a file (os.PathLike) containing them, see '__patterns'
         ignore_case (bool): Indicates whether or not searching is case-sensitive
         ignore_accents (bool): Ignore accents
         reg_exp (bool): Searches by regular expresion
@@ -131,87 +308,495 @@ def __search(
         all (bool): Searches on all folders, ignores 'ignore_folders' switch on 'config.yaml'
         only_files (bool): Searches only for files (not directories)
         only_dirs (bool): Searches only for directories (not files)
-        dir_sep (str): Just for results purposes: which separator use for paths
-        output (str): {console,txt,csv,json,df,obj_list,list}
-                Indicates if results appears on console or are written to a file        
+        workers (int, optional): Number of threads listing directories. Defaults to 1.
+        ordered (bool, optional): If workers > 1, keeps a deterministic results order. Defaults to False.
+        processes (int, optional): Number of processes sharing the roots to search, if several. Defaults to 1.
+        index_path (Union[str, bool], optional): If specified, answers from the index stored in this SQLite file
+            instead of walking the directory tree (True for the default index file). Defaults to None.
+        watched (watcher.Watcher, optional): If specified, searches its in-memory table instead of walking
+            the directory tree. Defaults to None.
+        glob (bool, optional): Searches by glob pattern ('string_search'), matched against paths relative
+            to each root, see 'custom_utils.GlobMatcher'. Defaults to False.
+        maxdepth (int, optional): Deepest level of coincidences (1 = within each root). Defaults to None.
+        mindepth (int, optional): Upper level of coincidences (1 = within each root). Defaults to None.
+        min_size (Union[int, str], optional): Minimum size of files, see 'custom_utils.parse_size'. Defaults to None.
+        max_size (Union[int, str], optional): Maximum size of files, see 'custom_utils.parse_size'. Defaults to None.
+        newer (Union[datetime.datetime, datetime.timedelta, str], optional): Modified at / after this moment,
+            see 'custom_utils.parse_time'. Defaults to None.
+        older (Union[datetime.datetime, datetime.timedelta, str], optional): Modified before this moment,
+            see 'custom_utils.parse_time'. Defaults to None.
+        metadata (bool, optional): Adds size and modification time to coincidences. Defaults to False.
+        limit (int, optional): Stops searching as soon as this number of coincidences is found. Defaults to None.
+        searcher (Searcher, optional): Session keeping the compiled matchers, the ignored folders / extensions
+            and the process pool between searches. Defaults to None.
 
     Raises:
+        NotValidArgumentError: Raised if no root path was specified
+        NotValidArgumentError: Raised if a size / moment is not valid
+        NotValidArgumentError: Raised if an empty list / file of patterns was specified
+        NotValidArgumentError: Raised if several glob patterns were specified
+        NotIndexedPathError: Raised if searching the index, and a root path is not indexed
+        NotWatchedPathError: Raised if searching a watcher, and a root path is not watched
         NotADirectoryError: Raised if path is not a directory
         NotValidDirectoryError: Raised if path to directory doesn't really exist
 
     Returns:
-        list[str]: List of strings with found coincidences
+        Iterator[custom_utils.SearchResult]: Iterator over found coincidences
     """
-    if not os.path.isdir(path):
-        raise NotADirectoryError
-    elif not os.path.exists(path):
-        raise NotValidDirectoryError(
-            message="Specified directory is not valid")
+    roots, criteria = __criteria(
+        path, string_search, ignore_case, ignore_accents, reg_exp, ext, all, only_files, only_dirs,
+        workers, ordered, glob, maxdepth, mindepth, min_size, max_size, newer, older, metadata, searcher)
+
+    if index_path:
+        import findhelp.index as index
+
+        index_path = None if index_path is True else index_path
+        index.check_indexed(roots, index_path)
+        found = __iter_index(roots, criteria, index_path, all)
+    elif watched is not None:
+        __check_watched(watched, roots, all)
+        # the table lives in this process
+        found = __iter_roots(roots, dict(criteria, watched=watched))
+    else:
+        executor = searcher._pool(processes) if searcher is not None and processes > 1 and len(roots) > 1 else None
+        # one more coincidence per root tells whether results were truncated (see '__Limited')
+        found = __iter_roots(roots, criteria, processes, None if limit is None else limit + 1, executor)
 
-    string_search = unidecode(
-        string_search) if ignore_accents else string_search
+    if limit is None:
+        return found
+    return __Limited(found, limit)
 
-    string_search = re.compile(
-        f"{string_search}") if reg_exp else string_search
 
-    _config = __config()
+def __criteria(
+        path: Union[str, list], string_search: Union[str, list, os.PathLike], ignore_case: bool,
+        ignore_accents: bool, reg_exp: bool, ext: list, all: bool, only_files: bool, only_dirs: bool,
+        workers: int = 1, ordered: bool = False, glob: bool = False, maxdepth: int = None, mindepth: int = None,
+        min_size: Union[int, str] = None, max_size: Union[int, str] = None, newer=None, older=None,
+        metadata: bool = False, searcher: "Searcher" = None) -> tuple:
+    """Gets the root paths and prepares the criteria of a search. Called from '__search' / 'go_search_many'
 
-    ignore_folders = custom_utils.sel_arg(_config, "ignore_folders")
-    if ignore_folders == None or all:
-        ignore_folders = []
+    Args:
+        Same as '__search'
 
-    ext_exclude = custom_utils.sel_arg(_config, "ignore_extensions")
+    Raises:
+        NotValidArgumentError: Raised if no root path was specified
+        NotValidArgumentError: Raised if a size / moment is not valid
+        NotValidArgumentError: Raised if an empty list / file of patterns was specified
+        NotValidArgumentError: Raised if several glob patterns were specified
+        NotADirectoryError: Raised if path is not a directory
+        NotValidDirectoryError: Raised if path to directory doesn't really exist
 
-    if ext_exclude != None:
-        if isinstance(ext_exclude, list):
-            if len(ext_exclude) == 0:
-                ext_exclude = None
-            else:
-                ext_exclude = [f".{str(ext)}".replace("..", ".").lower()
-                               for ext in ext_exclude]
+    Returns:
+        tuple: (roots, criteria) = (list[str], dict). 'criteria': keyword arguments for '__iter_elements'
+            (except 'path')
+    """
+    roots = __roots(path)
+
+    string_search = __patterns(string_search)
+    matcher = __matcher(string_search, ignore_case, ignore_accents, reg_exp, glob, searcher)
+
+    ignore_folders, ext_exclude = __ignored(all, searcher)
     if ext:
         ext_include = [f".{ext.lower()}".replace("..", ".") for ext in ext]
     else:
         ext_include = None
 
-    results = []
-
     if only_dirs:
-        results += __search_elements("folders", string_search, path,
-                                     dir_sep, ignore_case, ignore_accents, ignore_folders, output=output)
-        return results
+        search_type = "folders"
+        ext_exclude = None
+        ext_include = None
+    elif only_files:
+        search_type = "files"
+    else:
+        search_type = "both"
 
-    if only_files:
-        results += __search_elements("files", string_search, path, dir_sep, ignore_case, ignore_accents, ignore_folders,
-                                     ext_exclude=ext_exclude, ext_include=ext_include, output=output)
-        return results
+    metadata_filter = custom_utils.MetadataFilter(min_size, max_size, newer, older, metadata)
+    if not metadata_filter.filters and not metadata:
+        metadata_filter = None
 
-    results += __search_elements("both", string_search, path, dir_sep, ignore_case, ignore_accents, ignore_folders,
-                                 ext_exclude=ext_exclude, ext_include=ext_include, output=output)
-    return results
+    criteria = {
+        "search_type": search_type, "matcher": matcher, "ignore_folders": ignore_folders,
+        "ext_exclude": ext_exclude, "ext_include": ext_include, "workers": workers, "ordered": ordered, "maxdepth": maxdepth, "mindepth": mindepth,
+        "metadata": metadata_filter
+    }
+
+    if len(roots) > 1:
+        # depth limits and glob patterns are relative to each root: a nested root finds other results
+        roots = __dedupe_roots(roots, ignore_folders, nested=maxdepth is None and mindepth is None and not glob)
+
+    return roots, criteria
+
+
+def __check_watched(watched: "watcher.Watcher", roots: list, all: bool):
+    """Checks every root path is watched. Called from '__search' / 'go_search_many'
+
+    Args:
+        watched (watcher.Watcher): Watcher whose table is searched
+        roots (list): List of root paths
+        all (bool): Indicates the search ignores 'ignore_folders'
+
+    Raises:
+        NotWatchedPathError: Raised if a root path is not watched
+    """
+    for root in roots:
+        watched.rel_path(root)
+    if all and watched.ignore_folders:
+        main_logger.warning(
+            f"{watched.path} is watched ignoring folders, watch it with 'all' to search on all folders")
+
+
+def __matcher(string_search: Union[str, list], ignore_case: bool, ignore_accents: bool, reg_exp: bool,
+              glob: bool, searcher: "Searcher" = None) -> custom_utils.Matcher:
+    """Compiles the matcher of the string(s) to look for. Called from '__search'
+
+    Args:
+        string_search (Union[str, list]): The string, or the list of strings, to look for
+        ignore_case (bool): Indicates whether or not searching is case-sensitive
+        ignore_accents (bool): Ignore accents
+        reg_exp (bool): Searches by regular expresion
+        glob (bool): Searches by glob pattern
+        searcher (Searcher, optional): Session keeping the last SEARCHER_CACHE matchers. Defaults to None.
+
+    Raises:
+        NotValidArgumentError: Raised if several glob patterns were specified
+
+    Returns:
+        custom_utils.Matcher: Matcher, a 'custom_utils.MultiMatcher' / 'custom_utils.GlobMatcher' when required
+    """
+    if searcher is not None:
+        key = (tuple(string_search) if isinstance(string_search, list) else string_search,
+               ignore_case, ignore_accents, reg_exp, glob)
+        matcher = searcher._matchers.get(key)
+        if matcher is not None:
+            return matcher
+
+    if glob:
+        if not isinstance(string_search, str):
+            raise NotValidArgumentError(message="Not valid arguments, 'glob' searches a single pattern")
+        matcher = custom_utils.GlobMatcher(string_search, ignore_case, ignore_accents)
+    elif isinstance(string_search, list):
+        matcher = custom_utils.MultiMatcher(
+            string_search, ignore_case, ignore_accents, reg_exp)
+    else:
+        matcher = custom_utils.Matcher(
+            string_search, ignore_case, ignore_accents, reg_exp)
+
+    if searcher is not None:
+        if len(searcher._matchers) >= SEARCHER_CACHE:
+            # drops the oldest one
+            searcher._matchers.pop(next(iter(searcher._matchers)), None)
+        searcher._matchers[key] = matcher
+    return matcher
+
+
+def __ignored(all: bool, searcher: "Searcher" = None) -> tuple:
+    """Gets the folders and extensions ignored by 'config.yaml'. Called from '__search'
+
+    Args:
+        all (bool): Searches on all folders, ignores 'ignore_folders'
+        searcher (Searcher, optional): Session keeping them until 'config.yaml' changes. Defaults to None.
+
+    Returns:
+        tuple: (ignore_folders, ext_exclude) = (list[str], list[str]). 'ext_exclude' lowercase and starting
+            with '.', None if no extension is ignored
+    """
+    _config = __config()
+    if searcher is not None and searcher._ignored[0] is _config:
+        ignore_folders, ext_exclude = searcher._ignored[1:]
+    else:
+        ignore_folders = custom_utils.sel_arg(_config, "ignore_folders")
+        if ignore_folders == None:
+            ignore_folders = []
+
+        ext_exclude = custom_utils.sel_arg(_config, "ignore_extensions")
+
+        if ext_exclude != None:
+            if isinstance(ext_exclude, list):
+                if len(ext_exclude) == 0:
+                    ext_exclude = None
+                else:
+                    ext_exclude = [f".{str(ext)}".replace("..", ".").lower()
+                                   for ext in ext_exclude]
+
+        if searcher is not None:
+            searcher._ignored = (_config, ignore_folders, ext_exclude)
+
+    if all:
+        ignore_folders = []
+    return ignore_folders, ext_exclude
+
+
+class __Limited:
+    """Iterator over the first 'limit' coincidences of a search, then stops it. Built by '__search'
+
+    Once 'limit' coincidences were yielded, asking for the next one looks for one more coincidence
+    (walking on until found) to tell whether the results were truncated, then closes the search.
+
+    Attributes:
+        truncated (bool): Indicates the search had more than 'limit' coincidences, set once exhausted
+    """
+
+    def __init__(self, found, limit: int):
+        """
+        Args:
+            found (Iterator[custom_utils.SearchResult]): Iterator over found coincidences (a generator)
+            limit (int): Maximum number of coincidences
+        """
+        self.found = found
+        self.remaining = limit
+        self.truncated = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.remaining > 0:
+            try:
+                result = next(self.found)
+            except BaseException:
+                self.close()
+                raise
+            self.remaining -= 1
+            return result
+
+        if self.found is not None:
+            self.truncated = next(self.found, None) is not None
+            self.close()
+        raise StopIteration
+
+    def close(self):
+        """Stops the search right away (drops the directories queued to the threads)"""
+        if self.found is not None:
+            self.found.close()
+            self.found = None
+
+
+def __iter_index(roots: list, criteria: dict, index_path: str = None, all: bool = False):
+    """Searches every root path answering from the index, yielding coincidences. Called from '__search'
+
+    Args:
+        roots (list): List of root paths, already indexed
+        criteria (dict): Keyword arguments for '__iter_elements' (except 'path'), shared by every root
+        index_path (str, optional): Path to the SQLite database file. Defaults to the default index file.
+        all (bool, optional): Indicates the search ignores 'ignore_folders'. Defaults to False.
+
+    Yields:
+        custom_utils.SearchResult: Each found coincidence
+    """
+    import findhelp.index as index
+
+    criteria = {key: value for key, value in criteria.items()
+                if key not in ("workers", "ordered")}
+
+    for root in roots:
+        yield from index.iter_elements(path=root, index_path=index_path, all=all, **criteria)
+
+
+def __iter_roots(roots: list, criteria: dict, processes: int = 1, limit: int = None,
+                 executor: "ProcessPoolExecutor" = None):
+    """Searches every root path, yielding coincidences as found. Called from '__search'
+
+    Args:
+        roots (list): List of root paths
+        criteria (dict): Keyword arguments for '__iter_elements' (except 'path'), shared by every root
+        processes (int, optional): Number of processes sharing the roots. Defaults to 1.
+            Each process sends back the coincidences of a whole root, in roots order.
+        limit (int, optional): Maximum number of coincidences each process sends back per root. Defaults to None.
+        executor (ProcessPoolExecutor, optional): Process pool of a 'Searcher', kept between searches.
+            Defaults to None (a pool is started for this search).
+
+    Yields:
+        custom_utils.SearchResult: Each found coincidence
+    """
+    if processes > 1 and len(roots) > 1:
+        if executor is not None:
+            # the pool outlives the search: criteria are sent with every root
+            yield from __future_results([executor.submit(__search_worker, root, criteria, limit) for root in roots])
+            return
+
+        # multiprocessing is loaded only when searching with several processes
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(processes, len(roots)), initializer=__init_search_worker,
+                                 initargs=(criteria, limit)) as executor:
+            yield from __future_results([executor.submit(__search_worker, root) for root in roots])
+        return
+
+    for root in roots:
+        yield from __iter_elements(path=root, **criteria)
+
+
+def __future_results(futures: list):
+    """Yields the coincidences sent back by each worker process, in roots order. Called from '__iter_roots'
+
+    Args:
+        futures (list[concurrent.futures.Future]): Search of each root, see '__search_worker'
+
+    Yields:
+        custom_utils.SearchResult: Each found coincidence
+    """
+    try:
+        for future in futures:
+            yield from future.result()
+    finally:
+        # consumer may stop early: roots not started yet are not searched
+        for future in futures:
+            future.cancel()
+
+
+def __roots(path: Union[str, list]) -> list:
+    """Gets the list of root paths to search. Called from '__search'
+
+    Args:
+        path (Union[str, list]): A root path, a list of root paths
+            or a text file containing one root path per line (empty lines and lines starting with '#' are skipped)
+
+    Raises:
+        NotValidArgumentError: Raised if no root path was specified
+        NotADirectoryError: Raised if any root path is not a directory
+        NotValidDirectoryError: Raised if path to directory doesn't really exist
+
+    Returns:
+        list[str]: List of root paths
+    """
+    if isinstance(path, (list, tuple)):
+        roots = [str(root) for root in path]
+    elif os.path.isfile(path):
+        with open(path, "r", encoding="utf-8") as f:
+            roots = [line.strip() for line in f]
+        roots = [root for root in roots if root and not root.startswith("#")]
+    else:
+        roots = [path]
+
+    if len(roots) == 0:
+        raise NotValidArgumentError(message="No root path to search was specified")
+
+    for root in roots:
+        if not os.path.isdir(root):
+            raise NotADirectoryError(f"path: {root} is not a valid directory")
+        elif not os.path.exists(root):
+            raise NotValidDirectoryError(
+                message="Specified directory is not valid")
+
+    return roots
+
+
+def __patterns(string_search: Union[str, list, os.PathLike]) -> Union[str, list]:
+    """Gets the string(s) to look for. Called from '__search'
+
+    Args:
+        string_search (Union[str, list, os.PathLike]): A string, a list of strings
+            or a text file (os.PathLike, e.g. pathlib.Path) containing one string per line (empty lines are skipped)
+
+    Raises:
+        NotValidArgumentError: Raised if the list / file contains no string
+
+    Returns:
+        Union[str, list]: The string, or the list of strings
+    """
+    if isinstance(string_search, os.PathLike):
+        with open(string_search, "r", encoding="utf-8") as f:
+            string_search = [line.rstrip("\r\n") for line in f]
+        string_search = [pattern for pattern in string_search if pattern.strip()]
+    elif isinstance(string_search, tuple):
+        string_search = list(string_search)
+
+    if isinstance(string_search, list) and len(string_search) == 0:
+        raise NotValidArgumentError(message="No string to search for was specified")
+
+    return string_search
+
+
+def __dedupe_roots(roots: list, ignore_folders: list, nested: bool = True) -> list:
+    """Drops duplicated root paths and root paths already contained within another root. Called from '__criteria'
+
+    A nested root is kept if it is inside an ignored folder of its parent root, because its parent won't reach it.
+
+    Args:
+        roots (list): List of root paths
+        ignore_folders (list): Folders ignored while searching
+        nested (bool, optional): Also drops roots contained within another one. Only when every root finds the
+            same coincidences below it (no 'maxdepth' / 'mindepth' / 'glob'). Defaults to True.
+
+    Returns:
+        list[str]: List of root paths, in the same order they were passed
+    """
+    real_roots = [os.path.realpath(root) for root in roots]
+    deduped = []
+    seen = set()
+
+    for root, real_root in zip(roots, real_roots):
+        if real_root in seen:
+            continue
+
+        contained = False
+        for other in real_roots if nested else ():
+            if other == real_root or not real_root.startswith(other.rstrip(os.sep) + os.sep):
+                continue
+            relative_parts = os.path.relpath(real_root, other).split(os.sep)
+            if not any(part in ignore_folders for part in relative_parts):
+                contained = True
+                break
 
+        if not contained:
+            seen.add(real_root)
+            deduped.append(root)
 
-def __get_results(results: list, output_type: str, delimiter: str, search_args: dict,
-                  time_start: datetime, time_end: datetime, total_time: float,
-                  output_path: str, output_filename):
+    return deduped
+
+
+# Search criteria (and limit) of the current worker process, set once by '__init_search_worker'
+_worker_criteria = None
+_worker_limit = None
+
+
+def __init_search_worker(criteria: dict, limit: int = None):
+    """Initializes a worker process for multiple roots searching. Called from '__iter_roots'
+
+    Args:
+        criteria (dict): Keyword arguments for '__iter_elements' (except 'path'), shared by every root
+        limit (int, optional): Maximum number of coincidences per root. Defaults to None.
+    """
+    # 'criteria' arrives pickled: its matcher is compiled here, once per worker process
+    global _worker_criteria, _worker_limit
+    _worker_criteria = criteria
+    _worker_limit = limit
+
+
+def __search_worker(root: str, criteria: dict = None, limit: int = None) -> list:
+    """Searches a single root path within a worker process. Called from '__iter_roots'
+
+    Args:
+        root (str): Root path to look for
+        criteria (dict, optional): Keyword arguments for '__iter_elements' (except 'path').
+            Defaults to None (the ones the worker process was initialized with, see '__init_search_worker').
+        limit (int, optional): Maximum number of coincidences, if 'criteria' is specified. Defaults to None.
+
+    Returns:
+        list: Found coincidences within 'root'
+    """
+    if criteria is None:
+        criteria, limit = _worker_criteria, _worker_limit
+    if limit is not None:
+        return list(itertools.islice(__iter_elements(path=root, **criteria), limit))
+    return __search_elements(path=root, **criteria)
+
+
+def __get_results(results: list, output_type: str, search_args: dict, truncated: bool = False):
     """Turns the results list into the selected choice
 
     Args:
-        results (list): List containing all the coincidences found
-        output_type (str): Defines how to get the final output {console, txt, csv, json, df, obj_list, list}
-            (df = pandas.DataFrame)
-        delimiter (str): Delimiter used for {txt, csv, json} output
-        search_args (dict): Arguments used for searching. Will be stored in file if output_type = 'json'
-        time_start (datetime): Time when search began
-        time_end (datetime): Time when search ended
-        total_time (float): Difference between time_end and time_start
-        output_path (str): Path in which the results file will be located. Default current directory.
-        output_filename (str): Name of file in which results will be stored. Default search_results_yyyymmdd_hh_mm_ss 
-
-    Returns:
-        object: Returns a boolean if output_type in {'console', 'txt', 'csv', 'json'} 
-            and prints the results to the actual choice
-            Returns the selected object if output_type in {'obj_list', 'list', 'df'}
+        results (list[custom_utils.SearchResult]): List containing all the coincidences found.
+            They take the output shape here. For 'df' output, a 'custom_utils.ResultColumns' instead
+        output_type (str): Defines how to get the final output {df, obj_list, list} (df = pandas.DataFrame).
+            Console and files (STREAMED_OUTPUTS) are written while searching, see '__print_results' /
+            '__stream_results'
+        search_args (dict): Arguments used for searching
+        truncated (bool, optional): Indicates the search had more coincidences than its 'limit'. It is stored in
+            'DataFrame.attrs' and 'custom_utils.ResultList' and logged for every output. Defaults to False.
+
+    Returns:
+        object: Returns the selected object if output_type in {'obj_list', 'list', 'df'}
             (df = pandas.DataFrame)
 
     """
@@ -220,81 +805,125 @@ def __get_results(results: list, output_type: str, delimiter: str, search_args:
 
     output_type = output_type.lower()
 
-    if output_type == "console":
-        results.insert(0, HEADER_RESULT)
-        max_l = [max(map(custom_utils.find_len, [results[outer_ind][ind] for outer_ind in range(len(results))])) + 1
-                 for ind in range(len(results[0]))]
+    if truncated:
+        main_logger.warning(
+            f"Search stopped at {len(results)} coincidence(s) ('limit'), results were truncated")
 
-        for result in results:
-            print(custom_utils.parse_line(result, max_l))
-        return (len(results) - 1)
+    dir_sep = search_args.get("directoryseparator", "/")
 
-    elif output_type.lower() in ["df"]:
-        return pd.DataFrame(results)
-    elif output_type in ["obj_list", "list"]:
-        return results
-    else:
-        output_fullpath = custom_utils.forcedir_sep(os.path.join(
-            output_path, f"{output_filename}.{output_type}"), "/")
-
-        if output_type in ("txt", "csv"):
-            with open(f"{output_fullpath}", "w", newline="\n", encoding="utf-8") as new_file:
-                csv_writer = csv.writer(new_file, delimiter=delimiter)
-                headers = list(results[0].keys())
-                csv_writer.writerow(headers)
-
-                for result in results:
-                    line = list(result.values())
-                    csv_writer.writerow(line)
-
-        if output_type in ("json"):
-            export_dict = {
-                "search_args": search_args,
-                "start": time_start,
-                "end": time_end,
-                "total_time_seconds": total_time,
-                "results": results
-            }
-            with open(f"{output_fullpath}", "w", encoding="utf-8") as new_file:
-                json.dump(export_dict, new_file, indent=2, ensure_ascii=False)
-        main_logger.info(f"Exported {output_fullpath}")
+    if output_type.lower() in ["df"]:
+        if not isinstance(results, custom_utils.ResultColumns):
+            columns = custom_utils.ResultColumns(dir_sep)
+            columns.extend(results)
+            results = columns
+        df = __data_frame(results)
+        df.attrs["truncated"] = truncated
+        return df
+    elif output_type == "obj_list":
+        return custom_utils.ResultList(custom_utils.convert_results(results, "dict", dir_sep), truncated)
+    elif output_type == "list":
+        return custom_utils.ResultList(custom_utils.convert_results(results, "list", dir_sep), truncated)
 
-        return (len(results) - 1)
 
+def __data_frame(columns: custom_utils.ResultColumns) -> "pd.DataFrame":
+    """Builds the DataFrame of the results, column by column. Called from '__get_results'
 
-def go_search(args_dict):
-    """Searches for files / folders in the specified 'path'.
+    'type', 'folder_parent', 'folder_name' and 'ext' are categorical (categories sorted),
+    so the frame is built without a per row object and takes far less memory.
 
     Args:
-        args_dict (dict): Dictionary containing all the specification to perform the search.                
-            path (str): Root path to look for, default = current directory
-            stringsearch (str): The string to look for
-            ignorecase (bool): Indicates whether or not searching is case-sensitive
-            ignoreaccents (bool): Ignore accents
-            regexp (bool): Searches by regular expresion
-            ext (list[str]): List of extensions to limit the search
-            all (bool): Searches on all folders, ignores 'ignore_folders' switch on 'config.yaml'
-            onlyfiles (bool): Searches only for files (not directories)
-            onlydirs (bool): Searches only for directories (not files)
-            directoryseparator (str): Just for results purposes: which separator use for paths
-            output (str): {console,txt,csv,json,df,obj_list,list}
-                Indicates if results appears on console or are written to a file
-            delimiter (str): Delimiter used for exporting, when output is different than 'console'
-            outputpath (str): Path in which the results file will be located. Default current directory.
-            outputfilename (str): Name of file in which results will be stored. Default search_results_yyyymmdd_hh_mm_ss 
+        columns (custom_utils.ResultColumns): Found coincidences, stored by columns
+
+    Returns:
+        pd.DataFrame: Results, same columns than the other outputs
+    """
+    # only 'df' output loads pandas
+    import pandas as pd
+
+    data = {}
+    for name in HEADER_RESULT:
+        if name in columns.CATEGORICAL:
+            data[name] = __categorical(columns.codes[name], columns.categories[name])
+        else:
+            data[name] = getattr(columns, name)
+
+    if columns.size is not None:
+        data["size"] = columns.size
+        data["mtime"] = columns.mtime
+    if columns.patterns is not None:
+        data["patterns"] = columns.patterns
+
+    return pd.DataFrame(data, columns=list(data))
+
+
+def __categorical(codes, categories: dict) -> "pd.Categorical":
+    """Builds a categorical column from its codes. Called from '__data_frame'
+
+    Args:
+        codes (array.array): Code of each value (-1 for missing values)
+        categories (dict): {value: code}, codes numbered in found order
+
+    Returns:
+        pd.Categorical: Categorical column, its categories sorted
+    """
+    import numpy as np
+    import pandas as pd
+
+    values = list(categories)
+    codes = np.asarray(codes, dtype=np.int64)
+    if values:
+        order = sorted(range(len(values)), key=values.__getitem__)
+        # found order code -> sorted code, missing values (-1) kept
+        remap = np.empty(len(values) + 1, dtype=np.int64)
+        remap[order] = np.arange(len(values))
+        remap[-1] = -1
+        codes = remap[codes]
+        values = [values[code] for code in order]
+
+    return pd.Categorical.from_codes(codes, categories=values)
+
+
+def __header(results: list, search_args: dict) -> list:
+    """Column names of the results. Called from '__get_results'
+
+    Args:
+        results (list[custom_utils.SearchResult]): List containing all the coincidences found
+        search_args (dict): Arguments used for searching
+
+    Returns:
+        list[str]: HEADER_RESULT, plus 'size' / 'mtime' and 'patterns' when coincidences have them
+    """
+    header = HEADER_RESULT + (["size", "mtime"] if search_args.get("metadata") else [])
+    if results and results[0].patterns is not None:
+        header = header + ["patterns"]
+    return header
+
+
+def __check_args(args_dict: dict) -> dict:
+    """Fills the missing arguments with their default values and validates them.
+    Called from 'iter_search' / 'go_search'
+
+    Args:
+        args_dict (dict): Dictionary containing all the specification to perform the search. See 'go_search'
 
     Raises:
+        NotADirectoryError: Raised if outputpath is not a directory
+        MissingFilename: Raised if outputfilename is an empty string
         NotValidArgumentError: 'onlydirs' and 'onlyfolders' can't be True simultaneously
+        NotValidArgumentError: 'regexp' and 'glob' can't be True simultaneously
         NotValidArgumentError: If 'stringsearch' was not specified, 'ext' or 'onlydirs' or 'onlyfiles' must be passed
-        NotADirectoryError: Raised if path is not a directory
-        NotValidDirectoryError: Raised if path to directory doesn't really exist
-    """
-
-    # Compute start time
-    time_start = datetime.datetime.now()
-    start_search = time.perf_counter()
-    main_logger.info(f"Searching for: {args_dict} , please wait...")
+        NotValidArgumentError: 'workers' and 'processes' must be positive integers
+        NotValidArgumentError: 'maxdepth' and 'mindepth' must be positive integers, 'mindepth' <= 'maxdepth'
+        NotValidArgumentError: 'minsize', 'maxsize', 'newer' and 'older' must be valid sizes / moments
+        NotValidArgumentError: 'limit' must be a positive integer
+        NotValidArgumentError: 'output' must be one of OUTPUTS
+        MissingDependencyError: 'parquet' and 'arrow' outputs require pyarrow
+        NotValidArgumentError: 'watcher' must be a 'watcher.Watcher' (see 'watch')
+        NotValidArgumentError: 'searcher' must be a 'Searcher'
 
+    Returns:
+        dict: The same 'args_dict', completed
+    """
     # Checking arguments
     # When called from console, argparse makes validation, when called from other module, it is necessary to check
     ks = args_dict.keys()
@@ -302,8 +931,12 @@ def go_search(args_dict):
     defaults = {"path": os.getcwd(), "stringsearch": "", "ignorecase": False,
                 "ignoreaccents": False, "regexp": False, "ext": None, "all": False,
                 "onlyfiles": False, "onlydirs": False, "directoryseparator": "/",
-                "output": "console", "outputpath": ".", "outputfilename": date_now,
-                "delimiter": "\t"}
+                "output": "console", "outputpath": ".",
+                "outputfilename": datetime.datetime.now().strftime("%Y%m%d_%H_%M_%S"),
+                "delimiter": "\t", "workers": 1, "ordered": False,
+                "processes": 1, "index": None, "watcher": None, "glob": False,
+                "maxdepth": None, "mindepth": None, "minsize": None, "maxsize": None,
+                "newer": None, "older": None, "metadata": False, "limit": None, "searcher": None}
 
     for key, value in defaults.items():
         if key not in ks:
@@ -322,69 +955,1341 @@ def go_search(args_dict):
         args_dict["outputfilename"] = custom_utils.force_filename(
             args_dict["outputfilename"])
 
+    if isinstance(args_dict["output"], str):
+        args_dict["output"] = args_dict["output"].lower()
+    if args_dict["output"] not in OUTPUTS:
+        raise NotValidArgumentError(
+            message=f"Not valid arguments, 'output' must be one of: {', '.join(OUTPUTS)}")
+    if args_dict["output"] in ARROW_OUTPUTS:
+        # before searching
+        __import_pyarrow()
+
     if (args_dict["onlyfiles"] & args_dict["onlydirs"]):
         raise NotValidArgumentError(
             message="Not valid arguments, forbidden combination: onlyfiles=True and onlydirs=True")
 
-    if args_dict["stringsearch"] == "":
-        if ((not args_dict["ext"]) & (not args_dict["onlydirs"]) & (not args_dict["onlyfiles"])):
-            raise NotValidArgumentError(message="Not a valid combination to search for:"
-                                        "\nUsing 'stringsearch'='' requires specifying 'onlydirs' or ('onlyfiles' and/or 'ext')")
-
-    # The actual searching
-    search_results = __search(
-        path=args_dict["path"], string_search=args_dict["stringsearch"], ignore_case=args_dict["ignorecase"],
-        ignore_accents=args_dict["ignoreaccents"], reg_exp=args_dict["regexp"], ext=args_dict["ext"],
-        all=args_dict["all"], only_files=args_dict["onlyfiles"], only_dirs=args_dict["onlydirs"], dir_sep=args_dict["directoryseparator"],
-        output=args_dict["output"]
-    )
+    if (args_dict["regexp"] & args_dict["glob"]):
+        raise NotValidArgumentError(
+            message="Not valid arguments, forbidden combination: regexp=True and glob=True")
 
-    # Compute time end
-    time_end = datetime.datetime.now()
-    end_search = time.perf_counter()
+    # bool is an int subclass: True would pass as 1
+    for key in ("workers", "processes"):
+        if isinstance(args_dict[key], bool) or not isinstance(args_dict[key], int) or args_dict[key] < 1:
+            raise NotValidArgumentError(
+                message=f"Not valid arguments, '{key}' must be an integer greater than 0")
 
-    # Compute total time
-    time_start_str = time_start.strftime("%Y/%m/%d, %H:%M:%S.%f")
-    time_end_str = time_end.strftime("%Y/%m/%d, %H:%M:%S.%f")
-    total_time = end_search - start_search
+    for key in ("maxdepth", "mindepth", "limit"):
+        if args_dict[key] is not None and (isinstance(args_dict[key], bool) or not isinstance(args_dict[key], int)
+                                           or args_dict[key] < 1):
+            raise NotValidArgumentError(
+                message=f"Not valid arguments, '{key}' must be an integer greater than 0")
 
-    main_logger.info(
-        f"{len(search_results)} coincidences found in {round(total_time, 2)} second(s)")
+    if args_dict["maxdepth"] is not None and args_dict["mindepth"] is not None:
+        if args_dict["mindepth"] > args_dict["maxdepth"]:
+            raise NotValidArgumentError(
+                message="Not valid arguments, 'mindepth' can't be greater than 'maxdepth'")
 
-    # Export / show results
-    return __get_results(search_results, args_dict["output"], args_dict["delimiter"], args_dict,
-                         time_start_str, time_end_str, total_time, args_dict["outputpath"], args_dict["outputfilename"])
+    if args_dict["watcher"] is not None:
+        import findhelp.watcher as watcher
 
+        if not isinstance(args_dict["watcher"], watcher.Watcher):
+            raise NotValidArgumentError(
+                message="Not valid arguments, 'watcher' must be a Watcher, see 'watch'")
 
-def __config():
-    """Reads 'config.yaml' 
+    if args_dict["searcher"] is not None and not isinstance(args_dict["searcher"], Searcher):
+        raise NotValidArgumentError(
+            message="Not valid arguments, 'searcher' must be a Searcher")
 
-    Returns:
-        dict: Dictionary with configuration located in 'config.yaml' (ignore_folders + ignore_extensions)
+    if args_dict["stringsearch"] == "":
+        if ((not args_dict["ext"]) & (not args_dict["onlydirs"]) & (not args_dict["onlyfiles"])):
+            raise NotValidArgumentError(message="Not a valid combination to search for:"
+                                        "\nUsing 'stringsearch'='' requires specifying 'onlydirs' or ('onlyfiles' and/or 'ext')")
 
-    """
-    with open(CONFIG_PATH, "r") as f:
-        _config = yaml.safe_load(f)
+    return args_dict
 
-    return _config
 
+def iter_search(args_dict):
+    """Searches for files / folders in the specified 'path', yielding each coincidence as soon as it is found.
 
-def set_ignore_folders(ignore_list=None):
-    """Sets config.yaml 'ignore_folders' list
+    Nothing is stored, so memory stays constant no matter how many coincidences are found.
 
     Args:
-        ignore_list (list[str], optional): List of folders to be ignored in future searches. 
+        args_dict (dict): Dictionary containing all the specification to perform the search.
+            Same keys and defaults than 'go_search'
+
+    Raises:
+        NotValidArgumentError: 'onlydirs' and 'onlyfolders' can't be True simultaneously
+        NotValidArgumentError: 'regexp' and 'glob' can't be True simultaneously
+        NotValidArgumentError: If 'stringsearch' was not specified, 'ext' or 'onlydirs' or 'onlyfiles' must be passed
+        NotValidArgumentError: 'workers' and 'processes' must be positive integers
+        NotValidArgumentError: 'maxdepth' and 'mindepth' must be positive integers, 'mindepth' <= 'maxdepth'
+        NotValidArgumentError: 'minsize', 'maxsize', 'newer' and 'older' must be valid sizes / moments
+        NotValidArgumentError: 'limit' must be a positive integer
+        NotValidArgumentError: 'output' must be one of OUTPUTS
+        MissingDependencyError: 'parquet' and 'arrow' outputs require pyarrow
+        NotADirectoryError: Raised if path is not a directory
+        NotValidDirectoryError: Raised if path to directory doesn't really exist
+        NotIndexedPathError: Raised if 'index' is specified, and path was not indexed
+        NotWatchedPathError: Raised if 'watcher' is specified, and path is not watched
+
+    Returns:
+        Iterator[list | dict]: Iterator over found coincidences.
+            Each one is a list if 'output' in {console, list}, a dictionary otherwise (see 'custom_utils.join_result')
+    """
+    found = __iter_results(args_dict)
+
+    return __convert(found, args_dict["output"], args_dict["directoryseparator"])
+
+
+def __iter_results(args_dict: dict):
+    """Validates the arguments and prepares the search. Called from 'iter_search' / 'go_search'
+
+    Args:
+        args_dict (dict): Dictionary containing all the specification to perform the search. See 'go_search'
+
+    Returns:
+        Iterator[custom_utils.SearchResult]: Iterator over found coincidences
+    """
+    __check_args(args_dict)
+
+    return __search(**__search_args(args_dict))
+
+
+def __search_args(args_dict: dict) -> dict:
+    """Maps the (checked) arguments of a search to '__search' keyword arguments.
+    Called from '__iter_results' / 'go_search_many'
+
+    Args:
+        args_dict (dict): Dictionary containing all the specification to perform the search. See 'go_search'
+
+    Returns:
+        dict: Keyword arguments for '__search'
+    """
+    return dict(
+        path=args_dict["path"], string_search=args_dict["stringsearch"], ignore_case=args_dict["ignorecase"],
+        ignore_accents=args_dict["ignoreaccents"], reg_exp=args_dict["regexp"], ext=args_dict["ext"],
+        all=args_dict["all"], only_files=args_dict["onlyfiles"], only_dirs=args_dict["onlydirs"],
+        workers=args_dict["workers"], ordered=args_dict["ordered"],
+        processes=args_dict["processes"], index_path=args_dict["index"], watched=args_dict["watcher"],
+        glob=args_dict["glob"], maxdepth=args_dict["maxdepth"], mindepth=args_dict["mindepth"],
+        min_size=args_dict["minsize"], max_size=args_dict["maxsize"], newer=args_dict["newer"],
+        older=args_dict["older"], metadata=args_dict["metadata"], limit=args_dict["limit"],
+        searcher=args_dict["searcher"]
+    )
+
+
+def __convert(found, output: str, dir_sep: str):
+    """Turns each found coincidence into its output shape. Called from 'iter_search'
+
+    Args:
+        found (Iterator[custom_utils.SearchResult]): Iterator over found coincidences
+        output (str): {console,txt,csv,json,ndjson,parquet,arrow,df,obj_list,list}
+        dir_sep (str): Separator forced on paths
+
+    Yields:
+        list | dict: Each found coincidence, a list if 'output' in {console, list}, a dictionary otherwise
+    """
+    try:
+        yield from custom_utils.convert_results(found, "list" if output in ("console", "list") else "dict", dir_sep)
+    finally:
+        found.close()
+
+
+def go_search(args_dict):
+    """Searches for files / folders in the specified 'path'.
+
+    Args:
+        args_dict (dict): Dictionary containing all the specification to perform the search.                
+            path (Union[str, list]): Root path to look for, default = current directory.
+                It can also be a list of root paths or a text file containing one root path per line
+            stringsearch (Union[str, list, os.PathLike]): The string to look for. It can also be a list of strings
+                or a text file (os.PathLike, e.g. pathlib.Path) containing one string per line: all of them are
+                searched at once, and each coincidence is tagged with the ones it matched ('patterns')
+            ignorecase (bool): Indicates whether or not searching is case-sensitive
+            ignoreaccents (bool): Ignore accents
+            regexp (bool): Searches by regular expresion
+            glob (bool): Searches by glob pattern, matched against paths relative to 'path'
+                (e.g. 'src/**/tests/*.py'). Folders that can't lead to a match are not walked. Default False
+            maxdepth (int): Deepest level of coincidences, 1 = files / folders within 'path'.
+                Deeper folders are not walked. Default None (no limit)
+            mindepth (int): Coincidences at upper levels are skipped, 1 = files / folders within 'path'.
+                Default None (no limit)
+            minsize (Union[int, str]): Minimum size of files, bytes or a string like '10K', '1.5G'.
+                Folders are skipped when filtering by size. Default None
+            maxsize (Union[int, str]): Maximum size of files, same as 'minsize'. Default None
+            newer (Union[datetime.datetime, datetime.timedelta, str]): Modified at / after this moment:
+                a date / datetime, a time ago (timedelta, or a string like '12h', '7d', '2w') or an ISO date string.
+                Default None
+            older (Union[datetime.datetime, datetime.timedelta, str]): Modified before this moment, same as 'newer'.
+                Default None
+            metadata (bool): Adds 'size' (bytes) and 'mtime' (datetime) to each coincidence, after 'ext'. Default False
+            limit (int): Stops searching (walking included) as soon as this number of coincidences is found,
+                and one more: it tells whether results were truncated, reported on every output
+                (see '__get_results'). Default None (no limit)
+            ext (list[str]): List of extensions to limit the search
+            all (bool): Searches on all folders, ignores 'ignore_folders' switch on 'config.yaml'
+            onlyfiles (bool): Searches only for files (not directories)
+            onlydirs (bool): Searches only for directories (not files)
+            directoryseparator (str): Just for results purposes: which separator use for paths
+            output (str): {console,txt,csv,json,ndjson,parquet,arrow,df,obj_list,list}
+                Indicates if results appears on console or are written to a file.
+                Files are written while searching, see '__stream_results'
+            delimiter (str): Delimiter used for exporting, when output is different than 'console'
+            outputpath (str): Path in which the results file will be located. Default current directory.
+            outputfilename (str): Name of file in which results will be stored. Default search_results_yyyymmdd_hh_mm_ss 
+            workers (int): Number of threads listing directories in parallel. Default 1 (no thread pool)
+            ordered (bool): If workers > 1, returns results in the same order than a single threaded search
+            processes (int): Number of processes sharing the root paths, when searching several. Default 1
+            index (Union[str, bool]): Answers from the index stored in this SQLite file, instead of walking
+                the directory tree (True for the default index file). See 'build_index'. Default None
+            watcher (watcher.Watcher): Searches the in-memory table kept up to date by this watcher,
+                instead of walking the directory tree. See 'watch'. Default None
+            searcher (Searcher): Session reusing what previous searches prepared. Set by 'Searcher.search'.
+                Default None
+
+    Raises:
+        NotValidArgumentError: 'onlydirs' and 'onlyfolders' can't be True simultaneously
+        NotValidArgumentError: 'regexp' and 'glob' can't be True simultaneously
+        NotValidArgumentError: If 'stringsearch' was not specified, 'ext' or 'onlydirs' or 'onlyfiles' must be passed
+        NotValidArgumentError: 'workers' and 'processes' must be positive integers
+        NotValidArgumentError: 'maxdepth' and 'mindepth' must be positive integers, 'mindepth' <= 'maxdepth'
+        NotValidArgumentError: 'minsize', 'maxsize', 'newer' and 'older' must be valid sizes / moments
+        NotValidArgumentError: 'limit' must be a positive integer
+        NotValidArgumentError: 'output' must be one of OUTPUTS
+        MissingDependencyError: 'parquet' and 'arrow' outputs require pyarrow
+        NotADirectoryError: Raised if path is not a directory
+        NotValidDirectoryError: Raised if path to directory doesn't really exist
+        NotIndexedPathError: Raised if 'index' is specified, and path was not indexed
+        NotWatchedPathError: Raised if 'watcher' is specified, and path is not watched
+    """
+
+    # Compute start time
+    time_start = datetime.datetime.now()
+    start_search = time.perf_counter()
+    main_logger.info(f"Searching for: {args_dict} , please wait...")
+
+    # The actual searching: coincidences are kept compact, they take their output shape in '__get_results'
+    found = __iter_results(args_dict)
+    return __output(found, args_dict, time_start, start_search)
+
+
+def __output(found, args_dict: dict, time_start: datetime.datetime, start_search: float):
+    """Consumes the found coincidences into the selected output. Called from 'go_search' / 'go_search_many'
+
+    Args:
+        found (Iterator[custom_utils.SearchResult]): Iterator over found coincidences (a generator, it is closed)
+        args_dict (dict): Arguments used for searching, checked
+        time_start (datetime.datetime): When search started
+        start_search (float): 'time.perf_counter' when search started
+
+    Returns:
+        object: See 'go_search'
+    """
+    if args_dict["output"] == "console":
+        # printed while searching
+        return __print_results(found, args_dict, start_search)
+    if args_dict["output"] in STREAMED_OUTPUTS:
+        # written while searching, nothing is kept
+        return __stream_results(found, args_dict, time_start, start_search)
+    if args_dict["output"] == "df":
+        # stored by columns as found, the DataFrame is built from them
+        search_results = custom_utils.ResultColumns(args_dict["directoryseparator"])
+        search_results.extend(found)
+    else:
+        search_results = list(found)
+
+    # Compute total time
+    total_time = time.perf_counter() - start_search
+
+    main_logger.info(
+        f"{len(search_results)} coincidences found in {round(total_time, 2)} second(s)")
+
+    # Show / return results
+    return __get_results(search_results, args_dict["output"], args_dict, getattr(found, "truncated", False))
+
+
+def go_search_many(args_list: list) -> list:
+    """Runs several searches, walking each root path once for all the searches sharing it.
+
+    Searches with the same root paths and ignored folders ('path', 'all'), and the same 'workers', 'ordered'
+    and 'watcher', are grouped: their roots are walked once, and each directory listing is checked against
+    the criteria of every search of the group. A folder is walked if any search of the group walks it
+    ('maxdepth' / 'glob' pruning), and the walk stops once every search reached its 'limit'.
+    Searches answered from an index ('index') or sharding their roots between processes ('processes' > 1)
+    run on their own, as 'go_search'.
+
+    Args:
+        args_list (list[dict]): Dictionaries of the searches, same keys and defaults than 'go_search'
+
+    Raises:
+        Same as 'go_search'. Arguments of every search are checked before searching
+
+    Returns:
+        list: The result of each search, in the same order, in its own 'output' (see 'go_search')
+    """
+    time_start = datetime.datetime.now()
+    start_search = time.perf_counter()
+    main_logger.info(f"Searching for {len(args_list)} queries, please wait...")
+
+    groups = {}
+    for position, args_dict in enumerate(args_list):
+        __check_args(args_dict)
+        search_args = __search_args(args_dict)
+        if search_args["index_path"] or search_args["processes"] > 1:
+            continue
+
+        limit = search_args.pop("limit")
+        watched = search_args.pop("watched")
+        del search_args["index_path"], search_args["processes"]
+        roots, criteria = __criteria(**search_args)
+        if watched is not None:
+            __check_watched(watched, roots, args_dict["all"])
+
+        key = (tuple(roots), tuple(criteria["ignore_folders"]), criteria["workers"], criteria["ordered"], watched)
+        groups.setdefault(key, []).append((position, criteria, limit))
+
+    found = {}
+    for (roots, ignore_folders, workers, ordered, watched), queries in groups.items():
+        group_found = __walk_many(list(roots), ignore_folders, [query[1:] for query in queries],
+                                  workers, ordered, watched)
+        for (position, _, _), query_found in zip(queries, group_found):
+            found[position] = query_found
+
+    results = []
+    for position, args_dict in enumerate(args_list):
+        if position in found:
+            query_found = (result for result in found.pop(position))
+            if args_dict["limit"] is not None:
+                query_found = __Limited(query_found, args_dict["limit"])
+            results.append(__output(query_found, args_dict, time_start, start_search))
+        else:
+            results.append(go_search(args_dict))
+    return results
+
+
+def __walk_many(roots: list, ignore_folders: list, queries: list, workers: int = 1, ordered: bool = False,
+                watched: "watcher.Watcher" = None) -> list:
+    """Walks every root path once for several searches. Called from 'go_search_many'
+
+    Args:
+        roots (list): List of root paths
+        ignore_folders (list): Folders ignored by every search
+        queries (list[tuple]): (criteria, limit) of each search. 'criteria': keyword arguments for
+            '__iter_elements' (except 'path'), 'limit': maximum number of coincidences (None for no limit).
+            One more coincidence is kept, to tell whether the results were truncated (see '__Limited')
+        workers (int, optional): Number of threads listing directories. Defaults to 1.
+        ordered (bool, optional): If workers > 1, keeps the same order than a single threaded walk.
+            Defaults to False.
+        watched (watcher.Watcher, optional): If specified, walks its in-memory table. Defaults to None.
+
+    Returns:
+        list[list[custom_utils.SearchResult]]: Found coincidences of each search, up to 'limit' + 1
+    """
+    ignore_folders = set(ignore_folders)
+    found = [[] for _ in queries]
+    # coincidences each search still takes, None for no limit
+    remaining = [None if limit is None else limit + 1 for _, limit in queries]
+    keep_entries = any(criteria["metadata"] is not None for criteria, _ in queries)
+
+    for root in roots:
+        if os.path.split(root)[1] in ignore_folders:
+            continue
+
+        visits = []
+        prunes = []
+        walk_all = False
+        for position, (criteria, _) in enumerate(queries):
+            if remaining[position] == 0:
+                continue
+            visit, descend = __visitor(
+                criteria["search_type"], criteria["matcher"], root, ignore_folders, criteria["ext_exclude"],
+                criteria["ext_include"], criteria["maxdepth"], criteria["mindepth"], criteria["metadata"])
+            visits.append((position, visit))
+            if descend is None:
+                walk_all = True
+            else:
+                prunes.append(descend)
+        if not visits:
+            break
+
+        def descend(dirpath, name):
+            # every search is asked, glob searches keep their state of each walked folder
+            walk = walk_all
+            for prune in prunes:
+                if prune(dirpath, name):
+                    walk = True
+            return walk
+
+        tree = __tree(root, ignore_folders, workers, ordered, watched, descend if prunes else None, keep_entries)
+        try:
+            for item in tree:
+                reached = False
+                for position, visit in visits:
+                    limit = remaining[position]
+                    if limit is None:
+                        found[position].extend(visit(*item))
+                    else:
+                        count = len(found[position])
+                        found[position].extend(itertools.islice(visit(*item), limit))
+                        remaining[position] -= len(found[position]) - count
+                        reached = reached or remaining[position] == 0
+
+                if reached:
+                    visits = [(position, visit) for position, visit in visits if remaining[position] != 0]
+                    if not visits:
+                        break
+        finally:
+            # stops walking
+            tree.close()
+
+    return found
+
+
+async def async_search(args_dict):
+    """Searches for files / folders without blocking the event loop (asyncio), see 'go_search'.
+
+    Directories are listed (and their names matched) on a thread pool shared by every async search
+    (ASYNC_WORKERS threads), several directories of each search at once, see 'aiter_search'.
+    The output is built on the loop's default executor: console and STREAMED_OUTPUTS are written while
+    searching, as 'go_search' does, the rest (DataFrame, lists...) once the search ends.
+    Cancelling the awaiting task stops the search, a file being written is left with the coincidences so far.
+
+    Args:
+        args_dict (dict): Dictionary containing all the specification to perform the search.
+            Same keys and defaults than 'go_search'
+
+    Raises:
+        Same as 'go_search'
+
+    Returns:
+        object: Same as 'go_search'
+    """
+    import asyncio
+
+    time_start = datetime.datetime.now()
+    start_search = time.perf_counter()
+    main_logger.info(f"Searching for: {args_dict} , please wait...")
+
+    __check_args(args_dict)
+    loop = asyncio.get_running_loop()
+    if args_dict["output"] != "console" and args_dict["output"] not in STREAMED_OUTPUTS:
+        found = []
+        async for chunk in __aiter_chunks(args_dict):
+            found.extend(chunk)
+
+        found = (result for result in found)
+        if args_dict["limit"] is not None:
+            found = __Limited(found, args_dict["limit"])
+        return await loop.run_in_executor(None, __output, found, args_dict, time_start, start_search)
+
+    # written while searching: the executor takes the chunks found meanwhile on the loop
+    chunks = __AsyncChunks(__aiter_chunks(args_dict), loop)
+    found = chunks if args_dict["limit"] is None else __Limited(chunks, args_dict["limit"])
+    writer = loop.run_in_executor(None, __output, found, args_dict, time_start, start_search)
+    try:
+        # not cancelled along with the task: the search is closed once the output stops waiting for it
+        return await asyncio.shield(writer)
+    finally:
+        await chunks.aclose(writer)
+
+
+async def aiter_search(args_dict):
+    """Searches for files / folders without blocking the event loop (asyncio), yielding each coincidence
+    as it arrives, see 'iter_search'.
+
+    Directories are listed (and their names matched) on a thread pool shared by every async search
+    (ASYNC_WORKERS threads). Each search lists up to 'workers' directories at once (ASYNC_CONCURRENCY
+    if 'workers' is 1), so coincidences arrive in listing order, not walking order. Searches with 'index',
+    'watcher', 'ordered' or 'processes' > 1 run as 'iter_search' on a thread of their own.
+    Cancelling the consuming task (or closing the iterator) stops the search.
+
+    Usage:
+        async for result in aiter_search({"path": "C:", "stringsearch": "dummy", "output": "obj_list"}):
+            ...
+
+    Args:
+        args_dict (dict): Dictionary containing all the specification to perform the search.
+            Same keys and defaults than 'go_search'
+
+    Raises:
+        Same as 'iter_search'
+
+    Yields:
+        list | dict: Each found coincidence, a list if 'output' in {console, list}, a dictionary otherwise
+    """
+    __check_args(args_dict)
+    output = "list" if args_dict["output"] in ("console", "list") else "dict"
+    limit = args_dict["limit"]
+
+    chunks = __aiter_chunks(args_dict)
+    try:
+        async for chunk in chunks:
+            if limit is not None:
+                chunk = chunk[:limit]
+                limit -= len(chunk)
+            for result in custom_utils.convert_results(chunk, output, args_dict["directoryseparator"]):
+                yield result
+            if limit == 0:
+                break
+    finally:
+        await chunks.aclose()
+
+
+async def __aiter_chunks(args_dict: dict):
+    """Searches without blocking the event loop, yielding the coincidences as they arrive.
+    Called from 'async_search' / 'aiter_search'
+
+    Args:
+        args_dict (dict): Dictionary containing all the specification to perform the search, checked
+
+    Yields:
+        list[custom_utils.SearchResult]: Coincidences, a directory (or a chunk) at a time. Up to 'limit' + 1,
+            the last one tells whether the results were truncated (see '__Limited')
+    """
+    search_args = __search_args(args_dict)
+    if search_args["limit"] is not None:
+        search_args["limit"] += 1
+
+    if search_args["index_path"] or search_args["watched"] is not None or search_args["ordered"] \
+            or search_args["processes"] > 1:
+        chunks = __aiter_sync(__search(**search_args))
+    else:
+        limit = search_args.pop("limit")
+        for key in ("processes", "index_path", "watched"):
+            del search_args[key]
+        roots, criteria = __criteria(**search_args)
+        concurrency = args_dict["workers"] if args_dict["workers"] > 1 else ASYNC_CONCURRENCY
+        chunks = __aiter_roots(roots, criteria, concurrency, limit)
+
+    try:
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await chunks.aclose()
+
+
+async def __aiter_roots(roots: list, criteria: dict, concurrency: int, limit: int = None):
+    """Walks every root path listing several directories at once on the async thread pool.
+    Called from '__aiter_chunks'
+
+    Args:
+        roots (list): List of root paths
+        criteria (dict): Keyword arguments for '__iter_elements' (except 'path'), see '__criteria'
+        concurrency (int): Directories listed at once
+        limit (int, optional): Stops searching as soon as this number of coincidences is found. Defaults to None.
+
+    Yields:
+        list[custom_utils.SearchResult]: Coincidences of each listed directory (with any)
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    executor = __async_executor()
+    ignore_folders = set(criteria["ignore_folders"])
+    keep_entries = criteria["metadata"] is not None
+
+    for root in roots:
+        if os.path.split(root)[1] in ignore_folders:
+            continue
+
+        visit, descend = __visitor(
+            criteria["search_type"], criteria["matcher"], root, ignore_folders, criteria["ext_exclude"],
+            criteria["ext_include"], criteria["maxdepth"], criteria["mindepth"], criteria["metadata"])
+
+        def scan(dirpath):
+            # on the thread pool: listing and matching
+            listing = walker.scan_dir(dirpath, ignore_folders, keep_entries)
+            if listing is None:
+                return None
+            dir_names, file_names, walk_into, entries = listing
+            if descend is not None:
+                walk_into = [name for name in walk_into if descend(dirpath, name)]
+            return ([os.path.join(dirpath, name) for name in walk_into],
+                    list(visit(dirpath, dir_names, file_names, entries)))
+
+        stack = [root]
+        pending = set()
+        try:
+            while stack or pending:
+                while stack and len(pending) < concurrency:
+                    pending.add(loop.run_in_executor(executor, scan, stack.pop()))
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for future in done:
+                    scanned = future.result()
+                    if scanned is None:
+                        continue
+                    subdirs, found = scanned
+                    stack.extend(reversed(subdirs))
+                    if not found:
+                        continue
+
+                    if limit is not None:
+                        found = found[:limit]
+                        limit -= len(found)
+                    yield found
+                    if limit == 0:
+                        return
+        finally:
+            # cancelled / stopped: directories not listed yet are dropped
+            for future in pending:
+                future.cancel()
+
+
+async def __aiter_sync(found):
+    """Consumes a search iterator on a thread of its own, without blocking the event loop.
+    Called from '__aiter_chunks' for searches that can't be walked asynchronously
+
+    Args:
+        found (Iterator[custom_utils.SearchResult]): Iterator over found coincidences (a generator, it is closed)
+
+    Yields:
+        list[custom_utils.SearchResult]: Chunks of up to EXPORT_CHUNK coincidences
+    """
+    import asyncio
+
+    # a single thread: index connections can't move between threads
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="findhelp-async")
+    try:
+        while True:
+            chunk = await asyncio.wrap_future(executor.submit(list, itertools.islice(found, EXPORT_CHUNK)))
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        # on the same thread too, once the chunk being read (if cancelled meanwhile) is
+        executor.submit(found.close)
+        executor.shutdown(wait=False)
+
+
+class __AsyncChunks:
+    """Iterator over the coincidences of an async search, consumed on another thread. Built by 'async_search'
+
+    A task on the event loop keeps searching into a buffer (up to ASYNC_BUFFER coincidences ahead), and the
+    consuming thread takes everything buffered at once, waiting on the loop while it is empty.
+    """
+
+    def __init__(self, chunks, loop):
+        """
+        Args:
+            chunks (AsyncIterator[list[custom_utils.SearchResult]]): Chunks of coincidences, see '__aiter_chunks'
+            loop (asyncio.AbstractEventLoop): Event loop running the search (the current one)
+        """
+        import asyncio
+
+        self.chunks = chunks
+        self.loop = loop
+        self.stopped = False
+        # consuming thread
+        self.results = iter(())
+        # on the loop
+        self.buffer = []
+        self.ended = False
+        self.error = None
+        self.ready = asyncio.Event()
+        self.taken = asyncio.Event()
+        self.feeder = loop.create_task(self.feed())
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        import asyncio
+
+        while True:
+            result = next(self.results, None)
+            if result is not None:
+                return result
+            if self.stopped:
+                raise StopIteration
+            try:
+                self.results = iter(asyncio.run_coroutine_threadsafe(self.take(), self.loop).result())
+            except (StopAsyncIteration, CancelledError):
+                # ended, or the loop is closing
+                self.stopped = True
+
+    async def feed(self):
+        try:
+            async for chunk in self.chunks:
+                self.buffer.extend(chunk)
+                self.ready.set()
+                while len(self.buffer) >= ASYNC_BUFFER and not self.stopped:
+                    self.taken.clear()
+                    await self.taken.wait()
+        except Exception as error:
+            # raised on the consuming thread
+            self.error = error
+        finally:
+            self.ended = True
+            self.ready.set()
+
+    async def take(self) -> list:
+        while not self.buffer and not self.ended and not self.stopped:
+            self.ready.clear()
+            await self.ready.wait()
+        if self.stopped:
+            raise StopAsyncIteration
+        taken, self.buffer = self.buffer, []
+        self.taken.set()
+        if not taken:
+            if self.error is not None:
+                raise self.error
+            raise StopAsyncIteration
+        return taken
+
+    def close(self):
+        """Takes no more coincidences (the search itself is stopped on the loop, see 'aclose')"""
+        self.stopped = True
+
+    async def aclose(self, consumer):
+        """Stops the search, once its consumer ends
+
+        Args:
+            consumer (asyncio.Future): Future of the consuming thread
+        """
+        import asyncio
+
+        self.stopped = True
+        self.feeder.cancel()
+        await asyncio.gather(self.feeder, consumer, return_exceptions=True)
+        await self.chunks.aclose()
+
+
+def __async_executor() -> ThreadPoolExecutor:
+    """Thread pool listing directories for every async search, started by the first one.
+    Called from '__aiter_roots'
+
+    Returns:
+        ThreadPoolExecutor: Thread pool of ASYNC_WORKERS threads
+    """
+    global _async_executor
+    with _async_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(max_workers=ASYNC_WORKERS, thread_name_prefix="findhelp-async")
+    return _async_executor
+
+
+def __print_results(found, search_args: dict, start_search: float) -> int:
+    """Prints coincidences to console as they are found. Called from '__output' for 'console' output
+
+    Args:
+        found (Iterator[custom_utils.SearchResult]): Iterator over found coincidences
+        search_args (dict): Arguments used for searching
+        start_search (float): 'time.perf_counter' when search started
+
+    Returns:
+        int: Number of coincidences printed
+    """
+    count = __print_console(found, search_args)
+
+    total_time = time.perf_counter() - start_search
+    main_logger.info(f"{count} coincidences found in {round(total_time, 2)} second(s)")
+    if getattr(found, "truncated", False):
+        main_logger.warning(f"Search stopped at {count} coincidence(s) ('limit'), results were truncated")
+        print(f"... limit of {count} result(s) reached, search stopped")
+
+    return count
+
+
+def __print_console(found, search_args: dict) -> int:
+    """Writes coincidences to standard output as they are found, one justified row each.
+    Called from '__print_results'
+
+    Columns widths come from the header and a bounded sample: the first CONSOLE_SAMPLE rows, or the ones found
+    within CONSOLE_FLUSH seconds. Wider values found afterwards are printed whole (not cut), shifting the rest
+    of their row. Rows are written in batches of up to EXPORT_CHUNK, and a background thread writes the pending
+    ones every CONSOLE_FLUSH seconds, so no row waits longer for the next ones to be found.
+
+    Args:
+        found (Iterator[custom_utils.SearchResult]): Iterator over found coincidences
+        search_args (dict): Arguments used for searching
+
+    Returns:
+        int: Number of coincidences printed
+    """
+    out = sys.stdout
+    lock = threading.Lock()
+    stop = threading.Event()
+    # rows found but not written yet, and row format (None until the sample is written)
+    pending = []
+    layout = {"line": None, "header": None}
+
+    def write():
+        # with 'lock' held
+        line = layout["line"]
+        if line is None:
+            # same layout than 'custom_utils.parse_line' (str(value).ljust(width)), wider values still spaced
+            widths = [max(map(custom_utils.find_len, column)) for column in zip(layout["header"], *pending)]
+            line = layout["line"] = "".join(f"{{!s:<{width}}} " for width in widths).format
+            lines = [line(*layout["header"])]
+        else:
+            lines = []
+        lines.extend(line(*row) for row in pending)
+        pending.clear()
+        out.write("\n".join(lines) + "\n")
+        out.flush()
+
+    def heartbeat():
+        while not stop.wait(CONSOLE_FLUSH):
+            with lock:
+                if pending:
+                    write()
+
+    count = 0
+    thread = None
+    try:
+        # the header depends on the first coincidence (several patterns)
+        first = next(found, None)
+        layout["header"] = __header([first] if first is not None else [], search_args)
+        rows = custom_utils.convert_results(
+            itertools.chain([first] if first is not None else [], found), "list", search_args["directoryseparator"])
+
+        thread = threading.Thread(target=heartbeat, name="findhelp-console", daemon=True)
+        thread.start()
+        for row in rows:
+            with lock:
+                pending.append(row)
+                count += 1
+                if len(pending) >= (CONSOLE_SAMPLE if layout["line"] is None else EXPORT_CHUNK):
+                    write()
+    finally:
+        stop.set()
+        if thread is not None:
+            thread.join()
+        found.close()
+
+    # the header, even without coincidences
+    if pending or layout["line"] is None:
+        write()
+
+    return count
+
+
+def __stream_results(found, search_args: dict, time_start: datetime.datetime, start_search: float) -> int:
+    """Exports coincidences to a file as they are found. Called from '__output' for STREAMED_OUTPUTS
+
+    Args:
+        found (Iterator[custom_utils.SearchResult]): Iterator over found coincidences
+        search_args (dict): Arguments used for searching, already checked
+        time_start (datetime.datetime): Time when search began
+        start_search (float): 'time.perf_counter' when search began
+
+    Returns:
+        int: Number of coincidences written
+    """
+    output_type = search_args["output"]
+    output_fullpath = __output_fullpath(search_args["outputpath"], search_args["outputfilename"], output_type)
+
+    if output_type in ("txt", "csv"):
+        count = __export_csv(found, output_fullpath, search_args["delimiter"], search_args)
+    elif output_type in ARROW_OUTPUTS:
+        count = __export_arrow(found, output_fullpath, search_args, parquet=output_type == "parquet")
+    else:
+        count = __export_json(found, output_fullpath, search_args, time_start, start_search,
+                              lines=output_type == "ndjson")
+
+    total_time = time.perf_counter() - start_search
+    main_logger.info(f"{count} coincidences found in {round(total_time, 2)} second(s)")
+    if getattr(found, "truncated", False):
+        main_logger.warning(f"Search stopped at {count} coincidence(s) ('limit'), results were truncated")
+    main_logger.info(f"Exported {output_fullpath}")
+
+    return count
+
+
+def __export_csv(found, output_fullpath: str, delimiter: str, search_args: dict) -> int:
+    """Writes coincidences to a txt / csv file as they are found. Called from '__stream_results'
+
+    Rows are written EXPORT_CHUNK at a time through a buffered file (flushed to disk in EXPORT_BUFFER chunks),
+    so memory stays constant.
+
+    Args:
+        found (Iterator[custom_utils.SearchResult]): Iterator over found coincidences
+        output_fullpath (str): File to write
+        delimiter (str): Delimiter of columns
+        search_args (dict): Arguments used for searching
+
+    Returns:
+        int: Number of coincidences written
+    """
+    count = 0
+    try:
+        # the header depends on the first coincidence (several patterns)
+        first = next(found, None)
+        header = __header([first] if first is not None else [], search_args)
+        lines = custom_utils.convert_results(
+            itertools.chain([first] if first is not None else [], found), "list", search_args["directoryseparator"])
+
+        with open(output_fullpath, "w", newline="\n", encoding="utf-8", buffering=EXPORT_BUFFER) as new_file:
+            csv_writer = csv.writer(new_file, delimiter=delimiter)
+            csv_writer.writerow(header)
+
+            while True:
+                chunk = list(itertools.islice(lines, EXPORT_CHUNK))
+                if not chunk:
+                    break
+                if "patterns" in header:
+                    for line in chunk:
+                        line[-1] = "|".join(map(str, line[-1]))
+                csv_writer.writerows(chunk)
+                count += len(chunk)
+    finally:
+        found.close()
+
+    return count
+
+
+def __export_json(found, output_fullpath: str, search_args: dict, time_start: datetime.datetime,
+                  start_search: float, lines: bool = False) -> int:
+    """Writes coincidences to a json / ndjson file as they are found. Called from '__stream_results'
+
+    json: a single object {search_args, start, results, end, total_time_seconds, truncated}, indented,
+        its 'results' array written EXPORT_CHUNK coincidences at a time.
+    ndjson: one record per line, a header {search_args, start}, every coincidence,
+        then a trailer {end, total_time_seconds, truncated, count}.
+
+    Args:
+        found (Iterator[custom_utils.SearchResult]): Iterator over found coincidences
+        output_fullpath (str): File to write
+        search_args (dict): Arguments used for searching
+        time_start (datetime.datetime): Time when search began
+        start_search (float): 'time.perf_counter' when search began
+        lines (bool, optional): Writes ndjson instead of json. Defaults to False.
+
+    Returns:
+        int: Number of coincidences written
+    """
+    encode = json.JSONEncoder(indent=None if lines else 2, ensure_ascii=False, default=str).encode
+    results = custom_utils.convert_results(found, "dict", search_args["directoryseparator"])
+    start = time_start.strftime(TIME_FORMAT)
+    count = 0
+
+    def indent(encoded, level):
+        # nests an indented json value 'level' levels deeper (strings can't contain raw line breaks)
+        return encoded.replace("\n", "\n" + "  " * level)
+
+    try:
+        with open(output_fullpath, "w", encoding="utf-8", buffering=EXPORT_BUFFER) as new_file:
+            if lines:
+                new_file.write(encode({"search_args": search_args, "start": start}) + "\n")
+            else:
+                new_file.write(f'{{\n  "search_args": {indent(encode(search_args), 1)},\n'
+                               f'  "start": {encode(start)},\n  "results": [')
+
+            while True:
+                chunk = list(itertools.islice(results, EXPORT_CHUNK))
+                if not chunk:
+                    break
+                if lines:
+                    new_file.write("\n".join(map(encode, chunk)) + "\n")
+                else:
+                    # the whole chunk encoded at once, without its brackets: "[\n  {...},\n  {...}\n]"
+                    new_file.write(("\n  " if count == 0 else ",\n  ") + indent(encode(chunk)[2:-2], 1))
+                count += len(chunk)
+
+            summary = {
+                "end": datetime.datetime.now().strftime(TIME_FORMAT),
+                "total_time_seconds": time.perf_counter() - start_search,
+                "truncated": getattr(found, "truncated", False)
+            }
+            if lines:
+                summary["count"] = count
+                new_file.write(encode(summary) + "\n")
+            else:
+                new_file.write(("\n  ]" if count else "]")
+                               + "".join(f',\n  "{key}": {encode(value)}' for key, value in summary.items())
+                               + "\n}")
+    finally:
+        found.close()
+
+    return count
+
+
+def __export_arrow(found, output_fullpath: str, search_args: dict, parquet: bool = False) -> int:
+    """Writes coincidences to a parquet / arrow (IPC file, a.k.a. Feather v2) file, in batches of ARROW_BATCH
+    as they are found. Called from '__stream_results'
+
+    'type', 'folder_parent', 'folder_name' and 'ext' are dictionary encoded. Parquet: each batch is a row group
+    with its own dictionaries. Arrow: IPC files allow a single dictionary per column, so dictionaries keep
+    growing across batches and only the new values are written (dictionary deltas).
+
+    Args:
+        found (Iterator[custom_utils.SearchResult]): Iterator over found coincidences
+        output_fullpath (str): File to write
+        search_args (dict): Arguments used for searching
+        parquet (bool, optional): Writes parquet instead of arrow. Defaults to False.
+
+    Returns:
+        int: Number of coincidences written
+    """
+    pa = __import_pyarrow()
+    columns = custom_utils.ResultColumns(search_args["directoryseparator"])
+    dictionaries = {}
+    count = 0
+
+    try:
+        # the schema depends on the first coincidence (several patterns)
+        first = next(found, None)
+        schema = __arrow_schema(pa, __header([first] if first is not None else [], search_args))
+        results = itertools.chain([first] if first is not None else [], found)
+
+        if parquet:
+            writer = pa.parquet.ParquetWriter(output_fullpath, schema)
+        else:
+            writer = pa.ipc.new_file(output_fullpath, schema,
+                                     options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True))
+        with writer:
+            while True:
+                columns.clear(categories=parquet)
+                if parquet:
+                    # dictionaries of each row group
+                    dictionaries.clear()
+                columns.extend(itertools.islice(results, ARROW_BATCH))
+                if not len(columns):
+                    break
+
+                batch = __arrow_batch(pa, schema, columns, dictionaries)
+                if parquet:
+                    writer.write_table(pa.Table.from_batches([batch], schema=schema))
+                else:
+                    writer.write_batch(batch)
+                count += len(columns)
+    finally:
+        found.close()
+
+    return count
+
+
+def __arrow_schema(pa, header: list):
+    """Arrow schema of the results. Called from '__export_arrow'
+
+    Args:
+        pa (module): pyarrow
+        header (list[str]): Column names, see '__header'
+
+    Returns:
+        pyarrow.Schema: Schema, categorical columns dictionary encoded
+    """
+    types = {
+        "fullpath": pa.string(), "file_name": pa.string(),
+        "size": pa.int64(), "mtime": pa.timestamp("us"), "patterns": pa.list_(pa.string())
+    }
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([(name, dictionary if name in custom_utils.ResultColumns.CATEGORICAL else types[name])
+                      for name in header])
+
+
+def __arrow_batch(pa, schema, columns: custom_utils.ResultColumns, dictionaries: dict):
+    """Turns a batch of results, stored by columns, into an arrow record batch. Called from '__export_arrow'
+
+    Args:
+        pa (module): pyarrow
+        schema (pyarrow.Schema): Schema, see '__arrow_schema'
+        columns (custom_utils.ResultColumns): Batch of found coincidences
+        dictionaries (dict): Arrow dictionary of each categorical column, extended with the new categories.
+            Kept between batches while categories keep being numbered, so each one is built once
+
+    Returns:
+        pyarrow.RecordBatch: Batch of results
+    """
+    import numpy as np
+
+    arrays = []
+    for field in schema:
+        if field.name in columns.CATEGORICAL:
+            categories = columns.categories[field.name]
+            dictionary = dictionaries.get(field.name)
+            if dictionary is None:
+                dictionary = pa.array(list(categories), pa.string())
+            elif len(dictionary) < len(categories):
+                new_values = pa.array(list(itertools.islice(categories, len(dictionary), None)), pa.string())
+                dictionary = pa.concat_arrays([dictionary, new_values])
+            dictionaries[field.name] = dictionary
+
+            codes = np.frombuffer(columns.codes[field.name], dtype=np.int64)
+            indices = pa.array(codes.astype(np.int32), mask=codes < 0)
+            arrays.append(pa.DictionaryArray.from_arrays(indices, dictionary))
+        else:
+            values = getattr(columns, field.name)
+            arrays.append(pa.nulls(len(columns), field.type) if values is None else pa.array(values, field.type))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def __import_pyarrow():
+    """Imports pyarrow, an optional dependency. Called from '__check_args' / '__export_arrow'
+
+    Raises:
+        MissingDependencyError: Raised if pyarrow is not installed
+
+    Returns:
+        module: pyarrow, with its 'ipc' and 'parquet' modules loaded
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as error:
+        raise MissingDependencyError(
+            message="'parquet' and 'arrow' outputs require pyarrow: pip install findhelp[arrow]") from error
+    return pyarrow
+
+
+def __output_fullpath(output_path: str, output_filename: str, output_type: str) -> str:
+    """Path of the results file. Called from '__get_results' / '__stream_results'
+
+    Args:
+        output_path (str): Path in which the results file will be located
+        output_filename (str): Name of file in which results will be stored (with no extension)
+        output_type (str): Output, used as extension
+
+    Returns:
+        str: Path of the results file, '/' separated
+    """
+    return custom_utils.forcedir_sep(os.path.join(output_path, f"{output_filename}.{output_type}"), "/")
+
+
+def __config():
+    """Reads 'config.yaml', again only once it is modified (the same dictionary is returned meanwhile)
+
+    Returns:
+        dict: Dictionary with configuration located in 'config.yaml' (ignore_folders + ignore_extensions).
+            Shared, it must not be modified
+
+    """
+    global _config_cache
+    config_stat = os.stat(CONFIG_PATH)
+    key = (config_stat.st_mtime_ns, config_stat.st_size)
+    if _config_cache is None or _config_cache[0] != key:
+        with open(CONFIG_PATH, "r") as f:
+            _config_cache = (key, yaml.load(f, Loader=YAML_LOADER))
+
+    return _config_cache[1]
+
+
+class Searcher:
+    """Search session, for callers searching many times: keeps what every 'go_search' / 'iter_search' call
+    would prepare again.
+
+    - 'config.yaml' is read once, then again only when it is modified ('set_ignore_folders' /
+      'set_ignore_extensions' included): its ignored folders / extensions are prepared once per change.
+    - Matchers of the searched strings (regular expressions, automatons) are compiled once,
+      the last SEARCHER_CACHE are kept.
+    - Searches with 'processes' > 1 share a process pool, started by the first one.
+
+    Usage:
+        with Searcher({"path": "C:", "onlyfiles": True}) as searcher:
+            searcher.search({"stringsearch": "dummy", "output": "obj_list"})
+            for result in searcher.iter(stringsearch="other", output="list"):
+                ...
+
+    Attributes:
+        defaults (dict): Arguments used by every search of the session (see 'go_search'),
+            unless a search specifies them
+    """
+
+    def __init__(self, args_dict: dict = None, **kwargs):
+        """Starts the session
+
+        Args:
+            args_dict (dict, optional): Arguments used by every search, see 'go_search'. Defaults to None.
+            **kwargs: More arguments used by every search
+        """
+        self.defaults = dict(args_dict or {}, **kwargs)
+        self.lock = threading.Lock()
+        # (config, ignore_folders, ext_exclude), see '__ignored'
+        self._ignored = (None, None, None)
+        self._matchers = {}
+        self._executor = None
+        self._processes = None
+
+    def __repr__(self):
+        return f"Searcher({self.defaults!r})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _args(self, args_dict: dict, kwargs: dict) -> dict:
+        args = dict(self.defaults)
+        args.update(args_dict or {})
+        args.update(kwargs)
+        args["searcher"] = self
+        return args
+
+    def search(self, args_dict: dict = None, **kwargs):
+        """Searches for files / folders, see 'go_search'
+
+        Args:
+            args_dict (dict, optional): Arguments of this search, over 'defaults'. Defaults to None.
+            **kwargs: More arguments of this search
+
+        Returns:
+            object: Same as 'go_search'
+        """
+        return go_search(self._args(args_dict, kwargs))
+
+    def iter(self, args_dict: dict = None, **kwargs):
+        """Searches for files / folders, yielding each coincidence as soon as it is found, see 'iter_search'
+
+        Args:
+            args_dict (dict, optional): Arguments of this search, over 'defaults'. Defaults to None.
+            **kwargs: More arguments of this search
+
+        Returns:
+            Iterator[list | dict]: Same as 'iter_search'
+        """
+        return iter_search(self._args(args_dict, kwargs))
+
+    def _pool(self, processes: int) -> "ProcessPoolExecutor":
+        """Process pool shared by the searches. Called from '__search'
+
+        Args:
+            processes (int): Number of processes. The pool is started again if a search asks for a different one
+
+        Returns:
+            ProcessPoolExecutor: Process pool
+        """
+        with self.lock:
+            if self._executor is None or self._processes != processes:
+                if self._executor is not None:
+                    # searches already sent to it finish
+                    self._executor.shutdown(wait=False)
+                from concurrent.futures import ProcessPoolExecutor
+                self._executor = ProcessPoolExecutor(max_workers=processes)
+                self._processes = processes
+            return self._executor
+
+    def close(self):
+        """Stops the process pool, if started. The session can still be used"""
+        with self.lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+                self._processes = None
+
+
+def build_index(path: str = ".", index_path: str = None, all: bool = False) -> int:
+    """Stores every file / folder within 'path' in an index (SQLite file), so later searches
+    (go_search with 'index') don't walk the directory tree. Replaces any previous index of 'path'
+
+    Args:
+        path (str, optional): Root path to index. Defaults to ".".
+        index_path (str, optional): Path to the SQLite database file.
+            Defaults to '.findhelp_index.sqlite3' in the user's home directory.
+        all (bool, optional): Indexes all folders, ignores 'ignore_folders' switch on 'config.yaml'. Defaults to False.
+
+    Raises:
+        NotADirectoryError: Raised if path is not a directory
+
+    Returns:
+        int: Number of indexed files / folders
+    """
+    if not os.path.isdir(path):
+        raise NotADirectoryError(f"path: {path} is not a valid directory")
+
+    ignore_folders = custom_utils.sel_arg(__config(), "ignore_folders")
+    if ignore_folders == None or all:
+        ignore_folders = []
+
+    import findhelp.index as index
+
+    start = time.perf_counter()
+    total = index.build(path, index_path, ignore_folders, all)
+    main_logger.info(
+        f"{total} files / folders indexed in {round(time.perf_counter() - start, 2)} second(s)")
+
+    return total
+
+
+def refresh_index(path: str = ".", index_path: str = None) -> dict:
+    """Updates the index of 'path' (see 'build_index'), rescanning only the directories whose listing changed
+    (files / folders created, deleted or renamed within them) since the index was built or refreshed.
+
+    Args:
+        path (str, optional): Indexed root, or folder within one, to update. Defaults to ".".
+        index_path (str, optional): Path to the SQLite database file.
+            Defaults to '.findhelp_index.sqlite3' in the user's home directory.
+
+    Raises:
+        NotIndexedPathError: Raised if 'path' was not indexed
+
+    Returns:
+        dict: Number of directories {"rescanned", "skipped", "removed"}
+    """
+    import findhelp.index as index
+
+    start = time.perf_counter()
+    stats = index.refresh(path, index_path)
+    main_logger.info(
+        f"{stats['rescanned']} directories rescanned, {stats['skipped']} skipped (unchanged), "
+        f"{stats['removed']} removed in {round(time.perf_counter() - start, 2)} second(s)")
+
+    return stats
+
+
+def watch(path: str = ".", all: bool = False) -> "watcher.Watcher":
+    """Lists 'path' once into an in-memory table and keeps it up to date on a background thread,
+    applying the files / folders created, deleted or renamed (Linux inotify). Later searches with
+    'watcher' (go_search) only match names, with no directory walk.
+
+    Args:
+        path (str, optional): Root path to watch. Defaults to ".".
+        all (bool, optional): Watches all folders, ignores 'ignore_folders' switch on 'config.yaml'. Defaults to False.
+
+    Raises:
+        NotADirectoryError: Raised if path is not a directory
+        OSError: Raised if inotify is not available (not Linux)
+
+    Returns:
+        watcher.Watcher: Started watcher. Call its 'close' method to stop watching
+    """
+    ignore_folders = custom_utils.sel_arg(__config(), "ignore_folders")
+    if ignore_folders == None or all:
+        ignore_folders = []
+
+    import findhelp.watcher as watcher
+
+    start = time.perf_counter()
+    watched = watcher.Watcher(path, ignore_folders)
+    main_logger.info(
+        f"{len(watched.tree)} directories watched in {round(time.perf_counter() - start, 2)} second(s)")
+
+    return watched.start()
+
+
+def set_ignore_folders(ignore_list=None):
+    """Sets config.yaml 'ignore_folders' list
+
+    Args:
+        ignore_list (list[str], optional): List of folders to be ignored in future searches. 
             None of its subfolders will be considered. Defaults to None.
+
+    Live 'Searcher' sessions use it from their next search
     """
-    _config = __config()
+    _config = dict(__config())
     if ignore_list:
         ignore_list = [str(element) for element in ignore_list]
         _config["ignore_folders"] = ignore_list
     else:
         _config["ignore_folders"] = custom_utils.default_ignore_folders()
 
+    __write_config(_config)
+
+
+def __write_config(_config: dict):
+    """Writes 'config.yaml'. Called from 'set_ignore_folders' / 'set_ignore_extensions'
+
+    Args:
+        _config (dict): Configuration (ignore_folders + ignore_extensions)
+    """
+    global _config_cache
     with open(CONFIG_PATH, "w+") as yf:
         yaml.dump(_config, yf, allow_unicode=True, default_flow_style=False)
+    # read again even if its modification time didn't change (coarse file system clocks)
+    _config_cache = None
 
 
 def set_ignore_extensions(ignore_list=None):
@@ -392,13 +2297,14 @@ def set_ignore_extensions(ignore_list=None):
 
     Args:
         ignore_list (list[str], optional): List of extensions to be ignored in future searches. Defaults to None.
+
+    Live 'Searcher' sessions use it from their next search
     """
-    _config = __config()
+    _config = dict(__config())
     if ignore_list:
         ignore_list = [str(element) for element in ignore_list]
         _config["ignore_extensions"] = ignore_list
     else:
         _config["ignore_extensions"] = []
 
-    with open(CONFIG_PATH, "w+") as yf:
-        yaml.dump(_config, yf, allow_unicode=True, default_flow_style=False)
+    __write_config(_config)
@@ -0,0 +1,758 @@
+import os
+import re
+import json
+import logging
+import sqlite3
+import datetime
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+import findhelp.custom_utils as custom_utils
+import findhelp.walker as walker
+
+from findhelp.custom_exceptions import NotIndexedPathError
+
+
+index_logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = os.path.join(
+    os.path.expanduser("~"), ".findhelp_index.sqlite3")
+
+# Batch size for inserting entries
+INSERT_BATCH = 10000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS roots (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    all_folders INTEGER NOT NULL,
+    ignore_folders TEXT NOT NULL,
+    built TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    root_id INTEGER NOT NULL,
+    rel_dir TEXT NOT NULL,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    ext TEXT,
+    ext_lower TEXT,
+    name_lower TEXT NOT NULL,
+    name_ascii TEXT NOT NULL,
+    name_ascii_lower TEXT NOT NULL,
+    pos INTEGER
+);
+CREATE INDEX IF NOT EXISTS entries_root ON entries (root_id, rel_dir);
+CREATE TABLE IF NOT EXISTS grams (
+    gram TEXT NOT NULL,
+    entry_id INTEGER NOT NULL,
+    PRIMARY KEY (gram, entry_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS dirs (
+    root_id INTEGER NOT NULL,
+    rel_dir TEXT NOT NULL,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL,
+    walk_key TEXT,
+    PRIMARY KEY (root_id, rel_dir)
+);
+"""
+
+# Index files with a lower 'user_version' have no trigrams (1) / walk order (2) yet
+SCHEMA_VERSION = 2
+
+# Walk order of a folder ('dirs.walk_key'): its parent's key followed by its position within the parent's
+# listing, so sorting by (walk_key, entries.pos) gives the order of a walk, also after refreshing
+WALK_KEY_FORMAT = "{:06x}"
+
+# Max number of trigrams intersected per query, more of them barely reduce candidates
+MAX_QUERY_GRAMS = 12
+
+# Searching several patterns: trigrams intersected per pattern, and in total (SQL parameters limit)
+MAX_PATTERN_GRAMS = 3
+MAX_MULTI_GRAMS = 900
+
+# Column to look into, depending on (ignore_case, ignore_accents)
+NAME_COLUMNS = {
+    (False, False): "name",
+    (True, False): "name_lower",
+    (False, True): "name_ascii",
+    (True, True): "name_ascii_lower",
+}
+
+
+def connect(index_path: str = None) -> sqlite3.Connection:
+    """Opens (and creates, if needed) an index database
+
+    Args:
+        index_path (str, optional): Path to the SQLite database file. Defaults to DEFAULT_INDEX_PATH.
+
+    Returns:
+        sqlite3.Connection: Connection to the index database
+    """
+    connection = sqlite3.connect(index_path or DEFAULT_INDEX_PATH)
+    connection.executescript(SCHEMA)
+
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    if version < SCHEMA_VERSION:
+        with connection:
+            if version < 1:
+                # index built before trigrams existed
+                connection.execute("DELETE FROM grams")
+                connection.executemany("INSERT INTO grams (gram, entry_id) VALUES (?, ?)",
+                                       ((gram, entry_id) for entry_id, folded in
+                                        connection.execute("SELECT id, name_ascii_lower FROM entries").fetchall()
+                                        for gram in trigrams(folded)))
+            if version < 2:
+                __add_walk_order(connection)
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    return connection
+
+
+def __add_walk_order(connection: sqlite3.Connection):
+    """Stores the walk order of an index built before it existed. Called from 'connect'
+
+    Every directory is inserted at once, in listing order, so ids give the positions within each directory.
+
+    Args:
+        connection (sqlite3.Connection): Connection to the index database, within a transaction
+    """
+    for table, column, column_type in (("entries", "pos", "INTEGER"), ("dirs", "walk_key", "TEXT")):
+        if column not in [row[1] for row in connection.execute(f"PRAGMA table_info({table})")]:
+            connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+    positions = {}
+    folder_positions = {}
+    rows = []
+    for entry_id, root_id, rel_dir, type, name in connection.execute(
+            "SELECT id, root_id, rel_dir, type, name FROM entries ORDER BY id").fetchall():
+        pos = positions.get((root_id, rel_dir), 0)
+        positions[(root_id, rel_dir)] = pos + 1
+        rows.append((pos, entry_id))
+        if type == "folder":
+            folder_positions[(root_id, os.path.join(rel_dir, name) if rel_dir else name)] = pos
+    connection.executemany("UPDATE entries SET pos = ? WHERE id = ?", rows)
+
+    keys = {}
+    dirs = connection.execute("SELECT root_id, rel_dir, parent FROM dirs").fetchall()
+    # parents first
+    for root_id, rel_dir, parent in sorted(dirs, key=lambda row: (row[1].count(os.sep), row[1] != "")):
+        if parent is None:
+            keys[(root_id, rel_dir)] = ""
+        else:
+            keys[(root_id, rel_dir)] = keys.get((root_id, parent), "") + WALK_KEY_FORMAT.format(
+                folder_positions.get((root_id, rel_dir), 0))
+    connection.executemany("UPDATE dirs SET walk_key = ? WHERE root_id = ? AND rel_dir = ?",
+                           [(key, root_id, rel_dir) for (root_id, rel_dir), key in keys.items()])
+
+
+def fold(text: str) -> str:
+    """Turns a string into its case / accents folded form, the one indexed by trigrams
+
+    Any substring of a string, once folded, is a substring of the folded string.
+
+    Args:
+        text (str): String to fold
+
+    Returns:
+        str: Lowercase string without accents
+    """
+    return (text if text.isascii() else custom_utils.unidecode(text)).lower()
+
+
+def trigrams(text: str) -> set:
+    """Gets every substring of length 3 of a string
+
+    Args:
+        text (str): String, already folded
+
+    Returns:
+        set[str]: Trigrams of 'text'. Empty set if 'text' is shorter than 3 characters
+    """
+    return {text[index:index + 3] for index in range(len(text) - 2)}
+
+
+def __entry_row(entry_id: int, root_id: int, rel_dir: str, pos: int, type: str, name: str,
+                ext: str = None) -> tuple:
+    """Builds the row stored for a single file / folder
+
+    Args:
+        entry_id (int): Id of the entry
+        root_id (int): Id of the indexed root
+        rel_dir (str): Folder containing the entry, relative to the root ("" for the root itself)
+        pos (int): Position of the entry within the listing of 'rel_dir' (folders first)
+        type (str): 'folder' or 'file'
+        name (str): Folder / file name
+        ext (str, optional): Filename extension, if type = 'file'. Defaults to None.
+
+    Returns:
+        tuple: Row for 'entries' table
+    """
+    name_ascii = name if name.isascii() else custom_utils.unidecode(name)
+    return (entry_id, root_id, rel_dir, pos, type, name, ext, ext.lower() if ext is not None else None,
+            name.lower(), name_ascii, name_ascii.lower())
+
+
+def build(path: str, index_path: str = None, ignore_folders: list = None, all: bool = False) -> int:
+    """Walks 'path' and stores every file / folder in the index. Replaces any previous index of 'path'
+
+    Args:
+        path (str): Root path to index
+        index_path (str, optional): Path to the SQLite database file. Defaults to DEFAULT_INDEX_PATH.
+        ignore_folders (list, optional): Folders pruned while walking. Defaults to None.
+        all (bool, optional): Just for information purposes: indicates 'ignore_folders' were not considered.
+            Defaults to False.
+
+    Returns:
+        int: Number of indexed entries
+    """
+    ignore_folders = set(ignore_folders or [])
+    real_root = os.path.realpath(path)
+
+    connection = connect(index_path)
+    try:
+        with connection:
+            __delete_entries(connection, "root_id IN (SELECT id FROM roots WHERE path = ?)", (real_root,))
+            connection.execute("DELETE FROM dirs WHERE root_id IN (SELECT id FROM roots WHERE path = ?)",
+                               (real_root,))
+            connection.execute("DELETE FROM roots WHERE path = ?", (real_root,))
+            root_id = connection.execute(
+                "INSERT INTO roots (path, all_folders, ignore_folders, built) VALUES (?, ?, ?, ?)",
+                (real_root, int(all), json.dumps(sorted(ignore_folders)),
+                 datetime.datetime.now().strftime("%Y/%m/%d, %H:%M:%S"))).lastrowid
+
+            # with nothing stored, every directory is scanned
+            __update(connection, root_id, path, ignore_folders)
+
+        total = connection.execute(
+            "SELECT COUNT(*) FROM entries WHERE root_id = ?", (root_id,)).fetchone()[0]
+    finally:
+        connection.close()
+
+    return total
+
+
+def refresh(path: str, index_path: str = None) -> dict:
+    """Updates the index of 'path', rescanning only the directories whose listing changed since last update.
+
+    Each directory is 'stat'-ed and its modification time compared with the stored one: if equal, its listing
+    didn't change (no file / folder created, deleted or renamed within it), and its stored subfolders are
+    checked the same way without listing it. Same 'ignore_folders' than when the index was built.
+
+    Args:
+        path (str): Indexed root, or folder within one, to update
+        index_path (str, optional): Path to the SQLite database file. Defaults to DEFAULT_INDEX_PATH.
+
+    Raises:
+        NotIndexedPathError: Raised if 'path' is not within any indexed root
+
+    Returns:
+        dict: Number of directories {"rescanned", "skipped", "removed"}
+    """
+    connection = connect(index_path)
+    try:
+        root_id, _, rel_prefix = __find_root(connection, path)
+        ignore_folders = json.loads(connection.execute(
+            "SELECT ignore_folders FROM roots WHERE id = ?", (root_id,)).fetchone()[0])
+
+        with connection:
+            stats = __update(connection, root_id, path, set(ignore_folders), rel_prefix)
+            connection.execute("UPDATE roots SET built = ? WHERE id = ?",
+                               (datetime.datetime.now().strftime("%Y/%m/%d, %H:%M:%S"), root_id))
+    finally:
+        connection.close()
+
+    return stats
+
+
+def __subtree_range(rel_dir: str) -> tuple:
+    """Gets the bounds of 'rel_dir' subfolders, so they can be selected with an indexed range condition
+
+    Args:
+        rel_dir (str): Folder relative to the indexed root
+
+    Returns:
+        tuple: (low, high) every subfolder 'sub' of 'rel_dir' verifies low <= sub < high
+    """
+    return rel_dir + os.sep, rel_dir + chr(ord(os.sep) + 1)
+
+
+def __delete_subtree(connection: sqlite3.Connection, root_id: int, rel_dir: str):
+    """Deletes a folder and everything within it from the index
+
+    Args:
+        connection (sqlite3.Connection): Connection to the index database
+        root_id (int): Id of the indexed root
+        rel_dir (str): Folder relative to the indexed root
+    """
+    low, high = __subtree_range(rel_dir)
+    condition = "root_id = ? AND (rel_dir = ? OR (rel_dir >= ? AND rel_dir < ?))"
+    __delete_entries(connection, condition, (root_id, rel_dir, low, high))
+    connection.execute(f"DELETE FROM dirs WHERE {condition}", (root_id, rel_dir, low, high))
+
+
+def __delete_entries(connection: sqlite3.Connection, condition: str, params: tuple):
+    """Deletes entries, and their trigrams, from the index
+
+    Args:
+        connection (sqlite3.Connection): Connection to the index database
+        condition (str): SQL condition over 'entries' table
+        params (tuple): Parameters of 'condition'
+    """
+    connection.executemany("DELETE FROM grams WHERE gram = ? AND entry_id = ?",
+                           [(gram, entry_id) for entry_id, folded in
+                            connection.execute(f"SELECT id, name_ascii_lower FROM entries WHERE {condition}", params)
+                            for gram in trigrams(folded)])
+    connection.execute(f"DELETE FROM entries WHERE {condition}", params)
+
+
+def __update(connection: sqlite3.Connection, root_id: int, path: str, ignore_folders: set,
+             start: str = "") -> dict:
+    """Brings the index of a root up to date. Called from 'build' / 'refresh'
+
+    Directories are walked top-down (stored subfolders if unchanged, listed ones otherwise).
+    A changed directory is listed once with 'walker.scan_dir', with the same pruning than searching.
+
+    Args:
+        connection (sqlite3.Connection): Connection to the index database, within a transaction
+        root_id (int): Id of the indexed root
+        path (str): Path to the folder to update
+        ignore_folders (set): Folders pruned while walking
+        start (str, optional): Same folder than 'path', relative to the indexed root. Defaults to "" (the root).
+
+    Returns:
+        dict: Number of directories {"rescanned", "skipped", "removed"}
+    """
+    stats = {"rescanned": 0, "skipped": 0, "removed": 0}
+    if os.path.split(path)[1] in ignore_folders:
+        return stats
+
+    stored = {}
+    children = {}
+    # children in walk order
+    for rel_dir, parent, mtime_ns, walk_key in connection.execute(
+            "SELECT rel_dir, parent, mtime_ns, walk_key FROM dirs WHERE root_id = ? ORDER BY walk_key", (root_id,)):
+        stored[rel_dir] = (mtime_ns, walk_key)
+        if parent is not None:
+            children.setdefault(parent, []).append(rel_dir)
+
+    skip = len(start) + 1 if start else 0
+    entry_id = connection.execute(
+        "SELECT COALESCE(MAX(id), 0) FROM entries").fetchone()[0]
+    rows = []
+    stack = [(start, __start_key(connection, root_id, start, stored))]
+    while stack:
+        rel_dir, walk_key = stack.pop()
+        dirpath = os.path.join(path, rel_dir[skip:]) if rel_dir != start else path
+        old_children = children.get(rel_dir, [])
+
+        # stat before listing: a change made while listing will be seen next time
+        try:
+            mtime_ns = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        if mtime_ns is not None and rel_dir in stored and stored[rel_dir][0] == mtime_ns:
+            stats["skipped"] += 1
+            old_key = stored[rel_dir][1]
+            if old_key != walk_key:
+                # a folder listed before it was created / deleted within the parent
+                connection.execute("UPDATE dirs SET walk_key = ? WHERE root_id = ? AND rel_dir = ?",
+                                   (walk_key, root_id, rel_dir))
+            stack.extend((child, walk_key + stored[child][1][len(old_key):]) for child in reversed(old_children))
+            continue
+
+        listing = walker.scan_dir(dirpath, ignore_folders) if mtime_ns is not None else None
+        if listing is None:
+            # deleted or not readable anymore
+            if rel_dir in stored:
+                __delete_subtree(connection, root_id, rel_dir)
+                stats["removed"] += 1
+            continue
+
+        dir_names, file_names, walk_into, _ = listing
+        __delete_entries(connection, "root_id = ? AND rel_dir = ?", (root_id, rel_dir))
+
+        for pos, name in enumerate(dir_names):
+            entry_id += 1
+            rows.append(__entry_row(entry_id, root_id, rel_dir, pos, "folder", name))
+        for pos, name in enumerate(file_names, len(dir_names)):
+            entry_id += 1
+            rows.append(__entry_row(entry_id, root_id, rel_dir, pos, "file", name,
+                                    os.path.splitext(name)[1]))
+
+        new_children = [os.path.join(rel_dir, name) if rel_dir else name
+                        for name in walk_into]
+        for child in set(old_children).difference(new_children):
+            __delete_subtree(connection, root_id, child)
+            stats["removed"] += 1
+
+        connection.execute(
+            "INSERT OR REPLACE INTO dirs (root_id, rel_dir, parent, mtime_ns, walk_key) VALUES (?, ?, ?, ?, ?)",
+            (root_id, rel_dir, os.path.dirname(rel_dir) if rel_dir else None, mtime_ns, walk_key))
+        stats["rescanned"] += 1
+
+        if len(rows) >= INSERT_BATCH:
+            __insert(connection, rows)
+            rows = []
+
+        positions = {name: pos for pos, name in enumerate(dir_names)}
+        stack.extend((child, walk_key + WALK_KEY_FORMAT.format(positions.get(name, len(dir_names))))
+                     for child, name in reversed(list(zip(new_children, walk_into))))
+
+    __insert(connection, rows)
+    return stats
+
+
+def __start_key(connection: sqlite3.Connection, root_id: int, start: str, stored: dict) -> str:
+    """Gets the walk order key of the folder an update starts from. Called from '__update'
+
+    Args:
+        connection (sqlite3.Connection): Connection to the index database
+        root_id (int): Id of the indexed root
+        start (str): Folder relative to the indexed root, "" for the root itself
+        stored (dict): Stored folders {rel_dir: (mtime_ns, walk_key)}
+
+    Returns:
+        str: Walk order key of 'start'
+    """
+    if start in stored:
+        return stored[start][1]
+    if not start:
+        return ""
+
+    parent, name = os.path.split(start)
+    row = connection.execute(
+        "SELECT pos FROM entries WHERE root_id = ? AND rel_dir = ? AND type = 'folder' AND name = ?",
+        (root_id, parent, name)).fetchone()
+    if parent not in stored or row is None:
+        # not reached by a walk from the root (within an ignored folder...): after everything else
+        return "~"
+    return stored[parent][1] + WALK_KEY_FORMAT.format(row[0])
+
+
+def __insert(connection: sqlite3.Connection, rows: list) -> int:
+    """Inserts a batch of rows into 'entries' table, and their trigrams into 'grams' table
+
+    Args:
+        connection (sqlite3.Connection): Connection to the index database
+        rows (list): Rows built by '__entry_row'
+
+    Returns:
+        int: Number of inserted rows
+    """
+    connection.executemany(
+        "INSERT INTO entries (id, root_id, rel_dir, pos, type, name, ext, ext_lower, name_lower, name_ascii, "
+        "name_ascii_lower) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    connection.executemany("INSERT INTO grams (gram, entry_id) VALUES (?, ?)",
+                           [(gram, row[0]) for row in rows for gram in trigrams(row[-1])])
+    return len(rows)
+
+
+def __find_root(connection: sqlite3.Connection, path: str) -> tuple:
+    """Finds the indexed root containing 'path'
+
+    Args:
+        connection (sqlite3.Connection): Connection to the index database
+        path (str): Path to search in
+
+    Raises:
+        NotIndexedPathError: Raised if 'path' is not within any indexed root
+
+    Returns:
+        tuple: (root_id, all_folders, rel_prefix). 'rel_prefix' is 'path' relative to the indexed root
+    """
+    real_path = os.path.realpath(path)
+    found = None
+
+    for root_id, root_path, all_folders in connection.execute("SELECT id, path, all_folders FROM roots"):
+        if real_path != root_path and not real_path.startswith(root_path.rstrip(os.sep) + os.sep):
+            continue
+        # the deepest indexed root wins
+        if found is None or len(root_path) > len(found[1]):
+            found = (root_id, root_path, all_folders)
+
+    if found is None:
+        raise NotIndexedPathError(
+            message=f"path: {path} is not indexed, build the index first")
+
+    rel_prefix = os.path.relpath(real_path, found[1])
+    return found[0], bool(found[2]), "" if rel_prefix == "." else rel_prefix
+
+
+def check_indexed(paths: list, index_path: str = None):
+    """Checks every path is an indexed root or within one
+
+    Args:
+        paths (list): Paths to search in
+        index_path (str, optional): Path to the SQLite database file. Defaults to DEFAULT_INDEX_PATH.
+
+    Raises:
+        NotIndexedPathError: Raised if any path is not within an indexed root
+    """
+    connection = connect(index_path)
+    try:
+        for path in paths:
+            __find_root(connection, path)
+    finally:
+        connection.close()
+
+
+def iter_elements(
+        search_type: str, matcher: custom_utils.Matcher, path: str = ".",
+        ignore_folders: list = None, ext_exclude: list = None, ext_include: list = None, index_path: str = None, all: bool = False, maxdepth: int = None,
+        mindepth: int = None, metadata: custom_utils.MetadataFilter = None):
+    """Searches for coincidences of files / folders in the specified 'path', answering from the index.
+    Same criteria and results than a search walking the directory tree.
+
+    Args:
+        search_type (str): Indicates what to search for {files, folders, both}
+        matcher (custom_utils.Matcher): Checks if a file / folder name matches the searched string
+        path (str, optional): Root path to look for. Must be an indexed root or within one. Defaults to ".".
+        ignore_folders (list, optional): Folders to ignore while searching. Defaults to None.
+        ext_exclude (list, optional): List of extensions to exclude. Defaults to None.
+        ext_include (list, optional): List of extensions to search. Defaults to None.
+        index_path (str, optional): Path to the SQLite database file. Defaults to DEFAULT_INDEX_PATH.
+        all (bool, optional): Indicates the search ignores 'ignore_folders'. Defaults to False.
+        maxdepth (int, optional): Deepest level of coincidences (1 = within 'path'). Defaults to None.
+        mindepth (int, optional): Upper level of coincidences (1 = within 'path'). Defaults to None.
+        metadata (custom_utils.MetadataFilter, optional): Filters by size / modification time, and adds them
+            as columns. Metadata is read from the file system, not from the index. Defaults to None.
+
+    Raises:
+        NotIndexedPathError: Raised if 'path' is not within any indexed root
+
+    Yields:
+        custom_utils.SearchResult: Each found coincidence
+    """
+    ignore_folders = ignore_folders or []
+
+    if os.path.split(path)[1] in ignore_folders:
+        return
+    if metadata is not None and metadata.only_files:
+        # folders have no size
+        if search_type == "folders":
+            return
+        search_type = "files"
+
+    connection = connect(index_path)
+    try:
+        root_id, all_folders, rel_prefix = __find_root(connection, path)
+        if all and not all_folders:
+            index_logger.warning(
+                f"Index of {path} was built ignoring folders, build it with 'all' to search on all folders")
+
+        where, params = __where(connection, search_type, matcher, root_id, rel_prefix,
+                                ignore_folders, ext_exclude, ext_include, maxdepth, mindepth)
+
+        cursor = connection.execute(
+            f"SELECT rel_dir, type, name, ext FROM entries WHERE {where} "
+            "ORDER BY (SELECT walk_key FROM dirs WHERE dirs.root_id = entries.root_id "
+            "AND dirs.rel_dir = entries.rel_dir), pos", params)
+
+        tags = matcher.tags if isinstance(matcher, custom_utils.MultiMatcher) else None
+        skip = len(rel_prefix) + 1 if rel_prefix else 0
+        ignore_set = set(ignore_folders)
+        # folders within an ignored folder (indexed with 'all', or before it was ignored): {rel_dir: pruned}
+        pruned_dirs = {}
+        last_rel_dir = None
+        for rel_dir, type, name, ext in cursor:
+            if rel_dir != last_rel_dir:
+                last_rel_dir = rel_dir
+                dirpath = os.path.join(path, rel_dir[skip:]) if rel_dir[skip:] else path
+                pruned = pruned_dirs.get(rel_dir)
+                if pruned is None:
+                    pruned = pruned_dirs[rel_dir] = bool(rel_dir[skip:]) and \
+                        not ignore_set.isdisjoint(rel_dir[skip:].split(os.sep))
+            if pruned:
+                continue
+
+            columns = None
+            if metadata is not None:
+                try:
+                    stat_result = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    stat_result = None
+                if not metadata.check(stat_result):
+                    continue
+                columns = metadata.values(stat_result) if metadata.columns else None
+
+            patterns = tags(name) if tags else None
+            if type == "folder":
+                yield custom_utils.SearchResult(dirpath, "folder", name, None, patterns, columns)
+            else:
+                yield custom_utils.SearchResult(dirpath, "file", name, ext, patterns, columns)
+    finally:
+        connection.close()
+
+
+def __where(connection: sqlite3.Connection, search_type: str, matcher: custom_utils.Matcher, root_id: int,
+            rel_prefix: str, ignore_folders: list, ext_exclude: list, ext_include: list,
+            maxdepth: int = None, mindepth: int = None) -> tuple:
+    """Translates search criteria into a SQL condition over 'entries' table
+
+    Args:
+        connection (sqlite3.Connection): Connection to the index database, 'fh_match' function is registered on it
+        search_type (str): Indicates what to search for {files, folders, both}
+        matcher (custom_utils.Matcher): Checks if a file / folder name matches the searched string
+        root_id (int): Id of the indexed root
+        rel_prefix (str): Searched path relative to the indexed root
+        ignore_folders (list): Folders to ignore while searching
+        ext_exclude (list): List of extensions to exclude
+        ext_include (list): List of extensions to search
+        maxdepth (int, optional): Deepest level of coincidences (1 = within the searched path). Defaults to None.
+        mindepth (int, optional): Upper level of coincidences (1 = within the searched path). Defaults to None.
+
+    Returns:
+        tuple: (where, params)
+    """
+    conditions = ["root_id = ?"]
+    params = [root_id]
+
+    if rel_prefix:
+        conditions.append("(rel_dir = ? OR (rel_dir >= ? AND rel_dir < ?))")
+        params += [rel_prefix, *__subtree_range(rel_prefix)]
+
+    # name: candidates from trigrams, verified by the actual criteria
+    multi = isinstance(matcher, custom_utils.MultiMatcher)
+    glob = isinstance(matcher, custom_utils.GlobMatcher)
+    if glob:
+        gram_lists = []
+    elif multi:
+        # any pattern: union of each pattern's candidates, unless a pattern has no trigram
+        gram_lists = [__query_grams(matcher, value)[:MAX_PATTERN_GRAMS] for value in matcher.values]
+        if not all(gram_lists) or sum(map(len, gram_lists)) > MAX_MULTI_GRAMS:
+            gram_lists = []
+    else:
+        gram_lists = [__query_grams(matcher, matcher.value)]
+        gram_lists = [grams for grams in gram_lists if grams]
+
+    if gram_lists:
+        # unary '+' keeps SQLite from scanning the whole root, candidates are looked up by id instead
+        conditions = [condition.replace("root_id", "+root_id").replace("(rel_dir", "(+rel_dir")
+                      for condition in conditions]
+        conditions.append("id IN (" + " UNION ".join(
+            "SELECT entry_id FROM (" + " INTERSECT ".join(
+                ["SELECT entry_id FROM grams WHERE gram = ?"] * len(grams)) + ")"
+            for grams in gram_lists) + ")")
+        for grams in gram_lists:
+            params += grams
+
+    if glob:
+        # path relative to the searched folder
+        skip = len(rel_prefix) + 1 if rel_prefix else 0
+        match = matcher.match
+        connection.create_function(
+            "fh_glob", 2, lambda rel_dir, name: 1 if match(os.path.join(rel_dir[skip:], name)) else 0)
+        conditions.append("fh_glob(rel_dir, name)")
+    elif multi or matcher.reg_exp or not isinstance(matcher.value, str):
+        match = matcher.match
+        connection.create_function(
+            "fh_match", 1, lambda name: 1 if match(name) else 0)
+        conditions.append("fh_match(name)")
+    else:
+        needle = custom_utils.unidecode(matcher.value) if matcher.ignore_accents else matcher.value
+        needle = needle.lower() if matcher.ignore_case else needle
+        if needle:
+            conditions.append(
+                f"instr({NAME_COLUMNS[(matcher.ignore_case, matcher.ignore_accents)]}, ?) > 0")
+            params.append(needle)
+
+    # level of the entries within rel_dir: its number of folders (below the searched path) + 1
+    level = ("(CASE WHEN rel_dir = '' THEN 0 ELSE length(rel_dir) - length(replace(rel_dir, ?, '')) + 1 END)"
+             " - ? + 1")
+    prefix_folders = rel_prefix.count(os.sep) + 1 if rel_prefix else 0
+    if maxdepth is not None:
+        conditions.append(f"{level} <= ?")
+        params += [os.sep, prefix_folders, maxdepth]
+    if mindepth is not None:
+        conditions.append(f"{level} >= ?")
+        params += [os.sep, prefix_folders, mindepth]
+
+    # type / extensions, same rules than walking
+    search_folders = search_type in ("folders", "both") and not ext_include
+    search_files = search_type in ("files", "both")
+
+    folder_condition = "type = 'folder'"
+    if ignore_folders:
+        folder_condition += f" AND name_lower NOT IN ({', '.join('?' * len(ignore_folders))})"
+
+    file_condition = "type = 'file'"
+    if ext_include:
+        file_condition += f" AND ext_lower IN ({', '.join('?' * len(ext_include))})"
+    elif ext_exclude:
+        file_condition += f" AND ext_lower NOT IN ({', '.join('?' * len(ext_exclude))})"
+
+    type_conditions = []
+    if search_folders:
+        type_conditions.append(f"({folder_condition})")
+        params += list(ignore_folders)
+    if search_files:
+        type_conditions.append(f"({file_condition})")
+        params += list(ext_include or ext_exclude or [])
+
+    if not type_conditions:
+        type_conditions.append("0")
+    conditions.append(f"({' OR '.join(type_conditions)})")
+
+    return " AND ".join(conditions), params
+
+
+def __query_grams(matcher: custom_utils.Matcher, value) -> list:
+    """Gets the trigrams any name matching 'value' must contain
+
+    Args:
+        matcher (custom_utils.Matcher): Matcher searching for 'value'
+        value (Union[str, re.Pattern]): String / regular expression searched for
+
+    Returns:
+        list[str]: Trigrams (at most MAX_QUERY_GRAMS), empty if there are none
+    """
+    if matcher.reg_exp or not isinstance(value, str):
+        literals = __required_literals(matcher, value)
+    else:
+        literals = [value]
+
+    return sorted({gram for literal in literals for gram in trigrams(fold(literal))})[:MAX_QUERY_GRAMS]
+
+
+def __required_literals(matcher: custom_utils.Matcher, value) -> list:
+    """Gets the literal strings any name matching a regular expression must contain
+
+    Only runs of literal characters at the top level of the expression are considered
+    (alternations, repetitions, classes, ... break a run), so the result may be empty.
+
+    Args:
+        matcher (custom_utils.Matcher): Matcher built with regular expression(s)
+        value (Union[str, re.Pattern]): Regular expression
+
+    Returns:
+        list[str]: Literal strings, each one is a substring of any matching name
+    """
+    if isinstance(value, re.Pattern):
+        pattern, flags = value.pattern, value.flags
+    else:
+        pattern = custom_utils.unidecode(value) if matcher.ignore_accents else value
+        flags = re.IGNORECASE if matcher.ignore_case else 0
+
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except (re.error, TypeError):
+        return []
+
+    literals = []
+    run = ""
+    for op, argument in parsed:
+        if op is sre_parse.LITERAL:
+            run += chr(argument)
+            continue
+        if run:
+            literals.append(run)
+        run = ""
+    if run:
+        literals.append(run)
+
+    return literals
@@ -0,0 +1,172 @@
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+
+def scan_dir(dirpath: str, ignore_folders: set, keep_entries: bool = False):
+    """Lists a single directory, classifying its entries in one pass. Called from 'walk_tree' / 'walk_tree_parallel'
+
+    Uses the type information cached on each 'os.DirEntry' (d_type), so no extra stat calls
+    are made for regular files / folders.
+
+    Args:
+        dirpath (str): Directory to list
+        ignore_folders (set): Folder names to prune. They are neither returned nor descended into
+        keep_entries (bool, optional): Also returns the 'os.DirEntry' of each name, whose 'stat' results are
+            cached (and free on Windows). Defaults to False.
+
+    Returns:
+        tuple | None: (dir_names, file_names, walk_into, entries). Lists of names, 'walk_into' holds the
+            folders that must be descended into (symbolic links are not followed).
+            'entries' is a dictionary {name: os.DirEntry} if 'keep_entries', None otherwise.
+            None if 'dirpath' can't be listed.
+    """
+    dir_names = []
+    file_names = []
+    walk_into = []
+    entries = {} if keep_entries else None
+
+    try:
+        scandir_it = os.scandir(dirpath)
+    except OSError:
+        return None
+
+    try:
+        with scandir_it:
+            for entry in scandir_it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                name = entry.name
+                if keep_entries:
+                    entries[name] = entry
+                if not is_dir:
+                    file_names.append(name)
+                    continue
+
+                if name in ignore_folders:
+                    continue
+
+                dir_names.append(name)
+                try:
+                    is_symlink = entry.is_symlink()
+                except OSError:
+                    is_symlink = False
+                if not is_symlink:
+                    walk_into.append(name)
+    except OSError:
+        # directory became unreadable while listing, skipped as os.walk does
+        return None
+
+    return dir_names, file_names, walk_into, entries
+
+
+def walk_tree(top: str, ignore_folders: set = None, descend=None, keep_entries: bool = False):
+    """Walks the directory tree rooted at 'top', listing each directory only once
+
+    Same order, semantics and results as 'os.walk(top)' (top-down, symbolic links not followed,
+    unreadable directories skipped), but prunes 'ignore_folders' while listing.
+
+    Args:
+        top (str): Root path to walk
+        ignore_folders (set, optional): Folder names to prune. Defaults to None.
+        descend (Callable[[str, str], bool], optional): Called as descend(dirpath, name) for every folder that
+            would be walked, before 'dirpath' is yielded. The folder is pruned if it returns False. Defaults to None.
+        keep_entries (bool, optional): Also yields the 'os.DirEntry' of each name, see 'scan_dir'. Defaults to False.
+
+    Yields:
+        tuple: (dirpath, dir_names, file_names, entries)
+    """
+    if ignore_folders is None:
+        ignore_folders = set()
+
+    stack = [top]
+    while stack:
+        dirpath = stack.pop()
+        listing = scan_dir(dirpath, ignore_folders, keep_entries)
+        if listing is None:
+            continue
+
+        dir_names, file_names, walk_into, entries = listing
+        if descend is not None:
+            walk_into = [name for name in walk_into if descend(dirpath, name)]
+        yield dirpath, dir_names, file_names, entries
+
+        # reversed, so folders are popped in listing order (as os.walk does)
+        for name in reversed(walk_into):
+            stack.append(os.path.join(dirpath, name))
+
+
+def walk_tree_parallel(top: str, ignore_folders: set = None, workers: int = 4, ordered: bool = False,
+                       descend=None, keep_entries: bool = False):
+    """Walks the directory tree rooted at 'top' listing directories on a thread pool
+
+    Useful on high-latency filesystems (NFS, SMB), where most of the time is spent waiting on
+    directory listings. Every listed directory submits its subfolders to the pool's shared queue.
+
+    Args:
+        top (str): Root path to walk
+        ignore_folders (set, optional): Folder names to prune. Defaults to None.
+        workers (int, optional): Number of threads listing directories. Defaults to 4.
+        ordered (bool, optional): If True, directories are yielded in the same order as 'walk_tree'
+            (subfolders are still listed ahead, in parallel). Otherwise they are yielded as soon as
+            they are listed. Defaults to False.
+        descend (Callable[[str, str], bool], optional): Same as 'walk_tree'. It is always called from
+            the consuming thread. Defaults to None.
+        keep_entries (bool, optional): Same as 'walk_tree'. Defaults to False.
+
+    Yields:
+        tuple: (dirpath, dir_names, file_names, entries)
+    """
+    if ignore_folders is None:
+        ignore_folders = set()
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = set()
+
+    def submit(dirpath):
+        future = executor.submit(scan_dir, dirpath, ignore_folders, keep_entries)
+        future.dirpath = dirpath
+        pending.add(future)
+        return future
+
+    try:
+        if ordered:
+            stack = [submit(top)]
+            while stack:
+                future = stack.pop()
+                listing = future.result()
+                pending.discard(future)
+                if listing is None:
+                    continue
+
+                dir_names, file_names, walk_into, entries = listing
+                if descend is not None:
+                    walk_into = [name for name in walk_into if descend(future.dirpath, name)]
+                children = [submit(os.path.join(future.dirpath, name)) for name in walk_into]
+                yield future.dirpath, dir_names, file_names, entries
+
+                stack.extend(reversed(children))
+        else:
+            done = queue.Queue()
+            submit(top).add_done_callback(done.put)
+            while pending:
+                future = done.get()
+                pending.discard(future)
+                listing = future.result()
+                if listing is None:
+                    continue
+
+                dir_names, file_names, walk_into, entries = listing
+                if descend is not None:
+                    walk_into = [name for name in walk_into if descend(future.dirpath, name)]
+                for name in walk_into:
+                    submit(os.path.join(future.dirpath, name)).add_done_callback(done.put)
+                yield future.dirpath, dir_names, file_names, entries
+    finally:
+        # consumer may stop early: drop the directories not listed yet
+        for future in list(pending):
+            future.cancel()
+        executor.shutdown(wait=True)
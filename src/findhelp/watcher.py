@@ -0,0 +1,364 @@
+import os
+import errno
+import ctypes
+import select
+import struct
+import logging
+import threading
+
+import findhelp.walker as walker
+
+from findhelp.custom_exceptions import NotWatchedPathError
+
+
+watcher_logger = logging.getLogger(__name__)
+
+# inotify(7) constants
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+# Events changing a directory listing
+WATCH_MASK = (IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF
+              | IN_ONLYDIR | IN_DONT_FOLLOW)
+
+# struct inotify_event header: wd, mask, cookie, len (name follows, NUL padded)
+EVENT_HEADER = struct.Struct("iIII")
+
+READ_SIZE = 64 * 1024
+
+
+def _load_libc():
+    """Loads the C library exposing inotify
+
+    Raises:
+        OSError: Raised if inotify is not available (not Linux)
+
+    Returns:
+        ctypes.CDLL: C library
+    """
+    # loaded here, it imports subprocess
+    import ctypes.util
+
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+    if not hasattr(libc, "inotify_init1"):
+        raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    return libc
+
+
+class Watcher:
+    """In-memory table of a directory tree, kept up to date with Linux inotify events.
+
+    The tree is listed once (same pruning than searching); afterwards, files / folders created, deleted
+    or renamed are applied as their events arrive, so searching the table costs only matching names.
+    Events are applied by 'process_events', or by a background thread ('start' / 'stop').
+
+    Attributes:
+        path (str): Watched root (real path)
+        ignore_folders (set): Folder names neither listed nor watched
+        tree (dict): For every watched directory (path relative to 'path', "" for the root),
+            its (folders, files) names, as dicts keeping their listing order
+    """
+
+    def __init__(self, path: str = ".", ignore_folders: list = None):
+        """Lists the tree rooted at 'path', watching every directory
+
+        Args:
+            path (str, optional): Root path to watch. Defaults to ".".
+            ignore_folders (list, optional): Folder names neither listed nor watched. Defaults to None.
+
+        Raises:
+            NotADirectoryError: Raised if path is not a directory
+            OSError: Raised if inotify is not available
+        """
+        if not os.path.isdir(path):
+            raise NotADirectoryError(f"path: {path} is not a valid directory")
+
+        self.path = os.path.realpath(path)
+        self.ignore_folders = set(ignore_folders or [])
+        self.tree = {}
+        self.lock = threading.RLock()
+
+        self._libc = _load_libc()
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+        # watch descriptor -> directory, and back
+        self._watches = {}
+        self._wds = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+        with self.lock:
+            self._add_tree("")
+
+    def __repr__(self):
+        return f"Watcher({self.path!r})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _full_path(self, rel_dir: str) -> str:
+        return os.path.join(self.path, rel_dir) if rel_dir else self.path
+
+    def _add_tree(self, rel_dir: str):
+        """Watches and lists the directory 'rel_dir' and all its subfolders
+
+        Args:
+            rel_dir (str): Directory, relative to the root
+        """
+        stack = [rel_dir]
+        while stack:
+            rel_dir = stack.pop()
+            dirpath = self._full_path(rel_dir)
+
+            # watched before listing, so nothing created meanwhile is lost
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                if error not in (errno.ENOENT, errno.ENOTDIR):
+                    watcher_logger.warning(f"{dirpath} can't be watched: {os.strerror(error)}")
+                continue
+
+            listing = walker.scan_dir(dirpath, self.ignore_folders)
+            if listing is None:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                continue
+
+            dir_names, file_names, walk_into, _ = listing
+            self._watches[wd] = rel_dir
+            self._wds[rel_dir] = wd
+            self.tree[rel_dir] = (dict.fromkeys(dir_names), dict.fromkeys(file_names))
+
+            for name in reversed(walk_into):
+                stack.append(os.path.join(rel_dir, name) if rel_dir else name)
+
+    def _remove_tree(self, rel_dir: str):
+        """Forgets (and stops watching) the directory 'rel_dir' and all its subfolders
+
+        Args:
+            rel_dir (str): Directory, relative to the root
+        """
+        stack = [rel_dir]
+        while stack:
+            rel_dir = stack.pop()
+            listing = self.tree.pop(rel_dir, None)
+            if listing is None:
+                continue
+
+            wd = self._wds.pop(rel_dir, None)
+            if wd is not None:
+                del self._watches[wd]
+                self._libc.inotify_rm_watch(self._fd, wd)
+
+            stack.extend(os.path.join(rel_dir, name) if rel_dir else name for name in listing[0])
+
+    def _added(self, rel_dir: str, name: str):
+        """Applies a file / folder created or moved into 'rel_dir'
+
+        Args:
+            rel_dir (str): Directory, relative to the root
+            name (str): Name of the file / folder
+        """
+        dir_names, file_names = self.tree[rel_dir]
+        rel_path = os.path.join(rel_dir, name) if rel_dir else name
+        full_path = os.path.join(self.path, rel_path)
+
+        # symbolic links to folders are listed as folders, but not descended into (as walking)
+        if not os.path.isdir(full_path):
+            dir_names.pop(name, None)
+            file_names[name] = None
+        elif name not in self.ignore_folders:
+            file_names.pop(name, None)
+            dir_names[name] = None
+            if not os.path.islink(full_path):
+                self._remove_tree(rel_path)
+                self._add_tree(rel_path)
+
+    def _removed(self, rel_dir: str, name: str):
+        """Applies a file / folder deleted or moved out of 'rel_dir'
+
+        Args:
+            rel_dir (str): Directory, relative to the root
+            name (str): Name of the file / folder
+        """
+        dir_names, file_names = self.tree[rel_dir]
+        file_names.pop(name, None)
+        if name in dir_names:
+            del dir_names[name]
+            self._remove_tree(os.path.join(rel_dir, name) if rel_dir else name)
+
+    def _reset(self):
+        """Lists the whole tree again, after events were lost"""
+        for wd in self._watches:
+            self._libc.inotify_rm_watch(self._fd, wd)
+        self._watches.clear()
+        self._wds.clear()
+        self.tree.clear()
+        self._add_tree("")
+
+    def process_events(self, timeout: float = 0) -> int:
+        """Applies the pending events to the table
+
+        Args:
+            timeout (float, optional): Seconds to wait for events, if none is pending. Defaults to 0.
+
+        Returns:
+            int: Number of events read
+        """
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return 0
+
+        total = 0
+        while True:
+            try:
+                data = os.read(self._fd, READ_SIZE)
+            except BlockingIOError:
+                break
+
+            with self.lock:
+                offset = 0
+                while offset < len(data):
+                    wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                    offset += EVENT_HEADER.size
+                    name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                    offset += length
+                    total += 1
+                    self._apply(wd, mask, name)
+
+        return total
+
+    def _apply(self, wd: int, mask: int, name: str):
+        """Applies a single event. Called from 'process_events'
+
+        Args:
+            wd (int): Watch descriptor
+            mask (int): Event mask
+            name (str): Name of the file / folder, within the watched directory
+        """
+        if mask & IN_Q_OVERFLOW:
+            watcher_logger.warning(f"Events lost watching {self.path}, listing it again")
+            self._reset()
+            return
+
+        rel_dir = self._watches.get(wd)
+        if rel_dir is None:
+            # directory forgotten meanwhile
+            return
+
+        if mask & IN_IGNORED:
+            # watch removed by the kernel (directory deleted)
+            del self._watches[wd]
+            if self._wds.get(rel_dir) == wd:
+                del self._wds[rel_dir]
+        elif mask & (IN_CREATE | IN_MOVED_TO):
+            self._added(rel_dir, name)
+        elif mask & (IN_DELETE | IN_MOVED_FROM):
+            self._removed(rel_dir, name)
+        elif mask & (IN_DELETE_SELF | IN_MOVE_SELF) and rel_dir == "":
+            watcher_logger.warning(f"Watched root {self.path} was deleted or moved")
+            self._remove_tree("")
+
+    def run(self):
+        """Applies events as they arrive, until 'stop' is called"""
+        while not self._stop.is_set():
+            self.process_events(timeout=0.5)
+
+    def start(self) -> "Watcher":
+        """Applies events on a background (daemon) thread
+
+        Returns:
+            Watcher: Self
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run, name="findhelp-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the background thread, if started"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def close(self):
+        """Stops watching"""
+        self.stop()
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def rel_path(self, path: str) -> str:
+        """Path relative to the watched root
+
+        Args:
+            path (str): Watched root or folder within it
+
+        Raises:
+            NotWatchedPathError: Raised if 'path' is not within the watched root
+
+        Returns:
+            str: Relative path, "" for the root
+        """
+        real_path = os.path.realpath(path)
+        if real_path == self.path:
+            return ""
+        if real_path.startswith(os.path.join(self.path, "")):
+            return os.path.relpath(real_path, self.path)
+        raise NotWatchedPathError(f"path: {path} is not within the watched path {self.path}")
+
+    def iter_tree(self, path: str, ignore_folders: set = None, descend=None):
+        """Walks the table from 'path', as 'walker.walk_tree' walks the directory tree (same order and pruning)
+
+        Args:
+            path (str): Watched root or folder within it. Yielded paths start with it
+            ignore_folders (set, optional): Folder names to prune. Defaults to None.
+            descend (Callable[[str, str], bool], optional): Prunes folders, see 'walker.walk_tree'. Defaults to None.
+
+        Raises:
+            NotWatchedPathError: Raised if 'path' is not within the watched root
+
+        Yields:
+            tuple: (dirpath, dir_names, file_names, entries). 'entries' is always None (stat results are
+                not kept), the same shape as 'walker.walk_tree'.
+        """
+        if ignore_folders is None:
+            ignore_folders = set()
+
+        stack = [(path, self.rel_path(path))]
+        while stack:
+            dirpath, rel_dir = stack.pop()
+            with self.lock:
+                listing = self.tree.get(rel_dir)
+                if listing is None:
+                    continue
+                dir_names = [name for name in listing[0] if name not in ignore_folders]
+                file_names = list(listing[1])
+                walk_into = [name for name in dir_names
+                             if (os.path.join(rel_dir, name) if rel_dir else name) in self.tree]
+
+            if descend is not None:
+                walk_into = [name for name in walk_into if descend(dirpath, name)]
+            yield dirpath, dir_names, file_names, None
+
+            for name in reversed(walk_into):
+                stack.append((os.path.join(dirpath, name), os.path.join(rel_dir, name) if rel_dir else name))
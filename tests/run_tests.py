@@ -6,6 +6,10 @@ subprocess.run(["python", "test_basic.py"])
 subprocess.run(["python", "test_config.py"])
 subprocess.run(["python", "test_console.py"])
 subprocess.run(["python", "test_outputs.py"])
+subprocess.run(["python", "test_index.py"])
+subprocess.run(["python", "test_watcher.py"])
+subprocess.run(["python", "test_searcher.py"])
+subprocess.run(["python", "test_async.py"])
 
 shutil.move("./test_basic_results.txt",
             "../test_results/test_basic_results.txt")
@@ -15,3 +19,11 @@ shutil.move("./test_console_results.txt",
             "../test_results/test_console_results.txt")
 shutil.move("./test_output_results.txt",
             "../test_results/test_output_results.txt")
+shutil.move("./test_index_results.txt",
+            "../test_results/test_index_results.txt")
+shutil.move("./test_watcher_results.txt",
+            "../test_results/test_watcher_results.txt")
+shutil.move("./test_searcher_results.txt",
+            "../test_results/test_searcher_results.txt")
+shutil.move("./test_async_results.txt",
+            "../test_results/test_async_results.txt")
@@ -0,0 +1,122 @@
+import io
+import os
+import sys
+import json
+import asyncio
+import contextlib
+import unittest
+
+from findhelp.finder import go_search
+from findhelp.finder import async_search
+from findhelp.finder import aiter_search
+from setup_files import setup_tests
+from tear_down import tear_down_tests
+
+
+def main(out=sys.stderr, verbosity=2):
+    loader = unittest.TestLoader()
+
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+    unittest.TextTestRunner(out, verbosity=verbosity).run(suite)
+
+
+async def collect(base_dict):
+    return [result async for result in aiter_search(base_dict)]
+
+
+class AsyncTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        setup_tests()
+
+    @classmethod
+    def tearDownClass(cls):
+        tear_down_tests()
+
+    def test_same_as_go_search(self):
+        for base_dict in ({"stringsearch": "one", "output": "list"},
+                          {"stringsearch": ["one", "two"], "ignorecase": True, "output": "list"},
+                          {"stringsearch": "t*/**/*.md", "glob": True, "output": "list"},
+                          {"stringsearch": "one", "maxdepth": 1, "workers": 2, "output": "list"},
+                          {"stringsearch": "one", "workers": 2, "ordered": True, "output": "list"}):
+            base_dict["path"] = "./__search_tests_dummy_folder__"
+            base_result = sorted(go_search(dict(base_dict)))
+
+            # results arrive in listing order
+            self.assertListEqual(sorted(asyncio.run(async_search(dict(base_dict)))), base_result)
+            self.assertListEqual(sorted(asyncio.run(collect(dict(base_dict)))), base_result)
+
+    def test_limit(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__", "stringsearch": "one", "output": "obj_list", "limit": 2
+        }
+        base_result = go_search({key: value for key, value in base_dict.items() if key != "limit"})
+
+        result = asyncio.run(collect(dict(base_dict)))
+        self.assertEqual(len(result), 2)
+        for line in result:
+            self.assertIn(line, base_result)
+
+        self.assertTrue(asyncio.run(async_search(dict(base_dict))).truncated)
+        result = asyncio.run(async_search(dict(base_dict, limit=len(base_result))))
+        self.assertEqual(len(result), len(base_result))
+        self.assertFalse(result.truncated)
+
+    def test_streamed_outputs(self):
+        base_dict = {"path": "./__search_tests_dummy_folder__", "stringsearch": "o", "limit": 3,
+                     "outputfilename": "_test_async_result"}
+        base_result = go_search(dict(base_dict, output="obj_list", limit=None))
+
+        self.assertEqual(asyncio.run(async_search(dict(base_dict, output="ndjson"))), 3)
+        self.addCleanup(os.remove, "_test_async_result.ndjson")
+        with open("_test_async_result.ndjson", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), 5)
+        for line in lines[1:-1]:
+            self.assertIn(line, base_result)
+        self.assertTrue(lines[-1]["truncated"])
+
+        self.assertEqual(asyncio.run(async_search(dict(base_dict, output="csv"))), 3)
+        self.addCleanup(os.remove, "_test_async_result.csv")
+        with open("_test_async_result.csv", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0].split("\t"), list(base_result[0]))
+        self.assertEqual(len(lines), 4)
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual(asyncio.run(async_search(dict(base_dict, output="console"))), 3)
+        self.assertEqual(len(output.getvalue().splitlines()), 5)
+
+    def test_cancel(self):
+        async def cancelled():
+            task = asyncio.create_task(async_search(
+                {"path": "./__search_tests_dummy_folder__", "stringsearch": "one", "output": "list"}))
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancelled())
+
+    def test_cancel_streamed(self):
+        async def cancelled():
+            task = asyncio.create_task(async_search(
+                {"path": "./__search_tests_dummy_folder__", "stringsearch": "o", "output": "csv",
+                 "outputfilename": "_test_async_cancelled"}))
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        try:
+            asyncio.run(asyncio.wait_for(cancelled(), 10))
+        finally:
+            if os.path.exists("_test_async_cancelled.csv"):
+                os.remove("_test_async_cancelled.csv")
+
+
+if __name__ == "__main__":
+    with open('test_async_results.txt', 'w') as f:
+        main(f)
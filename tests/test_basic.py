@@ -1,6 +1,13 @@
 import unittest
+import os
 import sys
+import types
+import pathlib
+import subprocess
+import datetime
 from findhelp.finder import go_search
+from findhelp.finder import iter_search
+from findhelp.finder import go_search_many
 from setup_files import setup_tests
 from tear_down import tear_down_tests
 from findhelp.custom_exceptions import NotValidArgumentError
@@ -222,6 +229,29 @@ class BasicTests(unittest.TestCase):
         result = go_search(base_dict)
         self.assertListEqual(sorted(base_result), sorted(result))
 
+    def test_regexp_ignore_case(self):
+        base_dict = {
+            "path": ".",
+            "stringsearch": "^ON[EÉ]\\.",
+            "output": "list",
+            "regexp": True,
+            "ignorecase": True
+        }
+        base_result = [
+            ['./__search_tests_dummy_folder__/test/dir1', 'file',
+                './__search_tests_dummy_folder__/test', 'dir1', 'one.txt', '.txt'],
+            ['./__search_tests_dummy_folder__/test/dir2', 'file',
+                './__search_tests_dummy_folder__/test', 'dir2', 'one.md', '.md'],
+            ['./__search_tests_dummy_folder__/test1', 'file',
+                './__search_tests_dummy_folder__', 'test1', 'one.csv', '.csv'],
+            ['./__search_tests_dummy_folder__/test1', 'file',
+                './__search_tests_dummy_folder__', 'test1', 'oné.csv', '.csv'],
+            ['./__search_tests_dummy_folder__/test2/test01', 'file',
+                './__search_tests_dummy_folder__/test2', 'test01', 'one.md', '.md']
+        ]
+        result = go_search(base_dict)
+        self.assertListEqual(sorted(base_result), sorted(result))
+
     def test_include_all(self):
         base_dict = {
             "path": ".",
@@ -266,6 +296,464 @@ class BasicTests(unittest.TestCase):
         result = go_search(base_dict)
         self.assertListEqual(sorted(base_result), sorted(result))
 
+    def test_workers(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "one",
+            "output": "list",
+            "workers": 4
+        }
+        result = go_search(base_dict)
+
+        base_result = [
+            ['./__search_tests_dummy_folder__',
+                'folder', '.', 'one', None, None],
+            ['./__search_tests_dummy_folder__/test/dir1', 'file',
+                './__search_tests_dummy_folder__/test', 'dir1', 'one.txt', '.txt'],
+            ['./__search_tests_dummy_folder__/test/dir2', 'file',
+                './__search_tests_dummy_folder__/test', 'dir2', 'one.md', '.md'],
+            ['./__search_tests_dummy_folder__/test1', 'file',
+                './__search_tests_dummy_folder__', 'test1', 'one.csv', '.csv'],
+            ['./__search_tests_dummy_folder__/test2/test01', 'file',
+                './__search_tests_dummy_folder__/test2', 'test01', 'one.md', '.md']
+        ]
+
+        self.assertListEqual(sorted(base_result), sorted(result))
+
+    def test_workers_ordered(self):
+        base_dict = {
+            "path": ".",
+            "stringsearch": "o",
+            "output": "list",
+            "all": True
+        }
+        base_result = go_search(dict(base_dict))
+        result = go_search(dict(base_dict, workers=4, ordered=True))
+        self.assertListEqual(base_result, result)
+
+    def test_multiple_roots(self):
+        base_dict = {
+            "path": ["./__search_tests_dummy_folder__/test1", "./__search_tests_dummy_folder__/test",
+                     "./__search_tests_dummy_folder__/test/dir1", "./__search_tests_dummy_folder__/test1"],
+            "stringsearch": "one",
+            "output": "list"
+        }
+        base_result = [
+            ['./__search_tests_dummy_folder__/test1', 'file',
+                './__search_tests_dummy_folder__', 'test1', 'one.csv', '.csv'],
+            ['./__search_tests_dummy_folder__/test/dir1', 'file',
+                './__search_tests_dummy_folder__/test', 'dir1', 'one.txt', '.txt'],
+            ['./__search_tests_dummy_folder__/test/dir2', 'file',
+                './__search_tests_dummy_folder__/test', 'dir2', 'one.md', '.md']
+        ]
+        result = go_search(dict(base_dict))
+        self.assertListEqual(base_result, result)
+
+        result = go_search(dict(base_dict, processes=2))
+        self.assertListEqual(base_result, result)
+
+    def test_nested_roots_maxdepth(self):
+        # depth is counted from each root, so the nested one is searched on its own
+        base_dict = {
+            "path": ["./__search_tests_dummy_folder__", "./__search_tests_dummy_folder__/test"],
+            "stringsearch": "one",
+            "maxdepth": 2,
+            "output": "list"
+        }
+        base_result = [
+            ['./__search_tests_dummy_folder__', 'folder',
+                '.', 'one', None, None],
+            ['./__search_tests_dummy_folder__/test1', 'file',
+                './__search_tests_dummy_folder__', 'test1', 'one.csv', '.csv'],
+            ['./__search_tests_dummy_folder__/test/dir1', 'file',
+                './__search_tests_dummy_folder__/test', 'dir1', 'one.txt', '.txt'],
+            ['./__search_tests_dummy_folder__/test/dir2', 'file',
+                './__search_tests_dummy_folder__/test', 'dir2', 'one.md', '.md']
+        ]
+        result = go_search(dict(base_dict))
+        self.assertListEqual(base_result, result)
+
+    def test_roots_file(self):
+        roots_file = "_test_roots.txt"
+        with open(roots_file, "w") as f:
+            f.write("# roots\n./__search_tests_dummy_folder__/test1\n\n./__search_tests_dummy_folder__/test2\n")
+        self.addCleanup(os.remove, roots_file)
+
+        base_dict = {
+            "path": roots_file,
+            "stringsearch": "one",
+            "output": "list",
+            "processes": 2
+        }
+        result = go_search(base_dict)
+
+        base_result = [
+            ['./__search_tests_dummy_folder__/test1', 'file',
+                './__search_tests_dummy_folder__', 'test1', 'one.csv', '.csv'],
+            ['./__search_tests_dummy_folder__/test2/test01', 'file',
+                './__search_tests_dummy_folder__/test2', 'test01', 'one.md', '.md']
+        ]
+        self.assertListEqual(base_result, result)
+
+    def test_iter_search(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "one",
+            "output": "list"
+        }
+        result = iter_search(dict(base_dict))
+        self.assertIsInstance(result, types.GeneratorType)
+        self.assertListEqual(go_search(dict(base_dict)), list(result))
+
+        first = next(iter_search(dict(base_dict, output="obj_list")))
+        self.assertEqual(first["folder_name"], "one")
+
+    def test_iter_search_not_valid(self):
+        with self.assertRaises(NotADirectoryError):
+            iter_search({"path": "./dummy_folder/", "stringsearch": "one"})
+
+    def test_multiple_patterns(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__/test2",
+            "stringsearch": ["one", "file1", "missing"],
+            "output": "list"
+        }
+        result = go_search(base_dict)
+
+        base_result = [
+            ['./__search_tests_dummy_folder__/test2/test01', 'file',
+                './__search_tests_dummy_folder__/test2', 'test01', 'file1.ext', '.ext', ['file1']],
+            ['./__search_tests_dummy_folder__/test2/test01', 'file',
+                './__search_tests_dummy_folder__/test2', 'test01', 'one.md', '.md', ['one']]
+        ]
+        self.assertListEqual(sorted(base_result), sorted(result))
+
+    def test_patterns_file(self):
+        patterns_file = "_test_patterns.txt"
+        with open(patterns_file, "w", encoding="utf-8") as f:
+            f.write("one\n\n.csv\n")
+        self.addCleanup(os.remove, patterns_file)
+
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__/test1",
+            "stringsearch": pathlib.Path(patterns_file),
+            "ignoreaccents": True,
+            "output": "obj_list"
+        }
+        result = go_search(base_dict)
+
+        base_result = {
+            "one.csv": ["one", ".csv"],
+            "onè.json": ["one"],
+            "oné.csv": ["one", ".csv"]
+        }
+        self.assertDictEqual(base_result, {found["file_name"]: found["patterns"] for found in result})
+
+    def test_multiple_regexp(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__/test2",
+            "stringsearch": ["^one", "\\.mp[34]$", "(e)\\1"],
+            "regexp": True,
+            "onlyfiles": True,
+            "output": "obj_list"
+        }
+        result = go_search(base_dict)
+
+        base_result = {
+            "file2.mp3": ["\\.mp[34]$"],
+            "file3.mp4": ["\\.mp[34]$"],
+            "one.md": ["^one"]
+        }
+        self.assertDictEqual(base_result, {found["file_name"]: found["patterns"] for found in result})
+
+    def test_glob(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "test*/**/one.*",
+            "glob": True,
+            "output": "list"
+        }
+        result = go_search(base_dict)
+
+        base_result = [
+            ['./__search_tests_dummy_folder__/test/dir1', 'file',
+                './__search_tests_dummy_folder__/test', 'dir1', 'one.txt', '.txt'],
+            ['./__search_tests_dummy_folder__/test/dir2', 'file',
+                './__search_tests_dummy_folder__/test', 'dir2', 'one.md', '.md'],
+            ['./__search_tests_dummy_folder__/test1', 'file',
+                './__search_tests_dummy_folder__', 'test1', 'one.csv', '.csv'],
+            ['./__search_tests_dummy_folder__/test2/test01', 'file',
+                './__search_tests_dummy_folder__/test2', 'test01', 'one.md', '.md']
+        ]
+        self.assertListEqual(sorted(base_result), sorted(result))
+
+    def test_glob_roots(self):
+        # patterns are relative to each root, so the nested one is searched on its own
+        base_dict = {
+            "path": ["./__search_tests_dummy_folder__", "./__search_tests_dummy_folder__/test"],
+            "stringsearch": "dir?/one.*",
+            "glob": True,
+            "output": "list"
+        }
+        result = go_search(base_dict)
+
+        base_result = [
+            ['./__search_tests_dummy_folder__/test/dir1', 'file',
+                './__search_tests_dummy_folder__/test', 'dir1', 'one.txt', '.txt'],
+            ['./__search_tests_dummy_folder__/test/dir2', 'file',
+                './__search_tests_dummy_folder__/test', 'dir2', 'one.md', '.md']
+        ]
+        self.assertListEqual(sorted(base_result), sorted(result))
+
+    def test_glob_folders(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "TEST/dir?",
+            "glob": True,
+            "ignorecase": True,
+            "onlydirs": True,
+            "output": "list"
+        }
+        result = go_search(base_dict)
+
+        base_result = [
+            ['./__search_tests_dummy_folder__/test', 'folder',
+                './__search_tests_dummy_folder__', 'dir1', None, None],
+            ['./__search_tests_dummy_folder__/test', 'folder',
+                './__search_tests_dummy_folder__', 'dir2', None, None],
+            ['./__search_tests_dummy_folder__/test', 'folder',
+                './__search_tests_dummy_folder__', 'dir3', None, None]
+        ]
+        self.assertListEqual(sorted(base_result), sorted(result))
+
+    def test_glob_regexp(self):
+        with self.assertRaises(NotValidArgumentError):
+            base_dict = {
+                "stringsearch": "*.md",
+                "glob": True,
+                "regexp": True
+            }
+            go_search(base_dict)
+
+    def test_maxdepth(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "one",
+            "maxdepth": 2,
+            "output": "list"
+        }
+        result = go_search(base_dict)
+
+        base_result = [
+            ['./__search_tests_dummy_folder__', 'folder',
+                '.', 'one', None, None],
+            ['./__search_tests_dummy_folder__/test1', 'file',
+                './__search_tests_dummy_folder__', 'test1', 'one.csv', '.csv']
+        ]
+        self.assertListEqual(sorted(base_result), sorted(result))
+
+    def test_mindepth(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "one",
+            "mindepth": 3,
+            "output": "list"
+        }
+        result = go_search(base_dict)
+
+        base_result = [
+            ['./__search_tests_dummy_folder__/test/dir1', 'file',
+                './__search_tests_dummy_folder__/test', 'dir1', 'one.txt', '.txt'],
+            ['./__search_tests_dummy_folder__/test/dir2', 'file',
+                './__search_tests_dummy_folder__/test', 'dir2', 'one.md', '.md'],
+            ['./__search_tests_dummy_folder__/test2/test01', 'file',
+                './__search_tests_dummy_folder__/test2', 'test01', 'one.md', '.md']
+        ]
+        self.assertListEqual(sorted(base_result), sorted(result))
+
+    def test_depth_roots(self):
+        # as many searches as roots, each one counting depth from its own root
+        roots = ["./__search_tests_dummy_folder__", "./__search_tests_dummy_folder__/test"]
+        for base_dict in ({"stringsearch": "one", "maxdepth": 1},
+                          {"stringsearch": "one", "mindepth": 2},
+                          {"stringsearch": "o", "mindepth": 2, "maxdepth": 2},
+                          {"stringsearch": "one", "mindepth": 2, "processes": 2}):
+            base_dict = dict(base_dict, output="list")
+            with self.subTest(base_dict=base_dict):
+                base_result = [row for root in roots for row in go_search(dict(base_dict, path=root))]
+                self.assertListEqual(base_result, go_search(dict(base_dict, path=roots)))
+
+    def test_not_valid_depth(self):
+        for base_dict in ({"stringsearch": "one", "maxdepth": 0},
+                          {"stringsearch": "one", "maxdepth": 2, "mindepth": 3},
+                          {"stringsearch": "one", "maxdepth": True},
+                          {"stringsearch": "one", "mindepth": True}):
+            with self.subTest(base_dict=base_dict):
+                with self.assertRaises(NotValidArgumentError):
+                    go_search(base_dict)
+
+    def test_size(self):
+        file_path = "./__search_tests_dummy_folder__/test/dir1/one.txt"
+        with open(file_path, "w") as new_file:
+            new_file.write("0123456789")
+        try:
+            result = go_search({
+                "path": "./__search_tests_dummy_folder__",
+                "stringsearch": "one",
+                "minsize": "10",
+                "output": "list"
+            })
+            base_result = [
+                ['./__search_tests_dummy_folder__/test/dir1', 'file',
+                    './__search_tests_dummy_folder__/test', 'dir1', 'one.txt', '.txt']
+            ]
+            self.assertListEqual(base_result, result)
+
+            # folders are skipped when filtering by size
+            result = go_search({
+                "path": "./__search_tests_dummy_folder__",
+                "stringsearch": "one",
+                "maxsize": "5",
+                "output": "list"
+            })
+            self.assertNotIn('folder', [line[1] for line in result])
+            self.assertNotIn('one.txt', [line[4] for line in result])
+        finally:
+            open(file_path, "w").close()
+
+    def test_modification_time(self):
+        file_path = "./__search_tests_dummy_folder__/test/dir2/one.md"
+        os.utime(file_path, (0, 0))
+        try:
+            base_dict = {
+                "path": "./__search_tests_dummy_folder__",
+                "stringsearch": "one",
+                "onlyfiles": True,
+                "output": "list"
+            }
+            result = go_search(dict(base_dict, older="1d"))
+            base_result = [
+                ['./__search_tests_dummy_folder__/test/dir2', 'file',
+                    './__search_tests_dummy_folder__/test', 'dir2', 'one.md', '.md']
+            ]
+            self.assertListEqual(base_result, result)
+
+            result = go_search(dict(base_dict, newer="1d"))
+            self.assertNotIn('one.md', [line[4] for line in result if line[3] == 'dir2'])
+            self.assertEqual(len(go_search(dict(base_dict))) - 1, len(result))
+        finally:
+            os.utime(file_path)
+
+    def test_metadata(self):
+        result = go_search({
+            "path": "./__search_tests_dummy_folder__/test1",
+            "stringsearch": "one.csv",
+            "metadata": True,
+            "output": "obj_list"
+        })
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["size"], 0)
+        self.assertIsInstance(result[0]["mtime"], datetime.datetime)
+
+    def test_not_valid_size(self):
+        for base_dict in ({"stringsearch": "one", "minsize": "ten"},
+                          {"stringsearch": "one", "newer": "yesterday"}):
+            with self.subTest(base_dict=base_dict):
+                with self.assertRaises(NotValidArgumentError):
+                    go_search(base_dict)
+
+    def test_limit(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "one",
+            "output": "list"
+        }
+        base_result = go_search(dict(base_dict))
+
+        result = go_search(dict(base_dict, limit=2))
+        self.assertListEqual(base_result[:2], result)
+        self.assertTrue(result.truncated)
+
+        result = go_search(dict(base_dict, limit=100))
+        self.assertListEqual(base_result, result)
+        self.assertFalse(result.truncated)
+
+        for criteria in ({"workers": 4}, {"workers": 4, "ordered": True}):
+            with self.subTest(criteria=criteria):
+                result = go_search(dict(base_dict, limit=2, **criteria))
+                self.assertEqual(len(result), 2)
+                self.assertTrue(all(line in base_result for line in result))
+
+    def test_limit_roots(self):
+        base_dict = {
+            "path": ["./__search_tests_dummy_folder__/test1", "./__search_tests_dummy_folder__/test"],
+            "stringsearch": "one",
+            "output": "list"
+        }
+        base_result = go_search(dict(base_dict))
+        self.assertListEqual(base_result[:2], go_search(dict(base_dict, limit=2)))
+        self.assertListEqual(base_result[:2], go_search(dict(base_dict, limit=2, processes=2)))
+
+    def test_exact_limit(self):
+        # exactly 'limit' coincidences: nothing was left out
+        base_dict = {
+            "path": ["./__search_tests_dummy_folder__/test1", "./__search_tests_dummy_folder__/test"],
+            "stringsearch": "one",
+            "output": "list"
+        }
+        base_result = go_search(dict(base_dict))
+        limit = len(base_result)
+
+        for criteria in ({}, {"processes": 2}, {"workers": 4}):
+            with self.subTest(criteria=criteria):
+                result = go_search(dict(base_dict, limit=limit, **criteria))
+                self.assertListEqual(base_result, result)
+                self.assertFalse(result.truncated)
+                self.assertTrue(go_search(dict(base_dict, limit=limit - 1, **criteria)).truncated)
+
+        result, truncated = go_search_many([dict(base_dict, limit=limit), dict(base_dict, limit=limit - 1)])
+        self.assertFalse(result.truncated)
+        self.assertTrue(truncated.truncated)
+
+    def test_not_valid_limit(self):
+        with self.assertRaises(NotValidArgumentError):
+            go_search({"stringsearch": "one", "limit": 0})
+
+    def test_not_valid_bool(self):
+        # bool is an int, but not a number of results / workers
+        for key in ("limit", "maxdepth", "mindepth", "workers", "processes"):
+            with self.subTest(key=key):
+                with self.assertRaises(NotValidArgumentError):
+                    go_search({"stringsearch": "one", key: True})
+
+    def test_directory_separator(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__/test",
+            "stringsearch": "one",
+            "directoryseparator": "\\"
+        }
+        base_result = [
+            ['.\\__search_tests_dummy_folder__\\test\\dir1', 'file',
+                '.\\__search_tests_dummy_folder__\\test', 'dir1', 'one.txt', '.txt'],
+            ['.\\__search_tests_dummy_folder__\\test\\dir2', 'file',
+                '.\\__search_tests_dummy_folder__\\test', 'dir2', 'one.md', '.md']
+        ]
+        self.assertListEqual(base_result, go_search(dict(base_dict, output="list")))
+        self.assertListEqual(base_result, list(iter_search(dict(base_dict, output="list"))))
+        self.assertListEqual(base_result[0], list(go_search(dict(base_dict, output="obj_list"))[0].values()))
+
+    def test_not_valid_output(self):
+        with self.assertRaises(NotValidArgumentError):
+            go_search({"stringsearch": "one", "output": "xml"})
+
+    def test_not_valid_workers(self):
+        with self.assertRaises(NotValidArgumentError):
+            base_dict = {
+                "stringsearch": "one",
+                "workers": 0
+            }
+            go_search(base_dict)
+
     def test_empty_dict(self):
         with self.assertRaises(NotValidArgumentError):
             base_dict = {}
@@ -287,6 +775,32 @@ class BasicTests(unittest.TestCase):
             }
             go_search(base_dict)
 
+    def test_search_many(self):
+        queries = [
+            {"stringsearch": "one", "output": "list"},
+            {"stringsearch": ["one", "two"], "ignorecase": True, "output": "obj_list"},
+            {"stringsearch": "", "ext": [".md"], "onlyfiles": True, "output": "list", "limit": 1},
+            {"stringsearch": "test/**/*.txt", "glob": True, "output": "list"},
+            {"stringsearch": "one", "maxdepth": 1, "output": "list"},
+            {"stringsearch": "one", "all": True, "output": "list"}
+        ]
+        queries = [dict(query, path="./__search_tests_dummy_folder__") for query in queries]
+
+        base_result = [go_search(dict(query)) for query in queries]
+        result = go_search_many([dict(query) for query in queries])
+        self.assertListEqual(result, base_result)
+        self.assertEqual(len(result[2]), 1)
+
+    def test_lazy_imports(self):
+        # pandas only for 'df', unidecode only for 'ignoreaccents', multiprocessing only for 'processes',
+        # sqlite3 only for 'index', ctypes only for 'watcher'
+        code = ("import sys; from findhelp.finder import go_search; "
+                "go_search({'path': './__search_tests_dummy_folder__', 'stringsearch': 'one', 'output': 'list'}); "
+                "print(sorted({'pandas', 'numpy', 'unidecode', 'multiprocessing', 'sqlite3', 'ctypes'} "
+                "& set(sys.modules)))")
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "[]")
+
 
 if __name__ == "__main__":
     with open('test_basic_results.txt', 'w') as f:
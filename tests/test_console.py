@@ -1,8 +1,12 @@
 import sys
+import time
 from io import StringIO
 import unittest
+import contextlib
 
+import findhelp.finder as fhp
 from findhelp.finder import go_search
+from findhelp.custom_utils import SearchResult
 from setup_files import setup_tests
 from tear_down import tear_down_tests
 
@@ -43,6 +47,48 @@ class ConsoleTests(unittest.TestCase):
         result = go_search(base_dict)
         self.assertEqual(result, 0)
 
+    def test_printed_rows(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "one",
+            "limit": 2
+        }
+        start = len(self.capturedOutput.getvalue())
+        result = go_search(base_dict)
+        self.assertEqual(result, 2)
+
+        lines = self.capturedOutput.getvalue()[start:].splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[0].split(), ["fullpath", "type", "folder_parent", "folder_name", "file_name", "ext"])
+        type_column = lines[0].index("type")
+        for line in lines[1:3]:
+            self.assertIn(line[type_column:].split()[0], ("file", "folder"))
+        self.assertEqual(lines[-1], "... limit of 2 result(s) reached, search stopped")
+
+    def test_slow_search(self):
+        # rows found are written while the search keeps looking for the next ones
+        output = StringIO()
+        written = []
+
+        def slow_search():
+            yield SearchResult("dummy/first", "file", "first.txt", ".txt")
+            timeout = time.perf_counter() + 50 * fhp.CONSOLE_FLUSH
+            while "first.txt" not in output.getvalue() and time.perf_counter() < timeout:
+                time.sleep(fhp.CONSOLE_FLUSH / 10)
+            written.append(output.getvalue())
+            yield SearchResult("dummy/second", "file", "second.txt", ".txt")
+
+        print_console = getattr(fhp, "__print_console")
+        with contextlib.redirect_stdout(output):
+            count = print_console(slow_search(), {"directoryseparator": "/"})
+
+        self.assertEqual(count, 2)
+        self.assertIn("first.txt", written[0])
+        self.assertNotIn("second.txt", written[0])
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn("second.txt", lines[2])
+
 
 if __name__ == "__main__":
     with open('test_console_results.txt', 'w') as f:
@@ -0,0 +1,185 @@
+import os
+import sys
+import shutil
+import unittest
+
+from findhelp.finder import go_search
+from findhelp.finder import build_index
+from findhelp.finder import refresh_index
+from findhelp.custom_exceptions import NotIndexedPathError
+from setup_files import setup_tests
+from tear_down import tear_down_tests
+
+
+INDEX_PATH = "_test_index.sqlite3"
+
+
+def main(out=sys.stderr, verbosity=2):
+    loader = unittest.TestLoader()
+
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+    unittest.TextTestRunner(out, verbosity=verbosity).run(suite)
+
+
+class IndexTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        setup_tests()
+        build_index("./__search_tests_dummy_folder__", INDEX_PATH)
+
+    @classmethod
+    def tearDownClass(cls):
+        if os.path.exists(INDEX_PATH):
+            os.remove(INDEX_PATH)
+        tear_down_tests()
+
+    def assert_same_as_walk(self, base_dict):
+        base_result = go_search(dict(base_dict))
+        result = go_search(dict(base_dict, index=INDEX_PATH))
+        self.assertListEqual(base_result, result)
+
+    def test_search_one(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "one",
+            "output": "list",
+            "index": INDEX_PATH
+        }
+        result = go_search(base_dict)
+
+        base_result = [
+            ['./__search_tests_dummy_folder__',
+                'folder', '.', 'one', None, None],
+            ['./__search_tests_dummy_folder__/test/dir1', 'file',
+                './__search_tests_dummy_folder__/test', 'dir1', 'one.txt', '.txt'],
+            ['./__search_tests_dummy_folder__/test/dir2', 'file',
+                './__search_tests_dummy_folder__/test', 'dir2', 'one.md', '.md'],
+            ['./__search_tests_dummy_folder__/test1', 'file',
+                './__search_tests_dummy_folder__', 'test1', 'one.csv', '.csv'],
+            ['./__search_tests_dummy_folder__/test2/test01', 'file',
+                './__search_tests_dummy_folder__/test2', 'test01', 'one.md', '.md']
+        ]
+
+        self.assertListEqual(sorted(base_result), sorted(result))
+
+    def test_same_as_walk(self):
+        base_dicts = [
+            {"stringsearch": "OnE", "ignorecase": True},
+            {"stringsearch": "one", "ignoreaccents": True},
+            {"stringsearch": "o[nñ][eéè].", "regexp": True},
+            {"ext": ["md", "json"]},
+            {"stringsearch": "2", "onlydirs": True},
+            {"stringsearch": "2", "onlyfiles": True},
+            {"stringsearch": "w", "ext": ["csv", "txt"]},
+            {"stringsearch": "test0"},
+            {"stringsearch": "^tw.\\.csv$", "regexp": True},
+            {"stringsearch": ["one", "tw", "dir2"], "ignoreaccents": True},
+            {"stringsearch": ["^on", "\\.csv$"], "regexp": True},
+            {"stringsearch": "test*/**/one.*", "glob": True},
+            {"stringsearch": "o", "maxdepth": 2, "mindepth": 2},
+        ]
+        for base_dict in base_dicts:
+            with self.subTest(base_dict=base_dict):
+                self.assert_same_as_walk(
+                    dict(base_dict, path="./__search_tests_dummy_folder__", output="obj_list"))
+
+    def test_sub_path(self):
+        self.assert_same_as_walk({
+            "path": "./__search_tests_dummy_folder__/test/",
+            "stringsearch": "o",
+            "output": "list",
+        })
+
+    def test_refresh(self):
+        stats = refresh_index("./__search_tests_dummy_folder__", INDEX_PATH)
+        self.assertEqual(stats["rescanned"], 0)
+
+        new_file = "./__search_tests_dummy_folder__/test3/new_file.txt"
+        with open(new_file, "w") as f:
+            pass
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "new_file",
+            "output": "list"
+        }
+        stats = refresh_index("./__search_tests_dummy_folder__", INDEX_PATH)
+        result = go_search(dict(base_dict, index=INDEX_PATH))
+        os.remove(new_file)
+
+        self.assertEqual(stats["rescanned"], 1)
+        self.assertListEqual(go_search(dict(base_dict)), [])
+        self.assertListEqual(result, [
+            ['./__search_tests_dummy_folder__/test3', 'file',
+                './__search_tests_dummy_folder__', 'test3', 'new_file.txt', '.txt']
+        ])
+
+        refresh_index("./__search_tests_dummy_folder__/test3", INDEX_PATH)
+        self.assertListEqual(go_search(dict(base_dict, index=INDEX_PATH)), [])
+
+    def test_built_with_all(self):
+        # an index of all folders answers searches ignoring folders as walking does
+        index_all = "_test_index_all.sqlite3"
+        self.addCleanup(os.remove, index_all)
+        # walked (not pruned) but not found, as the name differs in case only
+        test3 = "./__search_tests_dummy_folder__/test3"
+        stat_result = os.stat(test3)
+        os.makedirs(os.path.join(test3, "Node_Modules", "one_inside"))
+        # test3 left unchanged for the class index (see 'test_refresh')
+        self.addCleanup(os.utime, test3, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+        self.addCleanup(shutil.rmtree, os.path.join(test3, "Node_Modules"))
+        build_index("./__search_tests_dummy_folder__", index_all, all=True)
+
+        for base_dict in ({"stringsearch": "dummy"},
+                          {"stringsearch": "one"},
+                          {"stringsearch": "_inside", "onlydirs": True},
+                          {"stringsearch": "_Modules", "ignorecase": True},
+                          {"stringsearch": "sp_", "all": True},
+                          {"path": "./__search_tests_dummy_folder__/test2", "stringsearch": "o"}):
+            base_dict = dict({"path": "./__search_tests_dummy_folder__", "output": "list"}, **base_dict)
+            with self.subTest(base_dict=base_dict):
+                base_result = go_search(dict(base_dict))
+                self.assertListEqual(base_result, go_search(dict(base_dict, index=index_all)))
+
+    def test_refresh_order(self):
+        # rescanned folders are back in walk order, not after everything else
+        index_order = "_test_index_order.sqlite3"
+        self.addCleanup(os.remove, index_order)
+        build_index("./__search_tests_dummy_folder__", index_order)
+
+        test = "./__search_tests_dummy_folder__/test"
+        test1 = "./__search_tests_dummy_folder__/test1"
+        for folder in (test, test1):
+            stat_result = os.stat(folder)
+            # left unchanged for the class index (see 'test_refresh')
+            self.addCleanup(os.utime, folder, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+        os.makedirs(os.path.join(test, "dir0", "one_new"))
+        self.addCleanup(shutil.rmtree, os.path.join(test, "dir0"))
+        open(os.path.join(test, "dir0", "one.new"), "w").close()
+        open(os.path.join(test1, "one_new.txt"), "w").close()
+        self.addCleanup(os.remove, os.path.join(test1, "one_new.txt"))
+
+        stats = refresh_index("./__search_tests_dummy_folder__", index_order)
+        self.assertEqual(stats["rescanned"], 4)
+
+        for base_dict in ({"stringsearch": "o"},
+                          {"stringsearch": "one", "limit": 4},
+                          {"path": test, "stringsearch": "o"}):
+            base_dict = dict({"path": "./__search_tests_dummy_folder__", "output": "list"}, **base_dict)
+            with self.subTest(base_dict=base_dict):
+                base_result = go_search(dict(base_dict))
+                self.assertListEqual(base_result, go_search(dict(base_dict, index=index_order)))
+
+    def test_not_indexed(self):
+        with self.assertRaises(NotIndexedPathError):
+            base_dict = {
+                "path": ".",
+                "stringsearch": "one",
+                "index": INDEX_PATH
+            }
+            go_search(base_dict)
+
+
+if __name__ == "__main__":
+    with open('test_index_results.txt', 'w') as f:
+        main(f)
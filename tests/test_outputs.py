@@ -1,11 +1,20 @@
+import io
 import sys
 import unittest
+import contextlib
 import json
 import os
 import pandas as pd
 from pandas.util.testing import assert_frame_equal
+try:
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
 
 from findhelp.finder import go_search
+from findhelp.custom_utils import SearchResult
+from findhelp.custom_utils import convert_results
 from setup_files import setup_tests
 from tear_down import tear_down_tests
 
@@ -50,6 +59,13 @@ class BasicTests(unittest.TestCase):
 
         if os.path.exists("_test_result.txt"):
             os.remove("_test_result.txt")
+
+        if os.path.exists("_test_result.ndjson"):
+            os.remove("_test_result.ndjson")
+
+        for ext in ("parquet", "arrow"):
+            if os.path.exists(f"_test_result.{ext}"):
+                os.remove(f"_test_result.{ext}")
         tear_down_tests()
 
     def test_data_frame(self):
@@ -73,7 +89,7 @@ class BasicTests(unittest.TestCase):
                     './__search_tests_dummy_folder__/test2', 'test01', 'one.md', '.md']
             ],
             columns=self.HEADER_RESULT
-        )
+        ).astype({"type": "category", "folder_parent": "category", "folder_name": "category", "ext": "category"})
         result = go_search(base_dict)
 
         result = result.sort_values(
@@ -138,6 +154,102 @@ class BasicTests(unittest.TestCase):
 
         self.assertListEqual(sorted(result["results"], key=lambda x: join_key(
             x)), sorted(base_result, key=lambda x: join_key(x)))
+        self.assertFalse(result["truncated"])
+
+    def test_truncated(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "one",
+            "limit": 2
+        }
+        self.assertTrue(go_search(dict(base_dict, output="obj_list")).truncated)
+        self.assertTrue(go_search(dict(base_dict, output="df")).attrs["truncated"])
+
+        go_search(dict(base_dict, output="json", outputfilename="_test_result"))
+        with open("_test_result.json") as f:
+            result = json.load(f)
+        self.assertTrue(result["truncated"])
+        self.assertEqual(len(result["results"]), 2)
+
+    def test_exact_limit(self):
+        # 5 coincidences, limit 5: not truncated
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "one",
+            "limit": 5
+        }
+        self.assertFalse(go_search(dict(base_dict, output="obj_list")).truncated)
+        self.assertFalse(go_search(dict(base_dict, output="df")).attrs["truncated"])
+
+        go_search(dict(base_dict, output="json", outputfilename="_test_result"))
+        with open("_test_result.json") as f:
+            result = json.load(f)
+        self.assertFalse(result["truncated"])
+        self.assertEqual(len(result["results"]), 5)
+
+        go_search(dict(base_dict, output="ndjson", outputfilename="_test_result"))
+        with open("_test_result.ndjson") as f:
+            records = [json.loads(line) for line in f]
+        self.assertFalse(records[-1]["truncated"])
+
+        printed = io.StringIO()
+        with contextlib.redirect_stdout(printed):
+            self.assertEqual(go_search(dict(base_dict, output="console")), 5)
+        self.assertNotIn("limit of", printed.getvalue())
+
+    def test_ndjson(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "one",
+            "output": "ndjson",
+            "outputfilename": "_test_result"
+        }
+        self.assertEqual(go_search(dict(base_dict)), 5)
+        self.assertEqual(go_search(dict(base_dict, output="json")), 5)
+
+        with open("_test_result.ndjson") as f:
+            records = [json.loads(line) for line in f]
+        with open("_test_result.json") as f:
+            base_result = json.load(f)
+
+        self.assertListEqual(list(records[0].keys()), ["search_args", "start"])
+        self.assertListEqual(records[1:-1], base_result["results"])
+        self.assertEqual(records[-1]["count"], 5)
+        self.assertFalse(records[-1]["truncated"])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": "one",
+            "output": "parquet",
+            "outputfilename": "_test_result"
+        }
+        self.assertEqual(go_search(dict(base_dict)), 5)
+        base_result = go_search(dict(base_dict, output="obj_list"))
+
+        table = pyarrow.parquet.read_table("_test_result.parquet")
+        self.assertListEqual(table.column_names, self.HEADER_RESULT)
+        self.assertTrue(pyarrow.types.is_dictionary(table.schema.field("ext").type))
+        self.assertListEqual(table.to_pylist(), base_result)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_arrow(self):
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": ["one", "two"],
+            "output": "arrow",
+            "outputfilename": "_test_result",
+            "metadata": True
+        }
+        count = go_search(dict(base_dict))
+        base_result = go_search(dict(base_dict, output="obj_list"))
+        self.assertEqual(count, len(base_result))
+
+        with pyarrow.ipc.open_file("_test_result.arrow") as reader:
+            table = reader.read_all()
+        self.assertListEqual(table.column_names, self.HEADER_RESULT + ["size", "mtime", "patterns"])
+        self.assertListEqual(table.to_pylist(), base_result)
 
     def test_basic_txt(self):
         base_dict = {
@@ -194,7 +306,7 @@ class BasicTests(unittest.TestCase):
             ],
             columns=self.HEADER_RESULT
         )
-        go_search(base_dict)
+        self.assertEqual(go_search(base_dict), 5)
         result = pd.read_csv("_test_result.csv", sep="\t")
 
         result = result.sort_values(
@@ -256,6 +368,28 @@ class BasicTests(unittest.TestCase):
         self.assertListEqual(sorted(result, key=lambda x: join_key(
             x)), sorted(base_result, key=lambda x: join_key(x)))
 
+    def test_same_rows(self):
+        # every output shapes its rows the same way
+        results = [SearchResult("a\\b", "folder", "c"),
+                   SearchResult("a\\b", "file", "d.txt", ".txt", metadata=(1, 2.0)),
+                   SearchResult("a/e", "file", "f", None, patterns=["f"], metadata=(3, 4.0))]
+        for output_type, to_row in (("list", SearchResult.to_list), ("dict", SearchResult.to_dict)):
+            with self.subTest(output_type=output_type):
+                self.assertListEqual(list(convert_results(results, output_type, "/")),
+                                     [to_row(result, "/") for result in results])
+
+        base_dict = {
+            "path": "./__search_tests_dummy_folder__",
+            "stringsearch": ["one", "two"],
+            "metadata": True
+        }
+        rows = go_search(dict(base_dict, output="obj_list"))
+        df = go_search(dict(base_dict, output="df"))
+        self.assertListEqual(list(df.columns), list(rows[0]))
+        self.assertListEqual(go_search(dict(base_dict, output="list")), [list(row.values()) for row in rows])
+        self.assertListEqual(df.astype(object).where(df.notna(), None).values.tolist(),
+                             [list(row.values()) for row in rows])
+
 
 if __name__ == "__main__":
     with open('test_output_results.txt', 'w') as f:
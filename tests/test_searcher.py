@@ -0,0 +1,71 @@
+import sys
+import unittest
+
+from findhelp.finder import go_search
+from findhelp.finder import Searcher
+import findhelp.finder as fhp
+from setup_files import setup_tests
+from tear_down import tear_down_tests
+
+
+def main(out=sys.stderr, verbosity=2):
+    loader = unittest.TestLoader()
+
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+    unittest.TextTestRunner(out, verbosity=verbosity).run(suite)
+
+
+class SearcherTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        setup_tests()
+
+    @classmethod
+    def tearDownClass(cls):
+        # reset to default
+        fhp.set_ignore_folders()
+        tear_down_tests()
+
+    def setUp(self):
+        self.searcher = Searcher({"path": "./__search_tests_dummy_folder__", "output": "list"})
+
+    def tearDown(self):
+        self.searcher.close()
+
+    def test_same_as_go_search(self):
+        for base_dict in ({"stringsearch": "one"},
+                          {"stringsearch": ["one", "two"], "ignorecase": True},
+                          {"stringsearch": "t*/**/*.md", "glob": True}):
+            base_result = go_search(dict(base_dict, path="./__search_tests_dummy_folder__", output="list"))
+            self.assertListEqual(self.searcher.search(base_dict), base_result)
+            # second time, with the compiled matcher
+            self.assertListEqual(self.searcher.search(**base_dict), base_result)
+            self.assertListEqual(list(self.searcher.iter(base_dict)), base_result)
+
+    def test_set_ignore_folders(self):
+        base_result = self.searcher.search(stringsearch="one")
+
+        fhp.set_ignore_folders(["test2"])
+        result = self.searcher.search(stringsearch="one")
+        fhp.set_ignore_folders()
+
+        self.assertEqual(len(result), len(base_result) - 1)
+        self.assertFalse(any("test2" in line[0] for line in result))
+        self.assertListEqual(self.searcher.search(stringsearch="one"), base_result)
+
+    def test_processes(self):
+        base_dict = {
+            "path": ["./__search_tests_dummy_folder__/test", "./__search_tests_dummy_folder__/test2"],
+            "stringsearch": "one"
+        }
+        base_result = go_search(dict(base_dict, output="list"))
+
+        for _ in range(2):
+            self.assertListEqual(self.searcher.search(base_dict, processes=2), base_result)
+        self.assertListEqual(self.searcher.search(base_dict, processes=2, limit=1), base_result[:1])
+
+
+if __name__ == "__main__":
+    with open('test_searcher_results.txt', 'w') as f:
+        main(f)
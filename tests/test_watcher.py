@@ -0,0 +1,81 @@
+import os
+import sys
+import shutil
+import unittest
+
+from findhelp.finder import go_search
+from findhelp.finder import watch
+from findhelp.custom_exceptions import NotWatchedPathError
+from setup_files import setup_tests
+from tear_down import tear_down_tests
+
+
+def main(out=sys.stderr, verbosity=2):
+    loader = unittest.TestLoader()
+
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+    unittest.TextTestRunner(out, verbosity=verbosity).run(suite)
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "inotify is only available on Linux")
+class WatcherTests(unittest.TestCase):
+
+    def setUp(self):
+        setup_tests()
+        self.watcher = watch("./__search_tests_dummy_folder__")
+        # events are applied explicitly
+        self.watcher.stop()
+
+    def tearDown(self):
+        self.watcher.close()
+        tear_down_tests()
+
+    def assert_same_as_walk(self, base_dict, sort=False):
+        base_result = go_search(dict(base_dict))
+        result = go_search(dict(base_dict, watcher=self.watcher))
+        if sort:
+            base_result.sort()
+            result.sort()
+        self.assertListEqual(base_result, result)
+
+    def test_same_as_walk(self):
+        base_dicts = [
+            {"stringsearch": "OnE", "ignorecase": True},
+            {"stringsearch": "o[nñ][eéè].", "regexp": True},
+            {"ext": ["md", "json"]},
+            {"stringsearch": "2", "onlydirs": True},
+            {"stringsearch": "**/dir?/*.md", "glob": True},
+            {"path": "./__search_tests_dummy_folder__/test/", "stringsearch": "o"},
+        ]
+        for base_dict in base_dicts:
+            with self.subTest(base_dict=base_dict):
+                self.assert_same_as_walk(
+                    dict({"path": "./__search_tests_dummy_folder__", "output": "list"}, **base_dict))
+
+    def test_events(self):
+        root = "./__search_tests_dummy_folder__"
+        os.makedirs(f"{root}/new_one/deep")
+        with open(f"{root}/new_one/deep/new_file.txt", "w") as f:
+            pass
+        os.rename(f"{root}/test2", f"{root}/test3/moved")
+        shutil.rmtree(f"{root}/test")
+
+        self.assertGreater(self.watcher.process_events(), 0)
+        for stringsearch in ("new", "one", "test"):
+            with self.subTest(stringsearch=stringsearch):
+                self.assert_same_as_walk(
+                    {"path": root, "stringsearch": stringsearch, "output": "list"}, sort=True)
+
+    def test_not_watched(self):
+        with self.assertRaises(NotWatchedPathError):
+            base_dict = {
+                "path": ".",
+                "stringsearch": "one",
+                "watcher": self.watcher
+            }
+            go_search(base_dict)
+
+
+if __name__ == "__main__":
+    with open('test_watcher_results.txt', 'w') as f:
+        main(f)